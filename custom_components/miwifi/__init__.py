@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
+from typing import Final
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -11,23 +11,27 @@ from homeassistant.const import (
     CONF_PASSWORD,
     CONF_SCAN_INTERVAL,
     CONF_TIMEOUT,
-    EVENT_HOMEASSISTANT_STOP,
 )
-from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
-from homeassistant.exceptions import PlatformNotReady
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 
 from .const import (
     CONF_ACTIVITY_DAYS,
     CONF_ENCRYPTION_ALGORITHM,
+    CONF_EXTRACTORS,
     CONF_IS_FORCE_LOAD,
+    CONF_IS_TRACK_DEVICES,
+    CONF_POLL_BUDGET,
+    CONF_STAY_ONLINE,
     DEFAULT_ACTIVITY_DAYS,
-    DEFAULT_CALL_DELAY,
+    DEFAULT_POLL_BUDGET,
     DEFAULT_SCAN_INTERVAL,
-    DEFAULT_SLEEP,
+    DEFAULT_STAY_ONLINE,
     DEFAULT_TIMEOUT,
     DOMAIN,
+    FORWARDED_PLATFORMS,
     OPTION_IS_FROM_FLOW,
-    PLATFORMS,
+    PRESENCE,
+    RELOAD_OPTIONS,
     UPDATE_LISTENER,
     UPDATER,
 )
@@ -35,7 +39,19 @@ from .discovery import async_start_discovery
 from .enum import EncryptionAlgorithm
 from .helper import get_config_value, get_store
 from .services import SERVICES
-from .updater import LuciUpdater
+from .session import async_get_handover
+from .shutdown import async_get_shutdown
+from .startup import StartupOrchestrator, async_get_startup
+from .updater import LuciUpdater, async_get_integrations
+
+# Options that change the session or the entities of the entry
+RELOAD_ON: Final = {
+    CONF_IP_ADDRESS: None,
+    CONF_PASSWORD: None,
+    CONF_ENCRYPTION_ALGORITHM: EncryptionAlgorithm.SHA1,
+    CONF_IS_TRACK_DEVICES: True,
+    CONF_EXTRACTORS: "",
+}
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,64 +72,50 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.config_entries.async_update_entry(entry, data=entry.data, options={})
 
     _ip: str = get_config_value(entry, CONF_IP_ADDRESS)
+    _password: str = get_config_value(entry, CONF_PASSWORD)
+    _encryption: str = get_config_value(
+        entry, CONF_ENCRYPTION_ALGORITHM, EncryptionAlgorithm.SHA1
+    )
 
     _updater: LuciUpdater = LuciUpdater(
         hass,
         _ip,
-        get_config_value(entry, CONF_PASSWORD),
-        get_config_value(entry, CONF_ENCRYPTION_ALGORITHM, EncryptionAlgorithm.SHA1),
+        _password,
+        _encryption,
         get_config_value(entry, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
         get_config_value(entry, CONF_TIMEOUT, DEFAULT_TIMEOUT),
         get_config_value(entry, CONF_IS_FORCE_LOAD, False),
         get_config_value(entry, CONF_ACTIVITY_DAYS, DEFAULT_ACTIVITY_DAYS),
         get_store(hass, _ip),
         entry_id=entry.entry_id,
+        stay_online=get_config_value(entry, CONF_STAY_ONLINE, DEFAULT_STAY_ONLINE),
+        poll_budget=get_config_value(entry, CONF_POLL_BUDGET, DEFAULT_POLL_BUDGET),
     )
 
+    if verified := async_get_handover(hass).async_take(_ip, _password, _encryption):
+        _updater.adopt_session(verified)
+
     hass.data.setdefault(DOMAIN, {})
 
     hass.data[DOMAIN][entry.entry_id] = {
         CONF_IP_ADDRESS: _ip,
         UPDATER: _updater,
+        RELOAD_OPTIONS: _get_reload_options(entry),
     }
 
     hass.data[DOMAIN][entry.entry_id][UPDATE_LISTENER] = entry.add_update_listener(
         async_update_options
     )
 
-    async def async_start(with_sleep: bool = False) -> None:
-        """Async start.
-
-        :param with_sleep: bool
-        """
-
-        await _updater.async_config_entry_first_refresh()
-        if not _updater.last_update_success:
-            if _updater.last_exception is not None:
-                raise PlatformNotReady from _updater.last_exception
-
-            raise PlatformNotReady
-
-        if with_sleep:
-            await asyncio.sleep(DEFAULT_SLEEP)
-
-        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    startup: StartupOrchestrator = async_get_startup(hass)
 
     if is_new:
-        await async_start()
-        await asyncio.sleep(DEFAULT_SLEEP)
+        await startup.async_start(entry, _updater)
     else:
-        hass.loop.call_later(
-            DEFAULT_CALL_DELAY,
-            lambda: hass.async_create_task(async_start(True)),
-        )
+        # Do not block startup, routers are refreshed concurrently
+        hass.async_create_task(startup.async_start(entry, _updater))
 
-    async def async_stop(event: Event) -> None:
-        """Async stop"""
-
-        await _updater.async_stop()
-
-    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop)
+    async_get_shutdown(hass)
 
     for service_name, service in SERVICES:
         if not hass.services.has_service(DOMAIN, service_name):
@@ -134,7 +136,42 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     if entry.entry_id not in hass.data[DOMAIN]:
         return
 
-    await hass.config_entries.async_reload(entry.entry_id)
+    if _get_reload_options(entry) != hass.data[DOMAIN][entry.entry_id][RELOAD_OPTIONS]:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+        return
+
+    _updater: LuciUpdater = hass.data[DOMAIN][entry.entry_id][UPDATER]
+
+    # The running session is kept, the one verified by options flow is not needed
+    if verified := async_get_handover(hass).async_take(
+        _updater.ip,
+        get_config_value(entry, CONF_PASSWORD),
+        get_config_value(entry, CONF_ENCRYPTION_ALGORITHM, EncryptionAlgorithm.SHA1),
+    ):
+        await verified.async_stop()
+
+    _updater.async_reconfigure(
+        get_config_value(entry, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+        get_config_value(entry, CONF_TIMEOUT, DEFAULT_TIMEOUT),
+        get_config_value(entry, CONF_STAY_ONLINE, DEFAULT_STAY_ONLINE),
+        get_config_value(entry, CONF_ACTIVITY_DAYS, DEFAULT_ACTIVITY_DAYS),
+        get_config_value(entry, CONF_IS_FORCE_LOAD, False),
+        get_config_value(entry, CONF_POLL_BUDGET, DEFAULT_POLL_BUDGET),
+    )
+
+
+def _get_reload_options(entry: ConfigEntry) -> dict:
+    """Options that require reload of entry.
+
+    :param entry: ConfigEntry: Config Entry object
+    :return dict
+    """
+
+    return {
+        option: get_config_value(entry, option, default)
+        for option, default in RELOAD_ON.items()
+    }
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -145,7 +182,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     :return bool: Is success
     """
 
-    if is_unload := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+    if is_unload := await hass.config_entries.async_unload_platforms(
+        entry, hass.data[DOMAIN][entry.entry_id].get(FORWARDED_PLATFORMS, [])
+    ):
         _updater: LuciUpdater = hass.data[DOMAIN][entry.entry_id][UPDATER]
         await _updater.async_stop()
 
@@ -154,8 +193,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         ]
         _update_listener()
 
+        async_get_startup(hass).async_discard(_updater.ip)
+
         hass.data[DOMAIN].pop(entry.entry_id)
 
+        if not async_get_integrations(hass) and PRESENCE in hass.data[DOMAIN]:
+            hass.data[DOMAIN].pop(PRESENCE).async_stop()
+
     return is_unload
 
 
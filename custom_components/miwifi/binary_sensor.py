@@ -128,6 +128,9 @@ class MiWifiBinarySensor(MiWifiEntity, BinarySensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Update state."""
 
+        if not self._is_snapshot_changed():
+            return
+
         is_available: bool = (
             self._updater.data.get(ATTR_STATE, False)
             if self.entity_description.key != ATTR_STATE
@@ -17,6 +17,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import ATTR_BUTTON_REBOOT, ATTR_BUTTON_REBOOT_NAME, ATTR_STATE
 from .entity import MiWifiEntity
+from .enum import RouterState
 from .exceptions import LuciError
 from .updater import LuciUpdater, async_get_updater
 
@@ -82,6 +83,9 @@ class MiWifiButton(MiWifiEntity, ButtonEntity):
     def _handle_coordinator_update(self) -> None:
         """Update state."""
 
+        if not self._is_snapshot_changed():
+            return
+
         is_available: bool = self._updater.data.get(ATTR_STATE, False)
 
         if self._attr_available == is_available:  # type: ignore
@@ -99,6 +103,10 @@ class MiWifiButton(MiWifiEntity, ButtonEntity):
         except LuciError as _e:
             _LOGGER.debug("Reboot error: %r", _e)
 
+            return
+
+        self._updater.lifecycle.async_begin(RouterState.REBOOTING)
+
     async def async_press(self) -> None:
         """Async press action."""
 
@@ -0,0 +1,118 @@
+"""Router capabilities."""
+
+from __future__ import annotations
+
+from typing import Final
+
+from homeassistant.const import Platform
+
+from .const import (
+    ATTR_SELECT_WIFI_2_4_CHANNEL,
+    ATTR_SELECT_WIFI_2_4_SIGNAL_STRENGTH,
+    ATTR_SELECT_WIFI_5_0_CHANNEL,
+    ATTR_SELECT_WIFI_5_0_GAME_CHANNEL,
+    ATTR_SELECT_WIFI_5_0_GAME_SIGNAL_STRENGTH,
+    ATTR_SELECT_WIFI_5_0_SIGNAL_STRENGTH,
+    ATTR_SENSOR_DEVICES_5_0_GAME,
+    ATTR_SENSOR_WAN_DOWNLOAD_SPEED,
+    ATTR_SENSOR_WAN_UPLOAD_SPEED,
+    ATTR_SWITCH_WIFI_2_4,
+    ATTR_SWITCH_WIFI_5_0,
+    ATTR_SWITCH_WIFI_5_0_GAME,
+    ATTR_SWITCH_WIFI_GUEST,
+    ATTR_UPDATE_FIRMWARE,
+    PLATFORMS,
+)
+from .updater import LuciUpdater
+
+ADAPTER_KEYS: Final = {
+    ATTR_SWITCH_WIFI_2_4: ATTR_SWITCH_WIFI_2_4,
+    ATTR_SELECT_WIFI_2_4_CHANNEL: ATTR_SWITCH_WIFI_2_4,
+    ATTR_SELECT_WIFI_2_4_SIGNAL_STRENGTH: ATTR_SWITCH_WIFI_2_4,
+    ATTR_SWITCH_WIFI_5_0: ATTR_SWITCH_WIFI_5_0,
+    ATTR_SELECT_WIFI_5_0_CHANNEL: ATTR_SWITCH_WIFI_5_0,
+    ATTR_SELECT_WIFI_5_0_SIGNAL_STRENGTH: ATTR_SWITCH_WIFI_5_0,
+    ATTR_SWITCH_WIFI_5_0_GAME: ATTR_SWITCH_WIFI_5_0_GAME,
+    ATTR_SELECT_WIFI_5_0_GAME_CHANNEL: ATTR_SWITCH_WIFI_5_0_GAME,
+    ATTR_SELECT_WIFI_5_0_GAME_SIGNAL_STRENGTH: ATTR_SWITCH_WIFI_5_0_GAME,
+    ATTR_SENSOR_DEVICES_5_0_GAME: ATTR_SWITCH_WIFI_5_0_GAME,
+    ATTR_SWITCH_WIFI_GUEST: ATTR_SWITCH_WIFI_GUEST,
+}
+
+ONLY_WAN: Final = (
+    ATTR_SENSOR_WAN_DOWNLOAD_SPEED,
+    ATTR_SENSOR_WAN_UPLOAD_SPEED,
+)
+
+OPTIONAL_PLATFORMS: Final = {
+    Platform.SWITCH: (
+        ATTR_SWITCH_WIFI_2_4,
+        ATTR_SWITCH_WIFI_5_0,
+        ATTR_SWITCH_WIFI_5_0_GAME,
+        ATTR_SWITCH_WIFI_GUEST,
+    ),
+    Platform.SELECT: (
+        ATTR_SELECT_WIFI_2_4_CHANNEL,
+        ATTR_SELECT_WIFI_5_0_CHANNEL,
+        ATTR_SELECT_WIFI_5_0_GAME_CHANNEL,
+        ATTR_SELECT_WIFI_2_4_SIGNAL_STRENGTH,
+        ATTR_SELECT_WIFI_5_0_SIGNAL_STRENGTH,
+        ATTR_SELECT_WIFI_5_0_GAME_SIGNAL_STRENGTH,
+    ),
+    Platform.UPDATE: (ATTR_UPDATE_FIRMWARE,),
+}
+
+
+def is_supported(updater: LuciUpdater, key: str) -> bool:
+    """Is entity description relevant for router.
+
+    :param updater: LuciUpdater: Luci updater
+    :param key: str: Entity description key
+    :return bool
+    """
+
+    if key == ATTR_SWITCH_WIFI_GUEST and not updater.supports_guest:
+        return False
+
+    if key == ATTR_UPDATE_FIRMWARE:
+        return updater.supports_update
+
+    if key in ONLY_WAN:
+        return updater.supports_wan
+
+    if key in ADAPTER_KEYS:
+        return updater.data.get(ADAPTER_KEYS[key]) is not None
+
+    return True
+
+
+def get_capabilities(updater: LuciUpdater) -> frozenset[str]:
+    """Supported gated description keys.
+
+    WAN sensors follow the link state, the sensor platform adds them once
+    the link is up instead.
+
+    :param updater: LuciUpdater: Luci updater
+    :return frozenset[str]
+    """
+
+    return frozenset(
+        key
+        for key in (ATTR_UPDATE_FIRMWARE, *ADAPTER_KEYS)
+        if is_supported(updater, key)
+    )
+
+
+def get_platforms(updater: LuciUpdater) -> list[Platform]:
+    """Platforms relevant for router.
+
+    :param updater: LuciUpdater: Luci updater
+    :return list[Platform]
+    """
+
+    return [
+        platform
+        for platform in PLATFORMS
+        if platform not in OPTIONAL_PLATFORMS
+        or any(is_supported(updater, key) for key in OPTIONAL_PLATFORMS[platform])
+    ]
@@ -18,16 +18,20 @@ from homeassistant.const import (
 )
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from httpx import codes
 
 from .const import (
     CONF_ACTIVITY_DAYS,
     CONF_ENCRYPTION_ALGORITHM,
+    CONF_EXTRACTORS,
     CONF_IS_FORCE_LOAD,
     CONF_IS_TRACK_DEVICES,
+    CONF_POLL_BUDGET,
     CONF_STAY_ONLINE,
     DEFAULT_ACTIVITY_DAYS,
+    DEFAULT_POLL_BUDGET,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_STAY_ONLINE,
     DEFAULT_TIMEOUT,
@@ -36,6 +40,7 @@ from .const import (
 )
 from .discovery import async_start_discovery
 from .enum import EncryptionAlgorithm
+from .extractor import parse_extractors
 from .helper import async_user_documentation_url, async_verify_access, get_config_value
 from .updater import LuciUpdater, async_get_updater
 
@@ -266,6 +271,14 @@ class MiWifiOptionsFlow(config_entries.OptionsFlow):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            try:
+                parse_extractors(user_input.get(CONF_EXTRACTORS))
+            except ValueError as _e:
+                _LOGGER.debug("Invalid extractors: %r", _e)
+
+                errors[CONF_EXTRACTORS] = "extractors.invalid"
+
+        if user_input is not None and not errors:
             code: codes = await async_verify_access(
                 self.hass,
                 user_input[CONF_IP_ADDRESS],
@@ -372,6 +385,16 @@ class MiWifiOptionsFlow(config_entries.OptionsFlow):
                     self._config_entry, CONF_TIMEOUT, DEFAULT_TIMEOUT
                 ),
             ): vol.All(vol.Coerce(int), vol.Range(min=10)),
+            vol.Optional(
+                CONF_POLL_BUDGET,
+                default=get_config_value(
+                    self._config_entry, CONF_POLL_BUDGET, DEFAULT_POLL_BUDGET
+                ),
+            ): cv.positive_int,
+            vol.Optional(
+                CONF_EXTRACTORS,
+                default=get_config_value(self._config_entry, CONF_EXTRACTORS, ""),
+            ): TextSelector(TextSelectorConfig(multiline=True)),
         }
 
         with contextlib.suppress(ValueError):
@@ -38,27 +38,65 @@ UPDATE_LISTENER: Final = "update_listener"
 OPTION_IS_FROM_FLOW: Final = "is_from_flow"
 STORAGE_VERSION: Final = 1
 SIGNAL_NEW_DEVICE: Final = f"{DOMAIN}-device-new"
+PRESENCE: Final = "presence"
+STARTUP: Final = "startup"
+FORWARDED_PLATFORMS: Final = "forwarded_platforms"
+RELOAD_OPTIONS: Final = "reload_options"
+HANDOVER: Final = "handover"
+SHUTDOWN: Final = "shutdown"
+OWNERSHIP: Final = "ownership"
+GOVERNOR: Final = "governor"
 
 """Custom conf"""
 CONF_STAY_ONLINE: Final = "stay_online"
 CONF_IS_TRACK_DEVICES: Final = "is_track_devices"
 CONF_IS_FORCE_LOAD: Final = "is_force_load"
 CONF_ACTIVITY_DAYS: Final = "activity_days"
+CONF_EXTRACTORS: Final = "extractors"
+CONF_POLL_BUDGET: Final = "poll_budget"
 CONF_ENCRYPTION_ALGORITHM: Final = "encryption_algorithm"
 CONF_REQUEST: Final = "request"
 CONF_RESPONSE: Final = "response"
 CONF_URI: Final = "uri"
 CONF_BODY: Final = "body"
+CONF_MAX_AGE: Final = "max_age"
+CONF_SAMPLES: Final = "samples"
+CONF_CYCLES: Final = "cycles"
+CONF_POLLS: Final = "polls"
+CONF_REQUESTS: Final = "requests"
+CONF_RESPONSES: Final = "responses"
+CONF_FIELDS: Final = "fields"
 
 """Default settings"""
 DEFAULT_RETRY: Final = 10
+DEFAULT_RETRY_DELAY: Final = 1
+DEFAULT_RETRY_MAX_DELAY: Final = 30
 DEFAULT_SCAN_INTERVAL: Final = 30
 DEFAULT_TIMEOUT: Final = 20
 DEFAULT_CHECK_TIMEOUT: Final = 5
 DEFAULT_STAY_ONLINE: Final = 0
+DEFAULT_STAY_ONLINE_GRACE: Final = 5
 DEFAULT_ACTIVITY_DAYS: Final = 30
 DEFAULT_CALL_DELAY: Final = 1
-DEFAULT_SLEEP: Final = 3
+DEFAULT_WRITE_DEBOUNCE: Final = 0.5
+DEFAULT_REQUEST_SLOTS: Final = 1
+DEFAULT_MODEL_REQUEST_SLOTS: Final = 4
+DEFAULT_GLOBAL_REQUEST_SLOTS: Final = 8
+DEFAULT_CONFIRM_DELAY: Final = 3
+DEFAULT_PROBE_DELAY: Final = 2
+DEFAULT_PROBE_MAX_DELAY: Final = 30
+DEFAULT_REBOOT_WAIT: Final = 60
+DEFAULT_FLASH_WAIT: Final = 180
+DEFAULT_RECOVER_TIMEOUT: Final = 720
+DEFAULT_STARTUP_TIMEOUT: Final = 60
+DEFAULT_HANDOVER_TIMEOUT: Final = 60
+DEFAULT_SHUTDOWN_TIMEOUT: Final = 10
+DEFAULT_POLL_BUDGET: Final = 0
+DEFAULT_FLEET_LEAF_CADENCE: Final = 3
+DEFAULT_PROFILE_SAMPLES: Final = 5
+DEFAULT_PROFILE_CONCURRENCY: Final = 4
+DEFAULT_PROFILE_CYCLES: Final = 3
+DEFAULT_METRICS_SAMPLES: Final = 50
 DEFAULT_NAME: Final = "MiWifi router"
 DEFAULT_MANUFACTURER: Final = "Xiaomi"
 
@@ -74,13 +112,19 @@ CLIENT_PUBLIC_KEY: Final = "a2ffa5c9be07488bbb04a3a47d3c5f6a"
 """Services"""
 SERVICE_CALC_PASSWD: Final = "calc_passwd"
 SERVICE_REQUEST: Final = "request"
+SERVICE_PROFILE_ROUTER: Final = "profile_router"
+SERVICE_REQUEST_BATCH: Final = "request_batch"
+SERVICE_PROFILE: Final = "profile"
+SERVICE_MEMORY_REPORT: Final = "memory_report"
 
 """Events"""
 EVENT_LUCI: Final = f"{DOMAIN}_luci"
 EVENT_TYPE_RESPONSE: Final = "response"
+EVENT_TYPE_BATCH_RESPONSE: Final = "batch_response"
 
 TRIGGER_TYPES: Final = [
-    EVENT_TYPE_RESPONSE
+    EVENT_TYPE_RESPONSE,
+    EVENT_TYPE_BATCH_RESPONSE
 ]
 
 """Attributes"""
@@ -140,6 +184,33 @@ ATTR_SENSOR_MODE_NAME: Final = "Mode"
 ATTR_SENSOR_AP_SIGNAL: Final = "ap_signal"
 ATTR_SENSOR_AP_SIGNAL_NAME: Final = "AP signal"
 
+ATTR_SENSOR_POLL_DURATION: Final = "poll_duration"
+ATTR_SENSOR_POLL_DURATION_NAME: Final = "Poll duration"
+
+ATTR_SENSOR_LATENCY_P50: Final = "latency_p50"
+ATTR_SENSOR_LATENCY_P50_NAME: Final = "Latency p50"
+
+ATTR_SENSOR_LATENCY_P95: Final = "latency_p95"
+ATTR_SENSOR_LATENCY_P95_NAME: Final = "Latency p95"
+
+ATTR_SENSOR_REQUESTS_PER_MINUTE: Final = "requests_per_minute"
+ATTR_SENSOR_REQUESTS_PER_MINUTE_NAME: Final = "Requests per minute"
+
+ATTR_SENSOR_BYTES_RECEIVED: Final = "bytes_received"
+ATTR_SENSOR_BYTES_RECEIVED_NAME: Final = "Bytes received"
+
+ATTR_SENSOR_DECODE_TIME: Final = "decode_time"
+ATTR_SENSOR_DECODE_TIME_NAME: Final = "JSON decode time"
+
+ATTR_SENSOR_FAILURES: Final = "consecutive_failures"
+ATTR_SENSOR_FAILURES_NAME: Final = "Consecutive failures"
+
+ATTR_SENSOR_LOGINS: Final = "logins"
+ATTR_SENSOR_LOGINS_NAME: Final = "Logins"
+
+ATTR_SENSOR_TRACKED_DEVICES: Final = "tracked_devices"
+ATTR_SENSOR_TRACKED_DEVICES_NAME: Final = "Tracked devices"
+
 ATTR_SENSOR_WAN_DOWNLOAD_SPEED: Final = "wan_download_speed"
 ATTR_SENSOR_WAN_DOWNLOAD_SPEED_NAME: Final = "Wan download speed"
 
@@ -0,0 +1,200 @@
+"""CPU profile of update cycles."""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import os
+import pstats
+import time
+from datetime import datetime
+from typing import Final
+
+import homeassistant.components.persistent_notification as pn
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, NAME
+
+PROFILE_MODULES: Final = ("updater.py", "device_tracker.py", "helper.py")
+PROFILE_SUMMARY_ROWS: Final = 5
+PROFILE_LOOP_NOTE: Final = (
+    "Times are loop-wide: integration code of other routers running "
+    "during the profiled cycles is included."
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CpuProfile:
+    """CPU profile of the next update cycles of router.
+
+    An update cycle is the poll and the entity updates it triggered. The
+    profiler runs only while the poll or the entity updates run, it is
+    paused between them, so a poll without entity updates does not leave
+    it enabled. Nothing is instrumented while no profile is armed, and
+    only one profile is armed at a time.
+
+    The profiler covers the whole event loop between enable and disable,
+    so integration code of other routers running during the awaits of
+    the poll is counted too.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, ip: str, cycles: int  # pylint: disable=invalid-name
+    ) -> None:
+        """Initialize profile.
+
+        :param hass: HomeAssistant: Home Assistant object
+        :param ip: str: Router ip address
+        :param cycles: int: Update cycles to profile
+        """
+
+        self.hass = hass
+        self.ip = ip  # pylint: disable=invalid-name
+        self.cycles = cycles
+
+        self.durations: list[float] = []
+
+        self._profile: cProfile.Profile = cProfile.Profile()
+        self._start: float | None = None
+        self._elapsed: float | None = None
+
+    @property
+    def is_done(self) -> bool:
+        """Is all cycles profiled
+
+        :return bool
+        """
+
+        return len(self.durations) >= self.cycles
+
+    @callback
+    def enable(self) -> None:
+        """Start profiling of update cycle."""
+
+        self._elapsed = 0.0
+        self.resume()
+
+    @callback
+    def pause(self) -> None:
+        """Pause profiling of update cycle."""
+
+        if self._start is None or self._elapsed is None:
+            return
+
+        self._profile.disable()
+        self._elapsed += time.perf_counter() - self._start
+        self._start = None
+
+    @callback
+    def resume(self) -> None:
+        """Resume profiling of started update cycle."""
+
+        if self._start is not None or self._elapsed is None:
+            return
+
+        self._start = time.perf_counter()
+        self._profile.enable()
+
+    @callback
+    def disable(self) -> bool:
+        """Stop profiling of update cycle, the report follows the last one.
+
+        :return bool: Is all cycles profiled
+        """
+
+        self.pause()
+
+        if self._elapsed is None:
+            return False
+
+        self.durations.append(self._elapsed)
+        self._elapsed = None
+
+        if self.is_done:
+            self.hass.async_create_task(self.async_report())
+
+        return self.is_done
+
+    @callback
+    def cancel(self) -> None:
+        """Stop profiling without report."""
+
+        self._profile.disable()
+        self._start = None
+        self._elapsed = None
+
+    def rows(self) -> list[tuple[str, int, str, int, float, float]]:
+        """Functions of profiled modules by cumulative time.
+
+        :return list[tuple]: File, line, function, calls, own and cumulative time
+        """
+
+        stats: pstats.Stats = pstats.Stats(self._profile)
+
+        return sorted(
+            (
+                (os.path.basename(filename), line, function, calls, tottime, cumtime)
+                for (filename, line, function), (
+                    _,
+                    calls,
+                    tottime,
+                    cumtime,
+                    _,
+                ) in stats.stats.items()  # type: ignore
+                if os.path.basename(filename) in PROFILE_MODULES
+                and os.path.basename(os.path.dirname(filename)) == DOMAIN
+            ),
+            key=lambda row: row[-1],
+            reverse=True,
+        )
+
+    def write(self, path: str) -> list[tuple[str, int, str, int, float, float]]:
+        """Write sorted report.
+
+        :param path: str: Report path
+        :return list[tuple[str, int, str, int, float, float]]: Reported functions
+        """
+
+        rows: list[tuple[str, int, str, int, float, float]] = self.rows()
+
+        with open(path, "w", encoding="utf-8") as report:
+            report.write(
+                f"{NAME} CPU profile of {self.ip}: {len(self.durations)} update cycles "
+                f"in {sum(self.durations):.3f} s\n{PROFILE_LOOP_NOTE}\n\n"
+            )
+            report.write(f"{'cumtime':>10} {'tottime':>10} {'ncalls':>8}  function\n")
+
+            for filename, line, function, calls, tottime, cumtime in rows:
+                report.write(
+                    f"{cumtime:10.6f} {tottime:10.6f} {calls:8d}  "
+                    f"{filename}:{line}({function})\n"
+                )
+
+        return rows
+
+    async def async_report(self) -> None:
+        """Write report to config directory and notify with summary."""
+
+        path: str = self.hass.config.path(
+            f"{DOMAIN}_profile_{self.ip}_{datetime.now():%Y%m%d_%H%M%S}.txt"
+        )
+
+        rows: list[
+            tuple[str, int, str, int, float, float]
+        ] = await self.hass.async_add_executor_job(self.write, path)
+
+        _LOGGER.debug("CPU profile of %s written to %s", self.ip, path)
+
+        summary: str = "\n".join(
+            f"- {filename}:{line}({function}): {cumtime * 1000:.1f} ms"
+            for filename, line, function, _, _, cumtime in rows[:PROFILE_SUMMARY_ROWS]
+        )
+
+        pn.async_create(
+            self.hass,
+            f"CPU profile of {self.ip}: {len(self.durations)} update cycles "
+            f"in {sum(self.durations) * 1000:.1f} ms. {PROFILE_LOOP_NOTE}\n\n"
+            f"{summary}\n\nReport: {path}",
+            NAME,
+        )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import socket
-import time
+from collections.abc import Mapping
 from contextlib import closing
 from functools import cached_property
 from typing import Any, Final
@@ -12,7 +12,7 @@ from typing import Any, Final
 from homeassistant.components.device_tracker import ENTITY_ID_FORMAT, SOURCE_TYPE_ROUTER
 from homeassistant.components.device_tracker.config_entry import ScannerEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
@@ -42,9 +42,7 @@ from .const import (
     ATTR_TRACKER_UPDATER_ENTRY_ID,
     ATTRIBUTION,
     CONF_IS_TRACK_DEVICES,
-    CONF_STAY_ONLINE,
     DEFAULT_CALL_DELAY,
-    DEFAULT_STAY_ONLINE,
     DOMAIN,
     SIGNAL_NEW_DEVICE,
     UPDATER,
@@ -54,9 +52,9 @@ from .helper import (
     detect_manufacturer,
     generate_entity_id,
     get_config_value,
-    parse_last_activity,
     pretty_size,
 )
+from .presence import PresenceTimerWheel, async_get_presence
 from .updater import LuciUpdater, async_get_updater
 
 PARALLEL_UPDATES = 0
@@ -127,9 +125,6 @@ async def async_setup_entry(
                     entity_id,
                     new_device,
                     updater,
-                    get_config_value(
-                        config_entry, CONF_STAY_ONLINE, DEFAULT_STAY_ONLINE
-                    ),
                 )
             ]
         )
@@ -142,6 +137,17 @@ async def async_setup_entry(
     )
 
 
+@callback
+def _is_registry_update(event: Event) -> bool:
+    """Filter device registry updates.
+
+    :param event: Event: Device registry updated event
+    :return bool
+    """
+
+    return event.data.get("action") == "update"
+
+
 class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
     """MiWifi device tracker entry."""
 
@@ -151,13 +157,12 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
     _configuration_port: int | None = None
     _is_connected: bool = False
 
-    def __init__(  # pylint: disable=too-many-arguments
+    def __init__(
         self,
         unique_id: str,
         entity_id: str,
         device: dict,
         updater: LuciUpdater,
-        stay_online: int,
     ) -> None:
         """Initialize device_tracker.
 
@@ -165,18 +170,15 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
         :param entity_id: str: Entity ID
         :param device: dict: Device data
         :param updater: LuciUpdater: Luci updater object
-        :param stay_online: int: Stay online
         """
 
         CoordinatorEntity.__init__(self, coordinator=updater)
 
-        self._device: dict = dict(device)
+        self._device: Mapping[str, Any] = dict(device)
         self._updater: LuciUpdater = updater
 
         self._attr_name = device.get(ATTR_TRACKER_NAME, self.mac_address)
 
-        self._stay_online: int = stay_online
-
         self.entity_id = entity_id
         self._attr_unique_id = unique_id
         self._attr_available = updater.data.get(ATTR_STATE, False)
@@ -189,6 +191,28 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
 
         await CoordinatorEntity.async_added_to_hass(self)
 
+        presence: PresenceTimerWheel = async_get_presence(self.hass)
+
+        self.async_on_remove(
+            presence.async_register(
+                self.mac_address,
+                self._updater.presence_window,
+                self._async_presence_changed,
+            )
+        )
+
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                self._async_device_registry_updated,
+                _is_registry_update,
+            )
+        )
+
+        self._is_connected = self._attr_available and presence.is_connected(
+            self.mac_address
+        )
+
         self.hass.loop.call_later(
             DEFAULT_CALL_DELAY,
             lambda: self.hass.async_create_task(self.check_ports()),
@@ -300,6 +324,15 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
             ),
         }
 
+    @property
+    def device(self) -> Mapping[str, Any]:
+        """Device data of last update.
+
+        :return Mapping[str, Any]: Device data
+        """
+
+        return self._device
+
     @property
     def configuration_url(self) -> str | None:
         """Configuration url
@@ -367,7 +400,7 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
 
         is_available: bool = self._updater.data.get(ATTR_STATE, False)
 
-        device = self._updater.devices.get(self.mac_address, None)
+        device = self._updater.data.devices.get(self.mac_address, None)
 
         if device is None or self._device is None:
             if self._attr_available:  # type: ignore
@@ -377,17 +410,11 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
 
             return
 
-        device = self._update_entry(device)
-
-        before: int = parse_last_activity(
-            str(self._device.get(ATTR_TRACKER_LAST_ACTIVITY))
-        )
-        current: int = parse_last_activity(str(device.get(ATTR_TRACKER_LAST_ACTIVITY)))
-
-        is_connected = current > before
+        # Published devices keep their identity while their content is unchanged
+        if device is self._device and self._attr_available == is_available:
+            return
 
-        if before == current:
-            is_connected = (int(time.time()) - current) <= self._stay_online
+        device = self._update_entry(device)
 
         attr_changed: list = [
             attr
@@ -395,24 +422,48 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
             if self._device.get(attr, None) != device.get(attr, None)
         ]
 
-        if (
-            self._attr_available == is_available
-            and self._is_connected == is_connected
-            and not attr_changed
-        ):
+        self._device = device
+
+        if self._attr_available == is_available and not attr_changed:
             return
 
         self._attr_available = is_available
+
+        self.async_write_ha_state()
+
+    @callback
+    def _async_presence_changed(self, is_connected: bool) -> None:
+        """Presence changed.
+
+        :param is_connected: bool: Is connected
+        """
+
+        if self._is_connected == is_connected:
+            return
+
         self._is_connected = is_connected
-        self._device = dict(device)
 
         self.async_write_ha_state()
 
-    def _update_entry(self, track_device: dict) -> dict:
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        """Restore device entry changed outside of the integration.
+
+        :param event: Event: Device registry updated event
+        """
+
+        device: dr.DeviceEntry | None = dr.async_get(self.hass).async_get_device(
+            set(), {(dr.CONNECTION_NETWORK_MAC, self.mac_address)}
+        )
+
+        if device is not None and device.id == event.data["device_id"]:
+            self._device = self._update_entry(self._device)
+
+    def _update_entry(self, track_device: Mapping[str, Any]) -> Mapping[str, Any]:
         """Update device entry.
 
-        :param track_device: dict: Track device
-        :return dict
+        :param track_device: Mapping[str, Any]: Track device
+        :return Mapping[str, Any]
         """
 
         entry_id: str | None = track_device.get(ATTR_TRACKER_ENTRY_ID)
@@ -443,8 +494,9 @@ class MiWifiDeviceTracker(ScannerEntity, CoordinatorEntity):
             and self._updater != self.hass.data[DOMAIN][entry_id][UPDATER]
         ):
             self._updater = self.hass.data[DOMAIN][entry_id][UPDATER]
-            self._device[ATTR_TRACKER_ENTRY_ID] = entry_id
-            track_device = self._updater.devices.get(self.mac_address, track_device)
+            track_device = self._updater.data.devices.get(
+                self.mac_address, track_device
+            )
 
         return track_device
 
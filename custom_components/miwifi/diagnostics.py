@@ -15,6 +15,8 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 
+from .endpoint_profile import get_profile_store
+from .governor import async_get_governor
 from .updater import async_get_updater
 
 TO_REDACT: Final = {
@@ -46,7 +48,18 @@ async def async_get_config_entry_diagnostics(
         if hasattr(_updater, "devices"):
             _data["devices"] = _updater.devices
 
+        if _updater.endpoints:
+            _data["endpoints"] = {
+                method: health.as_dict()
+                for method, health in _updater.endpoints.items()
+            }
+
         if len(_updater.luci.diagnostics) > 0:
             _data["requests"] = async_redact_data(_updater.luci.diagnostics, TO_REDACT)
 
+        _data["queue"] = async_get_governor(hass).scheduler(_updater.ip).metrics
+
+        if profile := await get_profile_store(hass, _updater.ip).async_load():
+            _data["profile"] = profile
+
     return _data
@@ -22,6 +22,7 @@ from .const import (
     DOMAIN,
 )
 from .exceptions import LuciConnectionError, LuciError
+from .governor import RequestGovernor, async_get_governor
 from .luci import LuciClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,7 +48,10 @@ def async_start_discovery(hass: HomeAssistant) -> None:
         """
 
         async_trigger_discovery(
-            hass, await async_discover_devices(get_async_client(hass, False))
+            hass,
+            await async_discover_devices(
+                get_async_client(hass, False), async_get_governor(hass)
+            ),
         )
 
     # Do not block startup since discovery takes 31s or more
@@ -56,10 +60,13 @@ def async_start_discovery(hass: HomeAssistant) -> None:
     async_track_time_interval(hass, _async_discovery, DISCOVERY_INTERVAL)
 
 
-async def async_discover_devices(client: AsyncClient) -> list:
+async def async_discover_devices(
+    client: AsyncClient, governor: RequestGovernor | None = None
+) -> list:
     """Discover devices.
 
     :param client: AsyncClient: Async Client object
+    :param governor: RequestGovernor | None: Request governor
     :return list: List found IP
     """
 
@@ -67,7 +74,11 @@ async def async_discover_devices(client: AsyncClient) -> list:
 
     for address in [CLIENT_ADDRESS, CLIENT_ADDRESS_IP]:
         try:
-            response = await LuciClient(client, address).topo_graph()
+            response = await LuciClient(
+                client,
+                address,
+                scheduler=governor.scheduler(address) if governor else None,
+            ).topo_graph()
 
             break
         except LuciError:
@@ -82,11 +93,13 @@ async def async_discover_devices(client: AsyncClient) -> list:
 
     devices: list = []
 
-    if await async_check_ip_address(client, response["graph"]["ip"].strip()):
+    if await async_check_ip_address(client, response["graph"]["ip"].strip(), governor):
         devices.append(response["graph"]["ip"].strip())
 
     if "leafs" in response["graph"]:
-        devices = await async_prepare_leafs(client, devices, response["graph"]["leafs"])
+        devices = await async_prepare_leafs(
+            client, devices, response["graph"]["leafs"], governor
+        )
 
     _LOGGER.debug("Found devices: %s", devices)
 
@@ -114,12 +127,18 @@ def async_trigger_discovery(
         )
 
 
-async def async_prepare_leafs(client: AsyncClient, devices: list, leafs: list) -> list:
+async def async_prepare_leafs(
+    client: AsyncClient,
+    devices: list,
+    leafs: list,
+    governor: RequestGovernor | None = None,
+) -> list:
     """Recursive prepare leafs.
 
     :param client: AsyncClient: Async Client object
     :param devices: list: ip list
     :param leafs: list: leaf devices
+    :param governor: RequestGovernor | None: Request governor
     :return list
     """
 
@@ -132,25 +151,35 @@ async def async_prepare_leafs(client: AsyncClient, devices: list, leafs: list) -
         ):
             continue
 
-        if await async_check_ip_address(client, leaf["ip"].strip()):
+        if await async_check_ip_address(client, leaf["ip"].strip(), governor):
             devices.append(leaf["ip"].strip())
 
         if "leafs" in leaf and len(leaf["leafs"]) > 0:
-            devices = await async_prepare_leafs(client, devices, leaf["leafs"])
+            devices = await async_prepare_leafs(
+                client, devices, leaf["leafs"], governor
+            )
 
     return devices
 
 
-async def async_check_ip_address(client: AsyncClient, ip_address: str) -> bool:
+async def async_check_ip_address(
+    client: AsyncClient, ip_address: str, governor: RequestGovernor | None = None
+) -> bool:
     """Check ip address
 
     :param client: AsyncClient: Async Client object
     :param ip_address: str: IP address
+    :param governor: RequestGovernor | None: Request governor
     :return bool
     """
 
     try:
-        await LuciClient(client, ip_address, timeout=DEFAULT_CHECK_TIMEOUT).topo_graph()
+        await LuciClient(
+            client,
+            ip_address,
+            timeout=DEFAULT_CHECK_TIMEOUT,
+            scheduler=governor.scheduler(ip_address) if governor else None,
+        ).topo_graph()
     except LuciConnectionError:
         return False
     except LuciError:
@@ -0,0 +1,146 @@
+"""Latency profile of router endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Any, Final
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    ATTR_DEVICE_MODEL,
+    DEFAULT_PROFILE_CONCURRENCY,
+    DEFAULT_PROFILE_SAMPLES,
+    DIAGNOSTIC_DATE_TIME,
+    DOMAIN,
+    STORAGE_VERSION,
+)
+from .governor import async_get_governor
+from .metrics import percentile
+from .updater import LuciUpdater
+
+PROFILE_ENDPOINTS: Final = (
+    ("misystem/topo_graph", None, False),
+    ("xqsystem/init_info", None, True),
+    ("misystem/status", None, True),
+    ("misystem/newstatus", None, True),
+    ("xqnetwork/mode", None, True),
+    ("xqsystem/vpn_status", None, True),
+    ("xqsystem/check_rom_update", None, True),
+    ("xqnetwork/wan_info", None, True),
+    ("misystem/led", None, True),
+    ("xqnetwork/wifi_detail_all", None, True),
+    ("xqnetwork/wifi_diag_detail_all", None, True),
+    ("xqnetwork/avaliable_channels", {"wifiIndex": 1}, True),
+    ("xqnetwork/wifi_connect_devices", None, True),
+    ("misystem/devicelist", None, True),
+    ("xqnetwork/wifiap_signal", None, True),
+)
+
+PERCENTILES: Final = (50, 90, 99)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_profile_router(
+    updater: LuciUpdater,
+    samples: int = DEFAULT_PROFILE_SAMPLES,
+    concurrency: int = DEFAULT_PROFILE_CONCURRENCY,
+) -> dict[str, Any]:
+    """Profile read-only Luci endpoints of router.
+
+    Endpoints are sampled concurrently, at most concurrency requests
+    are sent to the router at once. Concurrency never exceeds the request
+    slots of the router model.
+
+    :param updater: LuciUpdater: Luci updater
+    :param samples: int: Samples per endpoint
+    :param concurrency: int: Requests sent at once
+    :return dict[str, Any]: Profile report
+    """
+
+    concurrency = min(
+        concurrency, async_get_governor(updater.hass).scheduler(updater.ip).slots
+    )
+
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+
+    async def _async_sample(path: str, query: dict | None, use_stok: bool) -> dict:
+        """Sample endpoint.
+
+        :param path: str: api method
+        :param query: dict | None: Data
+        :param use_stok: bool: is use stack
+        :return dict: Endpoint summary
+        """
+
+        results: list[dict] = []
+
+        for _ in range(samples):
+            async with semaphore:
+                results.append(await updater.luci.profile(path, query, use_stok))
+
+        return summarize(results)
+
+    summaries: list[dict] = await asyncio.gather(
+        *(_async_sample(*endpoint) for endpoint in PROFILE_ENDPOINTS)
+    )
+
+    _LOGGER.debug("Router %s profiled with %s samples", updater.ip, samples)
+
+    return {
+        DIAGNOSTIC_DATE_TIME: datetime.now().replace(microsecond=0).isoformat(),
+        ATTR_DEVICE_MODEL: updater.data.get(ATTR_DEVICE_MODEL),
+        "samples": samples,
+        "concurrency": concurrency,
+        "endpoints": {
+            endpoint[0]: summary
+            for endpoint, summary in zip(PROFILE_ENDPOINTS, summaries)
+        },
+    }
+
+
+def summarize(results: list[dict]) -> dict[str, Any]:
+    """Summarize endpoint samples.
+
+    :param results: list[dict]: Samples of LuciClient.profile
+    :return dict[str, Any]: Latency and decode percentiles in ms, size and errors
+    """
+
+    latencies: list[float] = sorted(result["latency"] * 1000 for result in results)
+    decodes: list[float] = sorted(result["decode"] * 1000 for result in results)
+
+    return {
+        "latency": {
+            "min": round(latencies[0], 2),
+            **{f"p{pct}": round(percentile(latencies, pct), 2) for pct in PERCENTILES},
+            "max": round(latencies[-1], 2),
+        },
+        "decode": {
+            f"p{pct}": round(percentile(decodes, pct), 2) for pct in PERCENTILES
+        },
+        "size": max(result["size"] for result in results),
+        "errors": dict(
+            Counter(result["error"] for result in results if result["error"])
+        ),
+    }
+
+
+def get_profile_store(
+    hass: HomeAssistant, ip: str  # pylint: disable=invalid-name
+) -> Store:
+    """Create profile Store
+
+    :param hass: HomeAssistant: Home Assistant object
+    :param ip: str: IP address
+    :return Store: Store object
+    """
+
+    return Store(
+        hass, STORAGE_VERSION, f"{DOMAIN}/{ip}_profile.json", encoder=JSONEncoder
+    )
@@ -48,6 +48,7 @@ class MiWifiEntity(CoordinatorEntity):
         self._attr_name = description.name
         self._attr_unique_id = unique_id
         self._attr_available = updater.data.get(ATTR_STATE, False)
+        self._snapshot_version: int = updater.data.version
 
         self._attr_device_info = updater.device_info
 
@@ -65,6 +66,19 @@ class MiWifiEntity(CoordinatorEntity):
 
         return self._attr_available and self.coordinator.last_update_success
 
+    def _is_snapshot_changed(self) -> bool:
+        """Remember the current snapshot version.
+
+        :return bool: Is a new snapshot published since the last check
+        """
+
+        if self._snapshot_version == self._updater.data.version:
+            return False
+
+        self._snapshot_version = self._updater.data.version
+
+        return True
+
     def _handle_coordinator_update(self) -> None:
         """Update state."""
 
@@ -171,6 +171,39 @@ class DeviceAction(IntEnum):
     ADD = 0, "Add"
     MOVE = 1, "Move"
     SKIP = 2, "Skip"
+    UPDATE = 3, "Update"
+    RESTORE = 4, "Restore"
+
+
+class RequestPriority(IntEnum):
+    """RequestPriority enum"""
+
+    def __new__(cls, value: int, phrase: str = "undefined") -> "RequestPriority":
+        """New request priority.
+
+        :param value: int: priority, lower is served first
+        :param phrase: str: phrase
+        :return RequestPriority
+        """
+
+        obj = int.__new__(cls, value)  # type: ignore
+        obj._value_ = value
+
+        obj.phrase = phrase  # type: ignore
+
+        return obj
+
+    def __str__(self) -> str:
+        """Serialize to string.
+
+        :return str
+        """
+
+        return str(self.value)
+
+    INTERACTIVE = 0, "Interactive"
+    PRESENCE = 1, "Presence"
+    BACKGROUND = 2, "Background"
 
 
 class EncryptionAlgorithm(StrEnum):
@@ -180,6 +213,15 @@ class EncryptionAlgorithm(StrEnum):
     SHA256 = "sha256"
 
 
+class RouterState(str, Enum):
+    """RouterState enum"""
+
+    ONLINE = "online"
+    REBOOTING = "rebooting"
+    FLASHING = "flashing"
+    RECOVERING = "recovering"
+
+
 class DeviceClass(StrEnum):
     """DeviceClass enum"""
 
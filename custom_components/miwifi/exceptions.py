@@ -11,3 +11,7 @@ class LuciConnectionError(LuciError):
 
 class LuciRequestError(LuciError):
     """Luci request error"""
+
+
+class LuciTokenError(LuciRequestError):
+    """Luci token error"""
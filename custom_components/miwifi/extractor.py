@@ -0,0 +1,109 @@
+"""Extractors of raw poll responses."""
+
+from __future__ import annotations
+
+from typing import Any, Final
+
+from homeassistant.util import slugify
+
+from .helper import compile_path, select_path
+
+EXTRACTOR_ENDPOINTS: Final = (
+    "xqsystem/init_info",
+    "misystem/status",
+    "misystem/newstatus",
+    "xqsystem/vpn_status",
+    "xqsystem/check_rom_update",
+    "xqnetwork/mode",
+    "xqnetwork/wan_info",
+    "misystem/led",
+    "xqnetwork/wifi_detail_all",
+    "xqnetwork/wifi_diag_detail_all",
+    "xqnetwork/wifi_connect_devices",
+    "misystem/devicelist",
+    "xqnetwork/wifiap_signal",
+)
+
+
+class Extractor:
+    """Value extracted from a raw poll response.
+
+    Extractors are defined one per line as "name = endpoint path [unit]",
+    for example "CPU load = misystem/status cpu.load %".
+    """
+
+    __slots__ = ("name", "uri", "path", "unit", "_keys")
+
+    def __init__(self, name: str, uri: str, path: str, unit: str | None = None):
+        """Initialize extractor.
+
+        :param name: str: Sensor name
+        :param uri: str: Polled api method
+        :param path: str: Path expression
+        :param unit: str | None: Unit of measurement
+        """
+
+        self.name: str = name
+        self.uri: str = uri
+        self.path: str = path
+        self.unit: str | None = unit
+
+        self._keys: tuple[str | int, ...] = compile_path(path)
+
+    @property
+    def key(self) -> str:
+        """Entity description key.
+
+        :return str
+        """
+
+        return f"extractor_{slugify(self.name)}"
+
+    def extract(self, response: dict | None) -> Any:
+        """Extract value.
+
+        :param response: dict | None: Raw poll response
+        :return Any: Extracted value or None
+        """
+
+        if response is None:
+            return None
+
+        return select_path(response, self._keys)
+
+
+def parse_extractors(definitions: str | None) -> list[Extractor]:
+    """Parse extractor definitions.
+
+    :param definitions: str | None: One definition per line
+    :return list[Extractor]
+    """
+
+    extractors: dict[str, Extractor] = {}
+
+    for line in (definitions or "").splitlines():
+        if not line.strip():
+            continue
+
+        name, separator, expression = line.partition("=")
+        parts: list[str] = expression.split(maxsplit=2)
+
+        if not separator or not name.strip() or len(parts) < 2:
+            raise ValueError(f"Invalid extractor: {line}")
+
+        if parts[0].strip("/") not in EXTRACTOR_ENDPOINTS:
+            raise ValueError(f"Endpoint {parts[0]} is not polled")
+
+        extractor: Extractor = Extractor(
+            name.strip(),
+            parts[0].strip("/"),
+            parts[1],
+            parts[2].strip() if len(parts) > 2 else None,
+        )
+
+        if extractor.key in extractors:
+            raise ValueError(f"Duplicate extractor: {extractor.name}")
+
+        extractors[extractor.key] = extractor
+
+    return list(extractors.values())
@@ -0,0 +1,134 @@
+"""Luci request governor."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Final
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DEFAULT_GLOBAL_REQUEST_SLOTS,
+    DEFAULT_MODEL_REQUEST_SLOTS,
+    DEFAULT_REQUEST_SLOTS,
+    DOMAIN,
+    GOVERNOR,
+)
+from .enum import Model
+from .scheduler import RequestScheduler
+
+# Slots, requests per second and burst. Routers of unknown model are
+# served one request at a time, known models in parallel.
+DEFAULT_REQUEST_LIMITS: Final = (DEFAULT_REQUEST_SLOTS, 0, 1)
+MODEL_DEFAULT_REQUEST_LIMITS: Final = (DEFAULT_MODEL_REQUEST_SLOTS, 0, 1)
+LEGACY_REQUEST_LIMITS: Final = (1, 2, 4)
+
+UNSUPPORTED: Final = {
+    "new_status": [
+        Model.R1D,
+        Model.R2D,
+        Model.R1CM,
+        Model.R1CL,
+        Model.R3P,
+        Model.R3D,
+        Model.R3L,
+        Model.R3A,
+        Model.R3,
+        Model.R3G,
+        Model.R4,
+        Model.R4A,
+        Model.R4AC,
+        Model.R4C,
+        Model.R4CM,
+        Model.D01,
+    ]
+}
+
+# Models without newstatus run legacy firmware that only tolerates light polling
+MODEL_REQUEST_LIMITS: Final = {
+    model: LEGACY_REQUEST_LIMITS for model in UNSUPPORTED["new_status"]
+}
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RequestGovernor:
+    """Request limits of all routers.
+
+    Every client of a router, including discovery and config flow, shares
+    the scheduler of its address. All schedulers share one limiter, so the
+    integration never has more than a fixed number of requests in flight.
+    """
+
+    def __init__(self, slots: int = DEFAULT_GLOBAL_REQUEST_SLOTS) -> None:
+        """Initialize governor.
+
+        :param slots: int: Number of requests sent to all routers at once
+        """
+
+        self.limiter: asyncio.Semaphore = asyncio.Semaphore(slots)
+
+        self.schedulers: dict[str, RequestScheduler] = {}
+
+    def scheduler(self, ip_address: str) -> RequestScheduler:
+        """Scheduler of router.
+
+        :param ip_address: str: Router ip address
+        :return RequestScheduler
+        """
+
+        ip_address = ip_address.removesuffix("/")
+
+        if ip_address not in self.schedulers:
+            self.schedulers[ip_address] = RequestScheduler(
+                *DEFAULT_REQUEST_LIMITS, limiter=self.limiter
+            )
+
+        return self.schedulers[ip_address]
+
+    def configure(self, ip_address: str, model: Model) -> None:
+        """Apply request limits of model.
+
+        :param ip_address: str: Router ip address
+        :param model: Model: Router model
+        """
+
+        limits: tuple = MODEL_REQUEST_LIMITS.get(
+            model,
+            DEFAULT_REQUEST_LIMITS
+            if model == Model.NOT_KNOWN
+            else MODEL_DEFAULT_REQUEST_LIMITS,
+        )
+
+        self.scheduler(ip_address).configure(*limits)
+
+        _LOGGER.debug("Router %s (%s) request limits: %s", ip_address, model, limits)
+
+    @property
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Queueing metrics of routers
+
+        :return dict[str, dict[str, Any]]
+        """
+
+        return {
+            ip_address: scheduler.metrics
+            for ip_address, scheduler in self.schedulers.items()
+        }
+
+
+@callback
+def async_get_governor(hass: HomeAssistant) -> RequestGovernor:
+    """Return shared request governor.
+
+    :param hass: HomeAssistant: Home Assistant object
+    :return RequestGovernor
+    """
+
+    data: dict = hass.data.setdefault(DOMAIN, {})
+
+    if GOVERNOR not in data:
+        data[GOVERNOR] = RequestGovernor()
+
+    return data[GOVERNOR]
@@ -0,0 +1,69 @@
+"""Endpoint health."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import utcnow
+
+from .exceptions import LuciError
+
+
+class EndpointHealth:
+    """Health of a prepare method across polls.
+
+    A failed method keeps its last good values in the updater data, its
+    health tells how old they are and how often the method failed since.
+    """
+
+    __slots__ = ("last_success", "last_error", "errors")
+
+    def __init__(self) -> None:
+        """Initialize health."""
+
+        self.last_success: datetime | None = None
+        self.last_error: str | None = None
+        self.errors: int = 0
+
+    def succeeded(self) -> None:
+        """Record success."""
+
+        self.last_success = utcnow()
+        self.errors = 0
+
+    def failed(self, error: LuciError) -> None:
+        """Record failure.
+
+        :param error: LuciError: Error of method
+        """
+
+        self.last_error = repr(error)
+        self.errors += 1
+
+    @property
+    def age(self) -> float | None:
+        """Age of last good values in seconds.
+
+        :return float | None
+        """
+
+        if self.last_success is None:
+            return None
+
+        return round((utcnow() - self.last_success).total_seconds(), 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Health as dict.
+
+        :return dict[str, Any]
+        """
+
+        return {
+            "last_success": self.last_success.isoformat()
+            if self.last_success
+            else None,
+            "age": self.age,
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
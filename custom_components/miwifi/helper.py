@@ -16,6 +16,7 @@ from homeassistant.util import slugify
 from httpx import codes
 
 from .const import DEFAULT_TIMEOUT, DOMAIN, MANUFACTURERS, STORAGE_VERSION
+from .session import async_get_handover
 from .updater import LuciUpdater
 
 
@@ -64,7 +65,11 @@ async def async_verify_access(
     )
 
     await updater.async_request_refresh()
-    await updater.async_stop()
+
+    if codes.is_success(updater.code):
+        async_get_handover(hass).async_put(updater, password, encryption)
+    else:
+        await updater.async_stop()
 
     return updater.code
 
@@ -158,3 +163,64 @@ def detect_manufacturer(mac: str) -> str | None:
     identifier: str = mac.replace(":", "").upper()[:6]
 
     return MANUFACTURERS[identifier] if identifier in MANUFACTURERS else None
+
+
+def project_response(data: Any, fields: list[str]) -> dict[str, Any]:
+    """Project response down to fields.
+
+    :param data: Any: Response
+    :param fields: list[str]: Field paths
+    :return dict[str, Any]: Value of every field path
+    """
+
+    return {field: select_path(data, compile_path(field)) for field in fields}
+
+
+def compile_path(path: str) -> tuple[str | int, ...]:
+    """Compile path expression.
+
+    Paths are dotted, "*" selects every item of a list or dict
+    and a number selects a list item, for example "list.*.mac".
+
+    :param path: str: Path expression
+    :return tuple[str | int, ...]: Path keys
+    """
+
+    return tuple(
+        int(key) if key.isdigit() else key for key in path.strip().split(".") if key
+    )
+
+
+def select_path(data: Any, keys: tuple[str | int, ...]) -> Any:
+    """Select compiled path in response.
+
+    :param data: Any: Response
+    :param keys: tuple[str | int, ...]: Path keys
+    :return Any: Selected value or None
+    """
+
+    if not keys:
+        return data
+
+    key, keys = keys[0], keys[1:]
+
+    if key == "*":
+        if isinstance(data, dict):
+            data = list(data.values())
+
+        return (
+            [select_path(item, keys) for item in data]
+            if isinstance(data, list)
+            else None
+        )
+
+    if isinstance(data, list):
+        if not isinstance(key, int) or key >= len(data):
+            return None
+
+        return select_path(data[key], keys)
+
+    if isinstance(data, dict) and str(key) in data:
+        return select_path(data[str(key)], keys)
+
+    return None
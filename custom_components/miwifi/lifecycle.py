@@ -0,0 +1,192 @@
+"""Router lifecycle."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Callable, Final
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DEFAULT_CHECK_TIMEOUT,
+    DEFAULT_FLASH_WAIT,
+    DEFAULT_PROBE_DELAY,
+    DEFAULT_PROBE_MAX_DELAY,
+    DEFAULT_REBOOT_WAIT,
+    DEFAULT_RECOVER_TIMEOUT,
+)
+from .enum import RouterState
+from .exceptions import LuciConnectionError, LuciError
+from .luci import LuciClient
+
+DOWN_WAIT: Final = {
+    RouterState.REBOOTING: DEFAULT_REBOOT_WAIT,
+    RouterState.FLASHING: DEFAULT_FLASH_WAIT,
+}
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RouterLifecycle:
+    """Router lifecycle state machine.
+
+    While the router reboots or flashes firmware, full polling is suspended
+    and the unauthenticated topo_graph endpoint is probed with backoff,
+    first until the router goes down and then until it answers again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        luci: LuciClient,
+        on_change: Callable[[RouterState], None] | None = None,
+    ) -> None:
+        """Initialize lifecycle.
+
+        :param hass: HomeAssistant: Home Assistant object
+        :param luci: LuciClient: Luci client
+        :param on_change: Callable[[RouterState], None] | None: State change callback
+        """
+
+        self.hass = hass
+        self.luci = luci
+        self.state: RouterState = RouterState.ONLINE
+
+        self._on_change = on_change
+        self._online: asyncio.Event = asyncio.Event()
+        self._online.set()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_online(self) -> bool:
+        """Is router online
+
+        :return bool
+        """
+
+        return self.state == RouterState.ONLINE
+
+    @callback
+    def async_begin(self, state: RouterState) -> None:
+        """Router started rebooting or flashing.
+
+        :param state: RouterState: Lifecycle state
+        """
+
+        if self._task is not None:
+            self._task.cancel()
+
+        self._set_state(state)
+
+        self._task = self.hass.async_create_task(self._async_probe(state))
+
+    async def async_wait_online(self, timeout: float | None = None) -> bool:
+        """Wait until router is back online.
+
+        :param timeout: float | None: Seconds to wait
+        :return bool: is online
+        """
+
+        if self._online.is_set():
+            return True
+
+        try:
+            await asyncio.wait_for(self._online.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        return True
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop probing."""
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        self.state = RouterState.ONLINE
+        self._online.set()
+
+    async def _async_probe(self, state: RouterState) -> None:
+        """Probe router until it is back.
+
+        :param state: RouterState: Lifecycle state
+        """
+
+        down_wait: int = DOWN_WAIT[state]
+        delay: float = DEFAULT_PROBE_DELAY
+        waited: float = 0
+
+        while waited < down_wait + DEFAULT_RECOVER_TIMEOUT:
+            await asyncio.sleep(delay)
+
+            waited += delay
+            delay = min(delay * 2, DEFAULT_PROBE_MAX_DELAY)
+
+            is_alive: bool = await self.async_is_alive()
+
+            if self.state == RouterState.RECOVERING:
+                if is_alive:
+                    break
+
+                continue
+
+            if not is_alive:
+                self._set_state(RouterState.RECOVERING)
+                delay = DEFAULT_PROBE_DELAY
+
+                continue
+
+            # Still answering, it may not have gone down yet
+            if waited >= down_wait:
+                break
+        else:
+            _LOGGER.warning(
+                "Router %s did not come back after %s, resume polling",
+                self.luci.ip,
+                state.value,
+            )
+
+        self._task = None
+        self._set_state(RouterState.ONLINE)
+
+    async def async_is_alive(self, timeout: int = DEFAULT_CHECK_TIMEOUT) -> bool:
+        """Liveness probe.
+
+        Any answer counts, only a failed connection means the router is down.
+
+        :param timeout: int: Probe timeout
+        :return bool
+        """
+
+        try:
+            await self.luci.topo_graph(timeout)
+        except LuciConnectionError:
+            return False
+        except LuciError:
+            pass
+
+        return True
+
+    def _set_state(self, state: RouterState) -> None:
+        """Set lifecycle state.
+
+        :param state: RouterState: Lifecycle state
+        """
+
+        if self.state == state:
+            return
+
+        _LOGGER.debug("Router %s is %s", self.luci.ip, state.value)
+
+        self.state = state
+
+        if state == RouterState.ONLINE:
+            self._online.set()
+        else:
+            self._online.clear()
+
+        if self._on_change is not None:
+            self._on_change(state)
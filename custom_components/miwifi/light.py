@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-import contextlib
 import logging
 from typing import Any, Final
 
@@ -93,6 +92,9 @@ class MiWifiLight(MiWifiEntity, LightEntity):
     def _handle_coordinator_update(self) -> None:
         """Update state."""
 
+        if not self._is_snapshot_changed():
+            return
+
         is_available: bool = self._updater.data.get(ATTR_STATE, False)
 
         is_on: bool = self._updater.data.get(self.entity_description.key, False)
@@ -110,14 +112,12 @@ class MiWifiLight(MiWifiEntity, LightEntity):
     async def _led_on(self) -> None:
         """Led on action"""
 
-        with contextlib.suppress(LuciError):
-            await self._updater.luci.led(1)
+        await self._updater.luci.led(1)
 
     async def _led_off(self) -> None:
         """Led off action"""
 
-        with contextlib.suppress(LuciError):
-            await self._updater.luci.led(0)
+        await self._updater.luci.led(0)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on action
@@ -148,11 +148,19 @@ class MiWifiLight(MiWifiEntity, LightEntity):
         """
 
         if action := getattr(self, method):
-            await action()
+            try:
+                await action()
+            except LuciError as _e:
+                _LOGGER.warning("Led update error: %r", _e)
+
+                self._updater.async_clear_overlay(self.entity_description.key, "led")
+
+                return
 
             is_on: bool = state == STATE_ON
 
-            self._updater.data[self.entity_description.key] = is_on
+            self._updater.async_set_overlay(self.entity_description.key, is_on)
+            self._updater.async_schedule_confirm("led")
             self._attr_is_on = is_on
             self._change_icon(is_on)
 
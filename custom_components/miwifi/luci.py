@@ -12,7 +12,7 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from httpx import AsyncClient, ConnectError, HTTPError, Response, TransportError
+from httpx import AsyncClient, ConnectError, HTTPError, Response, TransportError, codes
 
 from .const import (
     CLIENT_ADDRESS,
@@ -26,8 +26,10 @@ from .const import (
     DIAGNOSTIC_DATE_TIME,
     DIAGNOSTIC_MESSAGE,
 )
-from .enum import EncryptionAlgorithm
-from .exceptions import LuciConnectionError, LuciError, LuciRequestError
+from .enum import EncryptionAlgorithm, RequestPriority
+from .exceptions import LuciConnectionError, LuciError, LuciRequestError, LuciTokenError
+from .metrics import LuciMetrics
+from .scheduler import RequestScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,6 +55,8 @@ class LuciClient:
         password: str | None = None,
         encryption: str = EncryptionAlgorithm.SHA1,
         timeout: int = DEFAULT_TIMEOUT,
+        scheduler: RequestScheduler | None = None,
+        metrics: LuciMetrics | None = None,
     ) -> None:
         """Initialize API client.
 
@@ -61,6 +65,8 @@ class LuciClient:
         :param password: str: device password
         :param encryption: str: password encryption algorithm
         :param timeout: int: Query execution timeout
+        :param scheduler: RequestScheduler | None: Shared scheduler of router
+        :param metrics: LuciMetrics | None: Request metrics
         """
 
         ip = ip.removesuffix("/")
@@ -73,8 +79,36 @@ class LuciClient:
 
         self._url = CLIENT_URL.format(ip=ip)
 
+        self.scheduler: RequestScheduler = scheduler or RequestScheduler()
+        self.metrics: LuciMetrics = metrics or LuciMetrics()
+
         self.diagnostics: dict[str, Any] = {}
 
+    @property
+    def token(self) -> str | None:
+        """Session token
+
+        :return str | None
+        """
+
+        return self._token
+
+    def restore_token(self, token: str | None) -> None:
+        """Continue existing session.
+
+        :param token: str | None: Session token
+        """
+
+        self._token = token
+
+    def set_timeout(self, timeout: int) -> None:
+        """Change query execution timeout.
+
+        :param timeout: int: Query execution timeout
+        """
+
+        self._timeout = timeout
+
     async def login(self) -> dict:
         """Login method
 
@@ -95,7 +129,7 @@ class LuciClient:
         try:
             self._debug("Start request", _url, json.dumps(_request_data), _method, True)
 
-            async with self._client as client:
+            async with self.scheduler.async_slot(), self._client as client:
                 response: Response = await client.post(
                     _url,
                     data=_request_data,
@@ -116,6 +150,7 @@ class LuciClient:
             raise LuciRequestError("Failed to get token")
 
         self._token = _data["token"]
+        self.metrics.logins += 1
 
         return _data
 
@@ -129,7 +164,7 @@ class LuciClient:
         _url: str = f"{self._url}/;stok={self._token}/web/{_method}"
 
         try:
-            async with self._client as client:
+            async with self.scheduler.async_slot(), self._client as client:
                 response: Response = await client.get(_url, timeout=self._timeout)
 
                 self._debug("Successful request", _url, response.content, _method)
@@ -142,6 +177,8 @@ class LuciClient:
         query_params: dict | None = None,
         use_stok: bool = True,
         errors: dict[int, str] | None = None,
+        priority: RequestPriority = RequestPriority.BACKGROUND,
+        timeout: int | None = None,
     ) -> dict:
         """GET method.
 
@@ -149,11 +186,15 @@ class LuciClient:
         :param query_params: dict | None: Data
         :param use_stok: bool: is use stack
         :param errors: dict[int, str] | None: errors list
+        :param priority: RequestPriority: Request priority
+        :param timeout: int | None: Query execution timeout
         :return dict: dict with api data.
         """
 
         if use_stok and self._token is None:
-            raise LuciRequestError("Token not found")
+            raise LuciTokenError("Token not found")
+
+        _endpoint: str = path
 
         if query_params is not None and len(query_params) > 0:
             path += f"?{urllib.parse.urlencode(query_params, doseq=True)}"
@@ -162,12 +203,26 @@ class LuciClient:
         _url: str = f"{self._url}/{_stok}api/{path}"
 
         try:
-            async with self._client as client:
-                response: Response = await client.get(_url, timeout=self._timeout)
+            async with self.scheduler.async_slot(priority), self._client as client:
+                _start: float = time.perf_counter()
+
+                response: Response = await client.get(
+                    _url, timeout=timeout or self._timeout
+                )
+
+                _latency: float = time.perf_counter() - _start
 
             self._debug("Successful request", _url, response.content, path)
 
+            _start = time.perf_counter()
             _data: dict = json.loads(response.content)
+
+            self.metrics.record_request(
+                _endpoint,
+                _latency,
+                time.perf_counter() - _start,
+                len(response.content),
+            )
         except (
             HTTPError,
             ConnectError,
@@ -188,19 +243,84 @@ class LuciClient:
             if "code" in _data and errors is not None and _data["code"] in errors:
                 raise LuciError(errors[_data["code"]])
 
+            if _code == codes.UNAUTHORIZED:
+                raise LuciTokenError(_data.get("msg", "Invalid token"))
+
             raise LuciRequestError(
                 _data.get("msg", f"Invalid error code received: {_code}")
             )
 
         return _data
 
-    async def topo_graph(self) -> dict:
+    async def profile(
+        self, path: str, query_params: dict | None = None, use_stok: bool = True
+    ) -> dict:
+        """Timed GET request for profiling.
+
+        The request holds a scheduler slot, so router limits still apply.
+        Latency is measured once the slot is taken, so only the router
+        is measured.
+
+        :param path: str: api method
+        :param query_params: dict | None: Data
+        :param use_stok: bool: is use stack
+        :return dict: latency, payload size, decode time and error
+        """
+
+        if use_stok and self._token is None:
+            return {"latency": 0.0, "decode": 0.0, "size": 0, "error": "token"}
+
+        if query_params is not None and len(query_params) > 0:
+            path += f"?{urllib.parse.urlencode(query_params, doseq=True)}"
+
+        _stok: str = f";stok={self._token}/" if use_stok else ""
+        _url: str = f"{self._url}/{_stok}api/{path}"
+
+        async with self.scheduler.async_slot():
+            _start: float = time.perf_counter()
+
+            try:
+                async with self._client as client:
+                    response: Response = await client.get(_url, timeout=self._timeout)
+            except (HTTPError, ConnectError, TransportError) as _e:
+                return {
+                    "latency": time.perf_counter() - _start,
+                    "decode": 0.0,
+                    "size": 0,
+                    "error": type(_e).__name__,
+                }
+
+            _latency: float = time.perf_counter() - _start
+        _start = time.perf_counter()
+
+        _error: str | None = None
+
+        try:
+            _data: dict = json.loads(response.content)
+
+            if "code" not in _data or _data["code"] > 0:
+                _error = str(_data.get("code", -1))
+        except (ValueError, TypeError):
+            _error = "decode"
+
+        if response.status_code != 200:
+            _error = f"http_{response.status_code}"
+
+        return {
+            "latency": _latency,
+            "decode": time.perf_counter() - _start,
+            "size": len(response.content),
+            "error": _error,
+        }
+
+    async def topo_graph(self, timeout: int | None = None) -> dict:
         """misystem/topo_graph method.
 
+        :param timeout: int | None: Query execution timeout
         :return dict: dict with api data.
         """
 
-        return await self.get("misystem/topo_graph", use_stok=False)
+        return await self.get("misystem/topo_graph", use_stok=False, timeout=timeout)
 
     async def init_info(self) -> dict:
         """xqsystem/init_info method.
@@ -273,7 +393,9 @@ class LuciClient:
         :return dict: dict with api data.
         """
 
-        return await self.get("xqnetwork/set_wifi", data)
+        return await self.get(
+            "xqnetwork/set_wifi", data, priority=RequestPriority.INTERACTIVE
+        )
 
     async def set_guest_wifi(self, data: dict) -> dict:
         """xqnetwork/set_wifi_without_restart method.
@@ -282,7 +404,11 @@ class LuciClient:
         :return dict: dict with api data.
         """
 
-        return await self.get("xqnetwork/set_wifi_without_restart", data)
+        return await self.get(
+            "xqnetwork/set_wifi_without_restart",
+            data,
+            priority=RequestPriority.INTERACTIVE,
+        )
 
     async def avaliable_channels(self, index: int = 1) -> dict:
         """xqnetwork/avaliable_channels method.
@@ -307,7 +433,7 @@ class LuciClient:
         :return dict: dict with api data.
         """
 
-        return await self.get("xqsystem/reboot")
+        return await self.get("xqsystem/reboot", priority=RequestPriority.INTERACTIVE)
 
     async def led(self, state: int | None = None) -> dict:
         """misystem/led method.
@@ -320,7 +446,13 @@ class LuciClient:
         if state is not None:
             data["on"] = state
 
-        return await self.get("misystem/led", data)
+        return await self.get(
+            "misystem/led",
+            data,
+            priority=RequestPriority.BACKGROUND
+            if state is None
+            else RequestPriority.INTERACTIVE,
+        )
 
     async def device_list(self) -> dict:
         """misystem/devicelist method.
@@ -328,7 +460,7 @@ class LuciClient:
         :return dict: dict with api data.
         """
 
-        return await self.get("misystem/devicelist")
+        return await self.get("misystem/devicelist", priority=RequestPriority.PRESENCE)
 
     async def wifi_connect_devices(self) -> dict:
         """xqnetwork/wifi_connect_devices method.
@@ -336,7 +468,9 @@ class LuciClient:
         :return dict: dict with api data.
         """
 
-        return await self.get("xqnetwork/wifi_connect_devices")
+        return await self.get(
+            "xqnetwork/wifi_connect_devices", priority=RequestPriority.PRESENCE
+        )
 
     async def rom_update(self) -> dict:
         """xqsystem/check_rom_update method.
@@ -363,6 +497,7 @@ class LuciClient:
                 9: "Upgrade package verification failed",
                 10: "Failed to flash",
             },
+            priority=RequestPriority.INTERACTIVE,
         )
 
     async def flash_permission(self) -> dict:
@@ -371,7 +506,9 @@ class LuciClient:
         :return dict: dict with api data.
         """
 
-        return await self.get("xqsystem/flash_permission")
+        return await self.get(
+            "xqsystem/flash_permission", priority=RequestPriority.INTERACTIVE
+        )
 
     def sha(self, key: str) -> str:
         """Generate sha by key.
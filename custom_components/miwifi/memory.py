@@ -0,0 +1,213 @@
+"""Memory accounting."""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import tracemalloc
+from collections import deque
+from collections.abc import Mapping
+from typing import Any, Final
+
+import homeassistant.components.persistent_notification as pn
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_platform
+
+from .const import DOMAIN, MANUFACTURERS, NAME
+from .metrics import LuciMetrics
+
+MEMORY_TOP_LINES: Final = 10
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def retained_size(obj: Any) -> int:
+    """Approximate retained size of structure in bytes.
+
+    Containers are followed, every object is counted once. Objects shared
+    with other structures are counted in each of them.
+
+    :param obj: Any: Structure
+    :return int
+    """
+
+    seen: set[int] = set()
+    stack: list[Any] = [obj]
+    size: int = 0
+
+    while stack:
+        item: Any = stack.pop()
+
+        if id(item) in seen:
+            continue
+
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+
+        if isinstance(item, Mapping):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            stack.extend(item)
+
+    return size
+
+
+@callback
+def async_get_tracker_devices(
+    hass: HomeAssistant, entry_id: str
+) -> list[Mapping[str, Any]]:
+    """Device data kept by trackers of entry.
+
+    :param hass: HomeAssistant: Home Assistant object
+    :param entry_id: str: Entry ID
+    :return list[Mapping[str, Any]]
+    """
+
+    return [
+        entity.device
+        for platform in entity_platform.async_get_platforms(hass, DOMAIN)
+        if platform.domain == Platform.DEVICE_TRACKER
+        and platform.config_entry is not None
+        and platform.config_entry.entry_id == entry_id
+        for entity in platform.entities.values()
+    ]
+
+
+def memory_report(
+    structures: dict[str, Any], with_manufacturers: bool = True
+) -> dict[str, dict[str, int]]:
+    """Items and retained size per structure.
+
+    :param structures: dict[str, Any]: Structures by name
+    :param with_manufacturers: bool: Add shared manufacturers table
+    :return dict[str, dict[str, int]]
+    """
+
+    if with_manufacturers:
+        structures = structures | {"manufacturers": MANUFACTURERS}
+
+    return {
+        name: {"items": len(structure), "size": retained_size(structure)}
+        for name, structure in structures.items()
+    }
+
+
+class MemorySnapshot:
+    """Tracemalloc snapshot diff over the next polls of router.
+
+    Tracing runs only until the diff is taken, unless it was already
+    started outside of the integration.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        ip: str,  # pylint: disable=invalid-name
+        metrics: LuciMetrics,
+        polls: int,
+    ) -> None:
+        """Initialize snapshot.
+
+        :param hass: HomeAssistant: Home Assistant object
+        :param ip: str: Router ip address
+        :param metrics: LuciMetrics: Metrics of router
+        :param polls: int: Polls between snapshots
+        """
+
+        self.hass = hass
+        self.ip = ip  # pylint: disable=invalid-name
+        self.polls = polls
+
+        self._metrics: LuciMetrics = metrics
+        self._start: int = metrics.polls
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._is_owner: bool = False
+
+    @staticmethod
+    def take() -> tracemalloc.Snapshot:
+        """Take snapshot filtered to integration.
+
+        :return tracemalloc.Snapshot
+        """
+
+        return tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(True, os.path.join(os.path.dirname(__file__), "*")),)
+        )
+
+    async def async_start(self) -> None:
+        """Start tracing and take first snapshot."""
+
+        self._is_owner = not tracemalloc.is_tracing()
+
+        if self._is_owner:
+            tracemalloc.start()
+
+        self._start = self._metrics.polls
+        self._snapshot = await self.hass.async_add_executor_job(self.take)
+
+    @callback
+    def update(self) -> bool:
+        """Count finished polls, the diff follows the last one.
+
+        :return bool: Is all polls done
+        """
+
+        if self._snapshot is None or self._metrics.polls - self._start < self.polls:
+            return False
+
+        self.hass.async_create_task(self.async_report(self._snapshot))
+        self._snapshot = None
+
+        return True
+
+    @callback
+    def cancel(self) -> None:
+        """Stop tracing without report."""
+
+        self._snapshot = None
+
+        if self._is_owner and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def diff(self, snapshot: tracemalloc.Snapshot) -> list[tracemalloc.StatisticDiff]:
+        """Take second snapshot and compare.
+
+        :param snapshot: tracemalloc.Snapshot: First snapshot
+        :return list[tracemalloc.StatisticDiff]: Largest growth first
+        """
+
+        current: tracemalloc.Snapshot = self.take()
+
+        if self._is_owner:
+            tracemalloc.stop()
+
+        return current.compare_to(snapshot, "lineno")[:MEMORY_TOP_LINES]
+
+    async def async_report(self, snapshot: tracemalloc.Snapshot) -> None:
+        """Notify with snapshot diff.
+
+        :param snapshot: tracemalloc.Snapshot: First snapshot
+        """
+
+        stats: list[tracemalloc.StatisticDiff] = await self.hass.async_add_executor_job(
+            self.diff, snapshot
+        )
+
+        _LOGGER.debug("Memory snapshot diff of %s: %s", self.ip, stats)
+
+        lines: str = "\n".join(
+            f"- {os.path.basename(stat.traceback[0].filename)}:"
+            f"{stat.traceback[0].lineno}: {stat.size_diff / 1024:+.1f} KiB "
+            f"({stat.count_diff:+d} blocks)"
+            for stat in stats
+        )
+
+        pn.async_create(
+            self.hass,
+            f"Memory growth of {self.ip} over {self.polls} polls:\n\n{lines}",
+            NAME,
+            f"{DOMAIN}_memory_diff_{self.ip}",
+        )
@@ -0,0 +1,184 @@
+"""Luci request metrics."""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from typing import Any
+
+from .const import (
+    ATTR_SENSOR_BYTES_RECEIVED,
+    ATTR_SENSOR_DECODE_TIME,
+    ATTR_SENSOR_FAILURES,
+    ATTR_SENSOR_LATENCY_P50,
+    ATTR_SENSOR_LATENCY_P95,
+    ATTR_SENSOR_LOGINS,
+    ATTR_SENSOR_POLL_DURATION,
+    ATTR_SENSOR_REQUESTS_PER_MINUTE,
+    ATTR_SENSOR_TRACKED_DEVICES,
+    DEFAULT_METRICS_SAMPLES,
+)
+
+
+class LuciMetrics:
+    """Timings of a router.
+
+    Requests keep a bounded window of samples per endpoint, so recording
+    costs a few appends per request and percentiles are computed only
+    when a sensor reads them.
+    """
+
+    def __init__(self, samples: int = DEFAULT_METRICS_SAMPLES) -> None:
+        """Initialize metrics.
+
+        :param samples: int: Samples kept per endpoint
+        """
+
+        self.logins: int = 0
+        self.bytes_received: int = 0
+        self.poll_duration: float | None = None
+        self.failures: int = 0
+        self.devices: int = 0
+        self.polls: int = 0
+
+        self._samples: int = samples
+        self._latencies: dict[str, deque[float]] = {}
+        self._decodes: deque[float] = deque(maxlen=samples)
+        self._requests: deque[float] = deque()
+
+    def record_request(
+        self, endpoint: str, latency: float, decode: float, size: int
+    ) -> None:
+        """Record completed request.
+
+        :param endpoint: str: api method
+        :param latency: float: Seconds until response
+        :param decode: float: Seconds to decode JSON
+        :param size: int: Response size in bytes
+        """
+
+        if endpoint not in self._latencies:
+            self._latencies[endpoint] = deque(maxlen=self._samples)
+
+        self._latencies[endpoint].append(latency)
+        self._decodes.append(decode)
+        self.bytes_received += size
+
+        now: float = time.monotonic()
+
+        self._requests.append(now)
+        self._expire(now)
+
+    def record_poll(self, duration: float, is_success: bool, devices: int) -> None:
+        """Record finished poll.
+
+        :param duration: float: Seconds of poll
+        :param is_success: bool: Router is available after poll
+        :param devices: int: Tracked devices
+        """
+
+        self.polls += 1
+        self.poll_duration = duration
+        self.failures = 0 if is_success else self.failures + 1
+        self.devices = devices
+
+    @property
+    def requests_per_minute(self) -> int:
+        """Requests completed within the last minute
+
+        :return int
+        """
+
+        self._expire(time.monotonic())
+
+        return len(self._requests)
+
+    def latency(self, pct: int) -> float | None:
+        """Latency percentile of all endpoints in ms.
+
+        :param pct: int: Percentile
+        :return float | None
+        """
+
+        latencies: list[float] = sorted(
+            latency for samples in self._latencies.values() for latency in samples
+        )
+
+        return round(percentile(latencies, pct) * 1000, 1) if latencies else None
+
+    def endpoint_latency(self, pct: int) -> dict[str, float]:
+        """Latency percentile per endpoint in ms.
+
+        :param pct: int: Percentile
+        :return dict[str, float]
+        """
+
+        return {
+            endpoint: round(percentile(sorted(samples), pct) * 1000, 1)
+            for endpoint, samples in sorted(self._latencies.items())
+        }
+
+    def value(self, key: str) -> Any:
+        """Value of metric sensor.
+
+        :param key: str: Sensor key
+        :return Any
+        """
+
+        if key == ATTR_SENSOR_POLL_DURATION:
+            return (
+                round(self.poll_duration * 1000, 1)
+                if self.poll_duration is not None
+                else None
+            )
+
+        if key in (ATTR_SENSOR_LATENCY_P50, ATTR_SENSOR_LATENCY_P95):
+            return self.latency(50 if key == ATTR_SENSOR_LATENCY_P50 else 95)
+
+        if key == ATTR_SENSOR_DECODE_TIME:
+            return (
+                round(sum(self._decodes) / len(self._decodes) * 1000, 2)
+                if self._decodes
+                else None
+            )
+
+        return {
+            ATTR_SENSOR_REQUESTS_PER_MINUTE: self.requests_per_minute,
+            ATTR_SENSOR_BYTES_RECEIVED: self.bytes_received,
+            ATTR_SENSOR_FAILURES: self.failures,
+            ATTR_SENSOR_LOGINS: self.logins,
+            ATTR_SENSOR_TRACKED_DEVICES: self.devices,
+        }.get(key)
+
+    def attributes(self, key: str) -> dict[str, Any] | None:
+        """Attributes of metric sensor.
+
+        :param key: str: Sensor key
+        :return dict[str, Any] | None
+        """
+
+        if key in (ATTR_SENSOR_LATENCY_P50, ATTR_SENSOR_LATENCY_P95):
+            return self.endpoint_latency(50 if key == ATTR_SENSOR_LATENCY_P50 else 95)
+
+        return None
+
+    def _expire(self, now: float) -> None:
+        """Drop requests older than a minute.
+
+        :param now: float: Monotonic time
+        """
+
+        while self._requests and now - self._requests[0] > 60:
+            self._requests.popleft()
+
+
+def percentile(values: list[float], pct: int) -> float:
+    """Nearest rank percentile.
+
+    :param values: list[float]: Sorted values
+    :param pct: int: Percentile
+    :return float
+    """
+
+    return values[max(math.ceil(pct / 100 * len(values)) - 1, 0)]
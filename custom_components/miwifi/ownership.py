@@ -0,0 +1,157 @@
+"""Device ownership across routers."""
+
+from __future__ import annotations
+
+import ipaddress
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import ATTR_TRACKER_MAC, DOMAIN, OWNERSHIP
+from .enum import DeviceAction
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _address_key(address: str) -> tuple[int, int, int, str]:
+    """Sort key of router address.
+
+    IP addresses are ordered numerically, hostnames follow by name.
+
+    :param address: str: IP address or hostname
+    :return tuple[int, int, int, str]
+    """
+
+    try:
+        _ip: ipaddress.IPv4Address | ipaddress.IPv6Address = ipaddress.ip_address(
+            address
+        )
+    except ValueError:
+        return 1, 0, 0, address
+
+    return 0, _ip.version, int(_ip), address
+
+
+class DeviceOwnership:
+    """Owner router of every client of the fleet.
+
+    Main routers claim each client of their device list for the router it
+    is attached to. A client claimed by several main routers is owned by
+    the claim of the lowest router address, routers set up by hostname
+    come last. Ownership does not depend on the order in which routers poll.
+
+    Claims are reconciled whenever a main router reports its device list,
+    routers poll on their own schedules and there is no fleet-wide cycle.
+    Devices reported for another router are queued here, the reporting
+    router then asks the owner to take them over and the owner applies
+    them to its own device list.
+    """
+
+    def __init__(self) -> None:
+        """Initialize ownership."""
+
+        self.owners: dict[str, str] = {}
+
+        self._claims: dict[str, dict[str, str]] = {}
+        self._handovers: dict[str, dict[str, tuple[dict, DeviceAction]]] = {}
+
+    @callback
+    def async_reconcile(self, reporter: str, claims: dict[str, str]) -> dict[str, str]:
+        """Replace claims of main router and reconcile owners.
+
+        :param reporter: str: IP address of main router
+        :param claims: dict[str, str]: Owner IP address by client MAC address
+        :return dict[str, str]: Changed owners by client MAC address
+        """
+
+        previous: dict[str, str] = self._claims.pop(reporter, {})
+
+        if claims:
+            self._claims[reporter] = claims
+
+        reporters: list[str] = sorted(self._claims, key=_address_key)
+        changes: dict[str, str] = {}
+
+        for mac in previous.keys() | claims.keys():
+            owner: str | None = next(
+                (
+                    self._claims[_ip][mac]
+                    for _ip in reporters
+                    if mac in self._claims[_ip]
+                ),
+                None,
+            )
+
+            if owner == self.owners.get(mac):
+                continue
+
+            if owner is None:
+                del self.owners[mac]
+            else:
+                self.owners[mac] = owner
+                changes[mac] = owner
+
+        if changes:
+            _LOGGER.debug("Router %s changed device owners: %s", reporter, changes)
+
+        return changes
+
+    @callback
+    def async_release(self, reporter: str) -> None:
+        """Drop claims of removed main router.
+
+        :param reporter: str: IP address of main router
+        """
+
+        self.async_reconcile(reporter, {})
+        self._handovers.pop(reporter, None)
+
+    @callback
+    def async_hand_over(self, owner: str, device: dict, action: DeviceAction) -> None:
+        """Hand over device to owner router.
+
+        :param owner: str: Owner IP address
+        :param device: dict: Device data
+        :param action: DeviceAction: Device action
+        """
+
+        self._handovers.setdefault(owner, {})[device[ATTR_TRACKER_MAC]] = (
+            device,
+            action,
+        )
+
+    @callback
+    def async_take(self, owner: str) -> dict[str, tuple[dict, DeviceAction]]:
+        """Take devices handed over to owner router.
+
+        :param owner: str: Owner IP address
+        :return dict[str, tuple[dict, DeviceAction]]: Devices by client MAC address
+        """
+
+        return self._handovers.pop(owner, {})
+
+    def is_owner(self, mac: str, owner: str) -> bool:
+        """Is router owner of client.
+
+        :param mac: str: Client MAC address
+        :param owner: str: Router IP address
+        :return bool
+        """
+
+        return self.owners.get(mac, owner) == owner
+
+
+@callback
+def async_get_ownership(hass: HomeAssistant) -> DeviceOwnership:
+    """Return shared device ownership.
+
+    :param hass: HomeAssistant: Home Assistant object
+    :return DeviceOwnership
+    """
+
+    data: dict = hass.data.setdefault(DOMAIN, {})
+
+    if OWNERSHIP not in data:
+        data[OWNERSHIP] = DeviceOwnership()
+
+    return data[OWNERSHIP]
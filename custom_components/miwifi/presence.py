@@ -0,0 +1,252 @@
+"""Presence timer wheel."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from asyncio import TimerHandle
+from typing import Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DEFAULT_SCAN_INTERVAL, DEFAULT_STAY_ONLINE_GRACE, DOMAIN, PRESENCE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PresenceTimerWheel:
+    """Shared stay online timers for all tracked devices.
+
+    Every tracked device owns exactly one expiry deadline. Seeing a device
+    pushes its deadline forward, and a single loop timer armed on the
+    earliest deadline marks the device as disconnected once it lapses.
+    Last seen times are forgotten once they lapse, a coarse sweep does
+    it for devices without a tracker.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize timer wheel.
+
+        :param hass: HomeAssistant: Home Assistant object
+        """
+
+        self.hass = hass
+
+        self._windows: dict[str, float] = {}
+        self._listeners: dict[str, Callable[[bool], None]] = {}
+        self._deadlines: dict[str, float] = {}
+        self._last_seen: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+        self._handle: TimerHandle | None = None
+        self._handle_when: float = 0.0
+        self._sweep: TimerHandle | None = None
+        self._retention: float = DEFAULT_SCAN_INTERVAL + DEFAULT_STAY_ONLINE_GRACE
+
+    @callback
+    def async_register(
+        self,
+        mac: str,
+        window: float,
+        listener: Callable[[bool], None],
+    ) -> CALLBACK_TYPE:
+        """Register device.
+
+        A device that was seen within the window starts connected,
+        restored devices stay disconnected until the router reports them.
+
+        :param mac: str: Mac address
+        :param window: float: Seconds a device stays online after it was last seen
+        :param listener: Callable[[bool], None]: Called on connect and disconnect
+        :return CALLBACK_TYPE: Unregister callback
+        """
+
+        self._windows[mac] = window
+        self._listeners[mac] = listener
+        self._retention = max(self._retention, window)
+
+        if (
+            mac in self._last_seen
+            and self._last_seen[mac] + window > self.hass.loop.time()
+        ):
+            self._async_schedule(mac, self._last_seen[mac])
+
+        @callback
+        def async_unregister() -> None:
+            """Unregister device."""
+
+            if self._listeners.get(mac) is not listener:
+                return
+
+            del self._listeners[mac]
+            self._windows.pop(mac, None)
+            self._deadlines.pop(mac, None)
+            self._async_arm_sweep()
+
+        return async_unregister
+
+    @callback
+    def async_set_window(self, mac: str, window: float) -> None:
+        """Change stay online window of registered device.
+
+        :param mac: str: Mac address
+        :param window: float: Seconds a device stays online after it was last seen
+        """
+
+        if mac not in self._listeners or self._windows.get(mac) == window:
+            return
+
+        self._windows[mac] = window
+        self._retention = max(self._retention, window)
+
+        if mac in self._deadlines:
+            self._async_schedule(mac, self._last_seen[mac])
+
+    def is_connected(self, mac: str) -> bool:
+        """Is device connected
+
+        :param mac: str: Mac address
+        :return bool
+        """
+
+        return mac in self._deadlines
+
+    @callback
+    def async_seen(self, mac: str) -> None:
+        """Device was seen by router.
+
+        :param mac: str: Mac address
+        """
+
+        now: float = self.hass.loop.time()
+
+        self._last_seen[mac] = now
+
+        if mac not in self._listeners:
+            self._async_arm_sweep()
+
+            return
+
+        is_new: bool = mac not in self._deadlines
+
+        self._async_schedule(mac, now)
+
+        if is_new:
+            self._listeners[mac](True)
+
+    @callback
+    def async_forget(self, mac: str) -> None:
+        """Forget device.
+
+        :param mac: str: Mac address
+        """
+
+        self._last_seen.pop(mac, None)
+        self._deadlines.pop(mac, None)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop timer wheel."""
+
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        if self._sweep is not None:
+            self._sweep.cancel()
+            self._sweep = None
+
+        self._heap.clear()
+        self._deadlines.clear()
+        self._last_seen.clear()
+
+    def _async_schedule(self, mac: str, seen: float) -> None:
+        """Schedule device expiry.
+
+        :param mac: str: Mac address
+        :param seen: float: Loop time when the device was seen
+        """
+
+        deadline: float = seen + self._windows[mac]
+
+        self._deadlines[mac] = deadline
+        heapq.heappush(self._heap, (deadline, mac))
+
+        if self._handle is None or deadline < self._handle.when():
+            self._async_arm()
+
+    def _async_arm(self) -> None:
+        """Arm loop timer on the earliest deadline."""
+
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        if self._heap:
+            self._handle_when = self._heap[0][0]
+            self._handle = self.hass.loop.call_at(self._handle_when, self._async_fire)
+
+    @callback
+    def _async_fire(self) -> None:
+        """Expire lapsed devices."""
+
+        self._handle = None
+
+        # The loop may wake us marginally early, the armed deadline is lapsed anyway
+        now: float = max(self.hass.loop.time(), self._handle_when)
+
+        while self._heap and self._heap[0][0] <= now:
+            deadline, mac = heapq.heappop(self._heap)
+
+            # Entries pushed before the last reset are stale
+            if self._deadlines.get(mac) != deadline:
+                continue
+
+            del self._deadlines[mac]
+            self._last_seen.pop(mac, None)
+
+            _LOGGER.debug("Stay online lapsed: %s", mac)
+
+            if listener := self._listeners.get(mac):
+                listener(False)
+
+        self._async_arm()
+
+    def _async_arm_sweep(self) -> None:
+        """Arm sweep of devices without a tracker."""
+
+        if self._sweep is None:
+            self._sweep = self.hass.loop.call_later(self._retention, self._async_sweep)
+
+    @callback
+    def _async_sweep(self) -> None:
+        """Forget lapsed devices without a tracker."""
+
+        self._sweep = None
+
+        lapsed: float = self.hass.loop.time() - self._retention
+        untracked: list[str] = [
+            mac for mac in self._last_seen if mac not in self._listeners
+        ]
+
+        for mac in untracked:
+            if self._last_seen[mac] <= lapsed:
+                del self._last_seen[mac]
+
+        if len(untracked) > 0:
+            self._async_arm_sweep()
+
+
+@callback
+def async_get_presence(hass: HomeAssistant) -> PresenceTimerWheel:
+    """Return shared presence timer wheel.
+
+    :param hass: HomeAssistant: Home Assistant object
+    :return PresenceTimerWheel
+    """
+
+    data: dict = hass.data.setdefault(DOMAIN, {})
+
+    if PRESENCE not in data:
+        data[PRESENCE] = PresenceTimerWheel(hass)
+
+    return data[PRESENCE]
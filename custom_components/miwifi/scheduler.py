@@ -0,0 +1,251 @@
+"""Luci request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from .const import DEFAULT_REQUEST_SLOTS
+from .enum import RequestPriority
+
+
+class RequestScheduler:
+    """Per router request scheduler.
+
+    Requests take one of a limited number of slots, waiting requests are
+    served by priority. Presence and background requests are held back
+    while any interactive command is waiting or running. Requests that got
+    a slot are paced by a token bucket and by the limiter shared by all
+    routers.
+    """
+
+    def __init__(
+        self,
+        slots: int = DEFAULT_REQUEST_SLOTS,
+        rate: float = 0,
+        burst: int = 1,
+        limiter: asyncio.Semaphore | None = None,
+    ) -> None:
+        """Initialize scheduler.
+
+        :param slots: int: Number of requests sent to the router at once
+        :param rate: float: Requests per second, 0 for unlimited
+        :param burst: int: Requests sent at once before rate applies
+        :param limiter: asyncio.Semaphore | None: Limiter shared by all routers
+        """
+
+        self.slots: int = slots
+        self.rate: float = rate
+        self.burst: int = burst
+
+        self._limiter: asyncio.Semaphore | None = limiter
+        self._active: int = 0
+        self._interactive: int = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._tokens: float = burst
+        self._refilled: float | None = None
+        self._requests: int = 0
+        self._delay_total: float = 0
+        self._delay_max: float = 0
+
+    def configure(self, slots: int, rate: float, burst: int) -> None:
+        """Change limits.
+
+        :param slots: int: Number of requests sent to the router at once
+        :param rate: float: Requests per second, 0 for unlimited
+        :param burst: int: Requests sent at once before rate applies
+        """
+
+        self.slots = slots
+        self.rate = rate
+        self.burst = burst
+        self._tokens = min(self._tokens, burst)
+
+        self._wake()
+
+    @property
+    def active(self) -> int:
+        """Requests in flight
+
+        :return int
+        """
+
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Requests waiting for a slot
+
+        :return int
+        """
+
+        return sum(1 for waiter in self._waiters if not waiter[2].done())
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Queueing metrics, delays in ms
+
+        :return dict[str, Any]
+        """
+
+        return {
+            "requests": self._requests,
+            "active": self._active,
+            "waiting": self.waiting,
+            "queue_delay_avg": round(
+                self._delay_total / self._requests * 1000 if self._requests else 0, 1
+            ),
+            "queue_delay_max": round(self._delay_max * 1000, 1),
+        }
+
+    @asynccontextmanager
+    async def async_slot(
+        self, priority: RequestPriority = RequestPriority.BACKGROUND
+    ) -> AsyncIterator[None]:
+        """Hold a request slot.
+
+        :param priority: RequestPriority: Request priority
+        """
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        queued: float = loop.time()
+        is_limited: bool = False
+
+        await self._async_acquire(priority)
+
+        try:
+            await self._async_throttle(loop)
+
+            if self._limiter is not None:
+                await self._limiter.acquire()
+                is_limited = True
+
+            self._record(loop.time() - queued)
+
+            yield
+        finally:
+            if is_limited:
+                self._limiter.release()  # type: ignore
+
+            self._release(priority)
+
+    async def _async_throttle(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Take token of bucket, waiting for it if needed.
+
+        :param loop: asyncio.AbstractEventLoop: Running loop
+        """
+
+        if self.rate <= 0:
+            return
+
+        now: float = loop.time()
+
+        if self._refilled is not None:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._refilled) * self.rate
+            )
+
+        self._refilled = now
+        self._tokens -= 1
+
+        # A negative balance reserves the token of a later refill
+        if self._tokens < 0:
+            try:
+                await asyncio.sleep(-self._tokens / self.rate)
+            except asyncio.CancelledError:
+                self._tokens = min(self.burst, self._tokens + 1)
+
+                raise
+
+    def _record(self, delay: float) -> None:
+        """Record queueing delay.
+
+        :param delay: float: Seconds from request to start
+        """
+
+        self._requests += 1
+        self._delay_total += delay
+        self._delay_max = max(self._delay_max, delay)
+
+    async def _async_acquire(self, priority: RequestPriority) -> None:
+        """Acquire slot.
+
+        :param priority: RequestPriority: Request priority
+        """
+
+        if priority == RequestPriority.INTERACTIVE:
+            self._interactive += 1
+
+        if self._can_start(priority) and not (
+            self._waiters and self._waiters[0][0] <= priority
+        ):
+            self._active += 1
+
+            return
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release(priority)
+            else:
+                future.cancel()
+
+                if priority == RequestPriority.INTERACTIVE:
+                    self._interactive -= 1
+
+                self._wake()
+
+            raise
+
+    def _release(self, priority: RequestPriority) -> None:
+        """Release slot.
+
+        :param priority: RequestPriority: Request priority
+        """
+
+        self._active -= 1
+
+        if priority == RequestPriority.INTERACTIVE:
+            self._interactive -= 1
+
+        self._wake()
+
+    def _can_start(self, priority: int) -> bool:
+        """Can request start now
+
+        :param priority: int: Request priority
+        :return bool
+        """
+
+        if self._active >= self.slots:
+            return False
+
+        return priority == RequestPriority.INTERACTIVE or self._interactive == 0
+
+    def _wake(self) -> None:
+        """Hand free slots to waiting requests."""
+
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+
+            if future.done():
+                heapq.heappop(self._waiters)
+
+                continue
+
+            if not self._can_start(priority):
+                break
+
+            heapq.heappop(self._waiters)
+
+            self._active += 1
+            future.set_result(None)
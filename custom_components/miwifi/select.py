@@ -15,6 +15,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .capabilities import is_supported
 from .const import (
     ATTR_SELECT_SIGNAL_STRENGTH_OPTIONS,
     ATTR_SELECT_WIFI_2_4_CHANNEL,
@@ -156,12 +157,7 @@ async def async_setup_entry(
             updater,
         )
         for description in MIWIFI_SELECTS
-        if description.key
-        not in [
-            ATTR_SELECT_WIFI_5_0_GAME_CHANNEL,
-            ATTR_SELECT_WIFI_5_0_GAME_SIGNAL_STRENGTH,
-        ]
-        or updater.supports_game
+        if is_supported(updater, description.key)
     ]
 
     async_add_entities(entities)
@@ -216,6 +212,9 @@ class MiWifiSelect(MiWifiEntity, SelectEntity):
     def _handle_coordinator_update(self) -> None:
         """Update state."""
 
+        if not self._is_snapshot_changed():
+            return
+
         current_option: str = self._updater.data.get(self.entity_description.key, False)
 
         wifi_data: dict = {}
@@ -317,13 +316,9 @@ class MiWifiSelect(MiWifiEntity, SelectEntity):
         :param data: dict: Adapter data
         """
 
-        new_data: dict = self._wifi_data | data
-
-        try:
-            await self._updater.luci.set_wifi(new_data)
-            self._wifi_data = new_data
-        except LuciError as _e:
-            _LOGGER.debug("WiFi update error: %r", _e)
+        self._wifi_data = await self._updater.wifi_queue.async_set_wifi(
+            self._wifi_data, data
+        )
 
     async def async_select_option(self, option: str) -> None:
         """Select option
@@ -332,9 +327,17 @@ class MiWifiSelect(MiWifiEntity, SelectEntity):
         """
 
         if action := getattr(self, f"_{self.entity_description.key}_change"):
-            await action(option)
+            try:
+                await action(option)
+            except LuciError as _e:
+                _LOGGER.warning("WiFi update error: %r", _e)
+
+                self._updater.async_clear_overlay(self.entity_description.key, "wifi")
+
+                return
 
-            self._updater.data[self.entity_description.key] = option
+            self._updater.async_set_overlay(self.entity_description.key, option)
+            self._updater.async_schedule_confirm("wifi")
             self._attr_current_option = option
             self._change_icon(option)
 
@@ -14,14 +14,25 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import DATA_MEGABYTES, PERCENTAGE, TEMP_CELSIUS
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    DATA_BYTES,
+    DATA_MEGABYTES,
+    PERCENTAGE,
+    TEMP_CELSIUS,
+    TIME_MILLISECONDS,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .capabilities import ONLY_WAN, is_supported
 from .const import (
     ATTR_SENSOR_AP_SIGNAL,
     ATTR_SENSOR_AP_SIGNAL_NAME,
+    ATTR_SENSOR_BYTES_RECEIVED,
+    ATTR_SENSOR_BYTES_RECEIVED_NAME,
+    ATTR_SENSOR_DECODE_TIME,
+    ATTR_SENSOR_DECODE_TIME_NAME,
     ATTR_SENSOR_DEVICES,
     ATTR_SENSOR_DEVICES_2_4,
     ATTR_SENSOR_DEVICES_2_4_NAME,
@@ -34,14 +45,28 @@ from .const import (
     ATTR_SENSOR_DEVICES_LAN,
     ATTR_SENSOR_DEVICES_LAN_NAME,
     ATTR_SENSOR_DEVICES_NAME,
+    ATTR_SENSOR_FAILURES,
+    ATTR_SENSOR_FAILURES_NAME,
+    ATTR_SENSOR_LATENCY_P50,
+    ATTR_SENSOR_LATENCY_P50_NAME,
+    ATTR_SENSOR_LATENCY_P95,
+    ATTR_SENSOR_LATENCY_P95_NAME,
+    ATTR_SENSOR_LOGINS,
+    ATTR_SENSOR_LOGINS_NAME,
     ATTR_SENSOR_MEMORY_TOTAL,
     ATTR_SENSOR_MEMORY_TOTAL_NAME,
     ATTR_SENSOR_MEMORY_USAGE,
     ATTR_SENSOR_MEMORY_USAGE_NAME,
     ATTR_SENSOR_MODE,
     ATTR_SENSOR_MODE_NAME,
+    ATTR_SENSOR_POLL_DURATION,
+    ATTR_SENSOR_POLL_DURATION_NAME,
+    ATTR_SENSOR_REQUESTS_PER_MINUTE,
+    ATTR_SENSOR_REQUESTS_PER_MINUTE_NAME,
     ATTR_SENSOR_TEMPERATURE,
     ATTR_SENSOR_TEMPERATURE_NAME,
+    ATTR_SENSOR_TRACKED_DEVICES,
+    ATTR_SENSOR_TRACKED_DEVICES_NAME,
     ATTR_SENSOR_UPTIME,
     ATTR_SENSOR_UPTIME_NAME,
     ATTR_SENSOR_VPN_UPTIME,
@@ -51,9 +76,12 @@ from .const import (
     ATTR_SENSOR_WAN_UPLOAD_SPEED,
     ATTR_SENSOR_WAN_UPLOAD_SPEED_NAME,
     ATTR_STATE,
+    CONF_EXTRACTORS,
 )
 from .entity import MiWifiEntity
 from .enum import DeviceClass
+from .extractor import Extractor, parse_extractors
+from .helper import get_config_value
 from .updater import LuciUpdater, async_get_updater
 
 PARALLEL_UPDATES = 0
@@ -63,13 +91,9 @@ DISABLE_ZERO: Final = (
     ATTR_SENSOR_AP_SIGNAL,
 )
 
-ONLY_WAN: Final = (
-    ATTR_SENSOR_WAN_DOWNLOAD_SPEED,
-    ATTR_SENSOR_WAN_UPLOAD_SPEED,
-)
-
 PCS: Final = "pcs"
 BS: Final = "B/s"
+REQUESTS_PER_MINUTE: Final = "req/min"
 
 MIWIFI_SENSORS: tuple[SensorEntityDescription, ...] = (
     SensorEntityDescription(
@@ -198,6 +222,88 @@ MIWIFI_SENSORS: tuple[SensorEntityDescription, ...] = (
     ),
 )
 
+MIWIFI_METRIC_SENSORS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key=ATTR_SENSOR_POLL_DURATION,
+        name=ATTR_SENSOR_POLL_DURATION_NAME,
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=TIME_MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key=ATTR_SENSOR_LATENCY_P50,
+        name=ATTR_SENSOR_LATENCY_P50_NAME,
+        icon="mdi:timer-sand",
+        native_unit_of_measurement=TIME_MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key=ATTR_SENSOR_LATENCY_P95,
+        name=ATTR_SENSOR_LATENCY_P95_NAME,
+        icon="mdi:timer-sand",
+        native_unit_of_measurement=TIME_MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key=ATTR_SENSOR_REQUESTS_PER_MINUTE,
+        name=ATTR_SENSOR_REQUESTS_PER_MINUTE_NAME,
+        icon="mdi:swap-vertical",
+        native_unit_of_measurement=REQUESTS_PER_MINUTE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key=ATTR_SENSOR_BYTES_RECEIVED,
+        name=ATTR_SENSOR_BYTES_RECEIVED_NAME,
+        icon="mdi:download-network",
+        native_unit_of_measurement=DATA_BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key=ATTR_SENSOR_DECODE_TIME,
+        name=ATTR_SENSOR_DECODE_TIME_NAME,
+        icon="mdi:code-json",
+        native_unit_of_measurement=TIME_MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key=ATTR_SENSOR_FAILURES,
+        name=ATTR_SENSOR_FAILURES_NAME,
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key=ATTR_SENSOR_LOGINS,
+        name=ATTR_SENSOR_LOGINS_NAME,
+        icon="mdi:login",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key=ATTR_SENSOR_TRACKED_DEVICES,
+        name=ATTR_SENSOR_TRACKED_DEVICES_NAME,
+        icon="mdi:counter",
+        native_unit_of_measurement=PCS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -215,12 +321,9 @@ async def async_setup_entry(
 
     updater: LuciUpdater = async_get_updater(hass, config_entry.entry_id)
 
-    entities: list[MiWifiSensor] = []
+    entities: list[MiWifiSensor | MiWifiExtractorSensor | MiWifiMetricSensor] = []
     for description in MIWIFI_SENSORS:
-        if (
-            description.key == ATTR_SENSOR_DEVICES_5_0_GAME
-            and not updater.supports_game
-        ):
+        if not is_supported(updater, description.key):
             continue
 
         if (
@@ -229,9 +332,6 @@ async def async_setup_entry(
         ):
             continue
 
-        if description.key in ONLY_WAN and not updater.supports_wan:
-            continue
-
         entities.append(
             MiWifiSensor(
                 f"{config_entry.entry_id}-{description.key}",
@@ -240,8 +340,61 @@ async def async_setup_entry(
             )
         )
 
+    try:
+        extractors: list[Extractor] = parse_extractors(
+            get_config_value(config_entry, CONF_EXTRACTORS)
+        )
+    except ValueError as _e:
+        _LOGGER.warning("Extractors of router %s are ignored: %r", updater.ip, _e)
+
+        extractors = []
+
+    entities += [
+        MiWifiExtractorSensor(
+            f"{config_entry.entry_id}-{extractor.key}", extractor, updater
+        )
+        for extractor in extractors
+    ]
+
+    entities += [
+        MiWifiMetricSensor(
+            f"{config_entry.entry_id}-{description.key}", description, updater
+        )
+        for description in MIWIFI_METRIC_SENSORS
+    ]
+
     async_add_entities(entities)
 
+    if updater.supports_wan:
+        return
+
+    is_wan_added: bool = False
+
+    @callback
+    def add_wan_sensors() -> None:
+        """Add wan sensors once the link is up."""
+
+        nonlocal is_wan_added
+
+        if is_wan_added or not updater.supports_wan:
+            return
+
+        is_wan_added = True
+
+        async_add_entities(
+            [
+                MiWifiSensor(
+                    f"{config_entry.entry_id}-{description.key}",
+                    description,
+                    updater,
+                )
+                for description in MIWIFI_SENSORS
+                if description.key in ONLY_WAN
+            ]
+        )
+
+    config_entry.async_on_unload(updater.async_add_listener(add_wan_sensors))
+
 
 class MiWifiSensor(MiWifiEntity, SensorEntity):
     """MiWifi binary sensor entry."""
@@ -270,6 +423,9 @@ class MiWifiSensor(MiWifiEntity, SensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Update state."""
 
+        if not self._is_snapshot_changed():
+            return
+
         is_available: bool = self._updater.data.get(ATTR_STATE, False)
 
         state: Any = self._updater.data.get(self.entity_description.key, None)
@@ -287,3 +443,155 @@ class MiWifiSensor(MiWifiEntity, SensorEntity):
         self._attr_native_value = state
 
         self.async_write_ha_state()
+
+
+class MiWifiExtractorSensor(MiWifiEntity, SensorEntity):
+    """MiWifi extractor sensor entry.
+
+    Evaluated against the raw responses kept by the updater, so the
+    sensor does not send requests of its own.
+    """
+
+    def __init__(
+        self,
+        unique_id: str,
+        extractor: Extractor,
+        updater: LuciUpdater,
+    ) -> None:
+        """Initialize sensor.
+
+        :param unique_id: str: Unique ID
+        :param extractor: Extractor: Compiled extractor
+        :param updater: LuciUpdater: Luci updater object
+        """
+
+        MiWifiEntity.__init__(
+            self,
+            unique_id,
+            SensorEntityDescription(
+                key=extractor.key,
+                name=extractor.name,
+                icon="mdi:code-json",
+                native_unit_of_measurement=extractor.unit,
+                entity_category=EntityCategory.DIAGNOSTIC,
+            ),
+            updater,
+            ENTITY_ID_FORMAT,
+        )
+
+        self._extractor: Extractor = extractor
+        self._value: Any = self._extract()
+
+        self._attr_native_value = self._to_state(self._value)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Extracted list or dict.
+
+        :return dict[str, Any] | None
+        """
+
+        if not isinstance(self._value, (list, dict)):
+            return None
+
+        return {"value": self._value}
+
+    def _handle_coordinator_update(self) -> None:
+        """Update state.
+
+        Raw responses may change while the snapshot does not,
+        so only the extracted value decides about a state write.
+        """
+
+        is_available: bool = self._updater.data.get(ATTR_STATE, False)
+
+        value: Any = self._extract()
+
+        if self._value == value and self._attr_available == is_available:
+            return
+
+        self._attr_available = is_available
+        self._value = value
+        self._attr_native_value = self._to_state(value)
+
+        self.async_write_ha_state()
+
+    def _extract(self) -> Any:
+        """Extract value from last poll response.
+
+        :return Any
+        """
+
+        return self._extractor.extract(self._updater.get_response(self._extractor.uri))
+
+    @staticmethod
+    def _to_state(value: Any) -> Any:
+        """State of extracted value, lists and dicts are counted.
+
+        :param value: Any
+        :return Any
+        """
+
+        return len(value) if isinstance(value, (list, dict)) else value
+
+
+class MiWifiMetricSensor(MiWifiEntity, SensorEntity):
+    """MiWifi metric sensor entry.
+
+    Reads the metrics of the updater, which change on every poll
+    without changing the snapshot.
+    """
+
+    def __init__(
+        self,
+        unique_id: str,
+        description: SensorEntityDescription,
+        updater: LuciUpdater,
+    ) -> None:
+        """Initialize sensor.
+
+        :param unique_id: str: Unique ID
+        :param description: SensorEntityDescription: SensorEntityDescription object
+        :param updater: LuciUpdater: Luci updater object
+        """
+
+        MiWifiEntity.__init__(self, unique_id, description, updater, ENTITY_ID_FORMAT)
+
+        self._attr_native_value = self._updater.metrics.value(description.key)
+        self._attributes: dict[str, Any] | None = self._updater.metrics.attributes(
+            description.key
+        )
+
+    @property
+    def available(self) -> bool:
+        """Metrics are kept while the router is unavailable
+
+        :return bool: Is available
+        """
+
+        return True
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Per endpoint values.
+
+        :return dict[str, Any] | None
+        """
+
+        return self._attributes
+
+    def _handle_coordinator_update(self) -> None:
+        """Update state."""
+
+        state: Any = self._updater.metrics.value(self.entity_description.key)
+        attributes: dict[str, Any] | None = self._updater.metrics.attributes(
+            self.entity_description.key
+        )
+
+        if self._attr_native_value == state and self._attributes == attributes:
+            return
+
+        self._attr_native_value = state
+        self._attributes = attributes
+
+        self.async_write_ha_state()
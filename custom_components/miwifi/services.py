@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import hashlib
 import logging
 from typing import Final
@@ -16,18 +18,39 @@ from homeassistant.helpers.typing import ServiceCallType
 from .const import (
     ATTR_DEVICE_HW_VERSION,
     ATTR_DEVICE_MAC_ADDRESS,
+    ATTR_TRACKER_ENTRY_ID,
     CONF_BODY,
+    CONF_CYCLES,
+    CONF_FIELDS,
+    CONF_MAX_AGE,
+    CONF_POLLS,
     CONF_REQUEST,
+    CONF_REQUESTS,
     CONF_RESPONSE,
+    CONF_RESPONSES,
+    CONF_SAMPLES,
     CONF_URI,
+    DEFAULT_PROFILE_CYCLES,
+    DEFAULT_PROFILE_SAMPLES,
+    DOMAIN,
     EVENT_LUCI,
+    EVENT_TYPE_BATCH_RESPONSE,
     EVENT_TYPE_RESPONSE,
     NAME,
     SERVICE_CALC_PASSWD,
+    SERVICE_MEMORY_REPORT,
+    SERVICE_PROFILE,
+    SERVICE_PROFILE_ROUTER,
     SERVICE_REQUEST,
+    SERVICE_REQUEST_BATCH,
+    UPDATER,
 )
+from .cpu_profile import CpuProfile
+from .endpoint_profile import async_profile_router, get_profile_store
 from .exceptions import LuciError
-from .updater import LuciUpdater, async_get_updater
+from .helper import project_response
+from .memory import MemorySnapshot, async_get_tracker_devices, memory_report
+from .updater import LuciUpdater, async_get_integrations, async_get_updater
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -73,9 +96,48 @@ class MiWifiServiceCall:
                 return async_get_updater(self.hass, identifier)
 
         raise vol.Invalid(
-            f"Device {device_id} does not support the called service. Choose a router with MiWifi support."  # pylint: disable=line-too-long
+            f"Device {device_id} does not support the called service. "
+            "Choose a router with MiWifi support."
         )
 
+    def get_device(self, updater: LuciUpdater) -> dr.DeviceEntry | None:
+        """Get router device.
+
+        :param updater: LuciUpdater
+        :return dr.DeviceEntry | None
+        """
+
+        return dr.async_get(self.hass).async_get_device(
+            set(),
+            {
+                (
+                    dr.CONNECTION_NETWORK_MAC,
+                    updater.data.get(ATTR_DEVICE_MAC_ADDRESS, updater.ip),
+                )
+            },
+        )
+
+    @staticmethod
+    async def async_get_response(
+        updater: LuciUpdater, uri: str, body: dict, max_age: int | None
+    ) -> dict:
+        """Response of poll when fresh enough, otherwise send request.
+
+        :param updater: LuciUpdater
+        :param uri: str: Request uri
+        :param body: dict: Request body
+        :param max_age: int | None: Allowed age of poll response in seconds
+        :return dict: Response
+        """
+
+        if (
+            max_age is not None
+            and (response := updater.get_response(uri, body, max_age)) is not None
+        ):
+            return copy.deepcopy(response)
+
+        return await updater.luci.get(uri, body)
+
     async def async_call_service(self, service: ServiceCallType) -> None:
         """Execute service call.
 
@@ -119,7 +181,11 @@ class MiWifiRequestServiceCall(MiWifiServiceCall):
     """Send request."""
 
     schema = MiWifiServiceCall.schema.extend(
-        {vol.Required(CONF_URI): str, vol.Optional(CONF_BODY): dict}
+        {
+            vol.Required(CONF_URI): str,
+            vol.Optional(CONF_BODY): dict,
+            vol.Optional(CONF_MAX_AGE): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        }
     )
 
     async def async_call_service(self, service: ServiceCallType) -> None:
@@ -129,23 +195,20 @@ class MiWifiRequestServiceCall(MiWifiServiceCall):
         """
 
         updater: LuciUpdater = self.get_updater(service)
-        device_identifier: str = updater.data.get(ATTR_DEVICE_MAC_ADDRESS, updater.ip)
 
         _data: dict = dict(service.data)
 
         try:
-            response: dict = await updater.luci.get(
-                uri := _data.get(CONF_URI), body := _data.get(CONF_BODY, {})  # type: ignore
+            response: dict = await self.async_get_response(
+                updater,
+                uri := _data.get(CONF_URI),  # type: ignore
+                body := _data.get(CONF_BODY, {}),
+                _data.get(CONF_MAX_AGE),
             )
         except LuciError:
             return
 
-        device: dr.DeviceEntry | None = dr.async_get(self.hass).async_get_device(
-            set(),
-            {(dr.CONNECTION_NETWORK_MAC, device_identifier)},
-        )
-
-        if device is not None:
+        if device := self.get_device(updater):
             self.hass.bus.async_fire(
                 EVENT_LUCI,
                 {
@@ -158,7 +221,222 @@ class MiWifiRequestServiceCall(MiWifiServiceCall):
             )
 
 
+class MiWifiRequestBatchServiceCall(MiWifiServiceCall):
+    """Send requests concurrently and fire one event."""
+
+    schema = MiWifiServiceCall.schema.extend(
+        {
+            vol.Required(CONF_REQUESTS): vol.All(
+                vol.Coerce(list),
+                vol.Length(min=1, max=20),
+                [
+                    vol.Schema(
+                        {
+                            vol.Required(CONF_URI): str,
+                            vol.Optional(CONF_BODY): dict,
+                            vol.Optional(CONF_FIELDS): [str],
+                        }
+                    )
+                ],
+            ),
+            vol.Optional(CONF_FIELDS): [str],
+            vol.Optional(CONF_MAX_AGE): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        }
+    )
+
+    async def async_call_service(self, service: ServiceCallType) -> None:
+        """Execute service call.
+
+        :param service: ServiceCallType
+        """
+
+        updater: LuciUpdater = self.get_updater(service)
+
+        _data: dict = dict(service.data)
+
+        responses: list[dict] = await asyncio.gather(
+            *(
+                self._async_request(
+                    updater, request, _data.get(CONF_FIELDS), _data.get(CONF_MAX_AGE)
+                )
+                for request in _data[CONF_REQUESTS]
+            )
+        )
+
+        if device := self.get_device(updater):
+            self.hass.bus.async_fire(
+                EVENT_LUCI,
+                {
+                    CONF_DEVICE_ID: device.id,
+                    CONF_TYPE: EVENT_TYPE_BATCH_RESPONSE,
+                    CONF_RESPONSES: responses,
+                },
+            )
+
+    @staticmethod
+    async def _async_request(
+        updater: LuciUpdater,
+        request: dict,
+        fields: list[str] | None,
+        max_age: int | None,
+    ) -> dict:
+        """Send request of batch.
+
+        :param updater: LuciUpdater
+        :param request: dict: Uri, body and fields
+        :param fields: list[str] | None: Default fields of batch
+        :param max_age: int | None: Allowed age of poll response in seconds
+        :return dict: Request with projected response or error
+        """
+
+        result: dict = {
+            CONF_URI: request[CONF_URI],
+            CONF_REQUEST: request.get(CONF_BODY, {}),
+        }
+
+        try:
+            response: dict = await MiWifiServiceCall.async_get_response(
+                updater, request[CONF_URI], request.get(CONF_BODY, {}), max_age
+            )
+        except LuciError as _e:
+            return result | {"error": str(_e)}
+
+        if fields := request.get(CONF_FIELDS, fields):
+            response = project_response(response, fields)
+
+        return result | {CONF_RESPONSE: response}
+
+
+class MiWifiProfileRouterServiceCall(MiWifiServiceCall):
+    """Profile router endpoints."""
+
+    schema = MiWifiServiceCall.schema.extend(
+        {
+            vol.Optional(CONF_SAMPLES, default=DEFAULT_PROFILE_SAMPLES): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=50)
+            )
+        }
+    )
+
+    async def async_call_service(self, service: ServiceCallType) -> None:
+        """Execute service call.
+
+        :param service: ServiceCallType
+        """
+
+        updater: LuciUpdater = self.get_updater(service)
+
+        report: dict = await async_profile_router(
+            updater, dict(service.data).get(CONF_SAMPLES, DEFAULT_PROFILE_SAMPLES)
+        )
+
+        await get_profile_store(self.hass, updater.ip).async_save(report)
+
+
+class MiWifiProfileServiceCall(MiWifiServiceCall):
+    """Profile CPU time of update cycles."""
+
+    schema = MiWifiServiceCall.schema.extend(
+        {
+            vol.Optional(CONF_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=20)
+            )
+        }
+    )
+
+    async def async_call_service(self, service: ServiceCallType) -> None:
+        """Execute service call.
+
+        :param service: ServiceCallType
+        """
+
+        updater: LuciUpdater = self.get_updater(service)
+
+        # One profiler per thread, profiles of routers would disable each other
+        for integration in async_get_integrations(self.hass).values():
+            if integration[UPDATER].cpu_profile is not None:
+                raise vol.Invalid(
+                    f"CPU profile of {integration[UPDATER].ip} is already running."
+                )
+
+        updater.cpu_profile = CpuProfile(
+            self.hass,
+            updater.ip,
+            dict(service.data).get(CONF_CYCLES, DEFAULT_PROFILE_CYCLES),
+        )
+
+
+class MiWifiMemoryReportServiceCall(MiWifiServiceCall):
+    """Report retained memory of router structures."""
+
+    schema = MiWifiServiceCall.schema.extend(
+        {
+            vol.Optional(CONF_POLLS, default=0): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=100)
+            )
+        }
+    )
+
+    async def async_call_service(self, service: ServiceCallType) -> None:
+        """Execute service call.
+
+        :param service: ServiceCallType
+        """
+
+        updater: LuciUpdater = self.get_updater(service)
+
+        integrations: dict[str, dict] = async_get_integrations(self.hass)
+
+        if updater.ip not in integrations:
+            raise vol.Invalid(f"Router {updater.ip} is not set up yet.")
+
+        polls: int = dict(service.data).get(CONF_POLLS, 0)
+
+        # Tracemalloc is process wide, one diff at a time
+        if polls > 0:
+            for integration in integrations.values():
+                if integration[UPDATER].memory_snapshot is not None:
+                    _ip: str = integration[UPDATER].ip
+
+                    raise vol.Invalid(f"Memory snapshot of {_ip} is already running.")
+
+        report: dict[str, dict[str, int]] = memory_report(
+            {
+                "devices": updater.devices,
+                "data": updater.data,
+                "diagnostics": updater.luci.diagnostics,
+                "trackers": async_get_tracker_devices(
+                    self.hass, integrations[updater.ip][ATTR_TRACKER_ENTRY_ID]
+                ),
+            }
+        )
+
+        _LOGGER.debug("Memory report of %s: %s", updater.ip, report)
+
+        pn.async_create(
+            self.hass,
+            f"Retained memory of {updater.ip}:\n\n"
+            + "\n".join(
+                f"- {name}: {usage['size'] / 1024:.1f} KiB ({usage['items']} items)"
+                for name, usage in report.items()
+            ),
+            NAME,
+            f"{DOMAIN}_memory_{updater.ip}",
+        )
+
+        if polls > 0:
+            updater.memory_snapshot = MemorySnapshot(
+                self.hass, updater.ip, updater.metrics, polls
+            )
+
+            await updater.memory_snapshot.async_start()
+
+
 SERVICES: Final = (
     (SERVICE_CALC_PASSWD, MiWifiCalcPasswdServiceCall),
     (SERVICE_REQUEST, MiWifiRequestServiceCall),
+    (SERVICE_PROFILE_ROUTER, MiWifiProfileRouterServiceCall),
+    (SERVICE_REQUEST_BATCH, MiWifiRequestBatchServiceCall),
+    (SERVICE_PROFILE, MiWifiProfileServiceCall),
+    (SERVICE_MEMORY_REPORT, MiWifiMemoryReportServiceCall),
 )
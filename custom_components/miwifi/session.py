@@ -0,0 +1,129 @@
+"""Verified session handover."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from functools import partial
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DEFAULT_HANDOVER_TIMEOUT, DOMAIN, HANDOVER
+from .updater import LuciUpdater
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SessionHandover:
+    """Sessions verified by config and options flow.
+
+    The verified updater keeps its session until the new entry takes it
+    over, so adding a router costs a single login. Sessions that are not
+    taken in time are logged out.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize handover.
+
+        :param hass: HomeAssistant: Home Assistant object
+        """
+
+        self.hass = hass
+
+        self._sessions: dict[str, tuple[LuciUpdater, tuple, CALLBACK_TYPE]] = {}
+
+    @callback
+    def async_put(self, updater: LuciUpdater, password: str, encryption: str) -> None:
+        """Keep verified session.
+
+        :param updater: LuciUpdater: Updater of config flow
+        :param password: str: Verified password
+        :param encryption: str: Verified encryption algorithm
+        """
+
+        self._async_discard(updater.ip)
+
+        self._sessions[updater.ip] = (
+            updater,
+            (password, encryption),
+            async_call_later(
+                self.hass,
+                DEFAULT_HANDOVER_TIMEOUT,
+                partial(self._async_expire, updater.ip),
+            ),
+        )
+
+    @callback
+    def async_take(
+        self, ip_address: str, password: str, encryption: str
+    ) -> LuciUpdater | None:
+        """Take verified session for entry.
+
+        :param ip_address: str: Router ip address
+        :param password: str: Entry password
+        :param encryption: str: Entry encryption algorithm
+        :return LuciUpdater | None: Updater of config flow
+        """
+
+        if ip_address not in self._sessions:
+            return None
+
+        updater, credentials, unsub = self._sessions[ip_address]
+
+        if credentials != (password, encryption):
+            self._async_discard(ip_address)
+
+            return None
+
+        self._sessions.pop(ip_address)
+        unsub()
+
+        _LOGGER.debug("Router %s continues verified session", ip_address)
+
+        return updater
+
+    @callback
+    def _async_discard(self, ip_address: str) -> None:
+        """Log out session that will not be taken.
+
+        :param ip_address: str: Router ip address
+        """
+
+        if ip_address not in self._sessions:
+            return
+
+        updater, _, unsub = self._sessions.pop(ip_address)
+        unsub()
+
+        self.hass.async_create_task(updater.async_stop())
+
+    async def _async_expire(self, ip_address: str, _now: datetime) -> None:
+        """Log out session not taken in time.
+
+        :param ip_address: str: Router ip address
+        :param _now: datetime: Current time
+        """
+
+        if ip_address not in self._sessions:
+            return  # pragma: no cover
+
+        updater, _, _ = self._sessions.pop(ip_address)
+
+        await updater.async_stop()
+
+
+@callback
+def async_get_handover(hass: HomeAssistant) -> SessionHandover:
+    """Return shared session handover.
+
+    :param hass: HomeAssistant: Home Assistant object
+    :return SessionHandover
+    """
+
+    data: dict = hass.data.setdefault(DOMAIN, {})
+
+    if HANDOVER not in data:
+        data[HANDOVER] = SessionHandover(hass)
+
+    return data[HANDOVER]
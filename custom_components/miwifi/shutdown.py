@@ -0,0 +1,108 @@
+"""Integration shutdown."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import DEFAULT_SHUTDOWN_TIMEOUT, DOMAIN, SHUTDOWN, UPDATER
+from .updater import LuciUpdater, async_get_integrations
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ShutdownCoordinator:
+    """Integration wide shutdown.
+
+    Device stores of all routers are saved and sessions are logged out
+    concurrently under one deadline, so an unreachable router does not
+    delay Home Assistant stop by its request timeout. Routers without
+    an active session are not logged out at all.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize shutdown.
+
+        :param hass: HomeAssistant: Home Assistant object
+        """
+
+        self.hass = hass
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_handle_stop)
+
+    async def _async_handle_stop(self, _event: Event) -> None:
+        """Stop all routers.
+
+        :param _event: Event: Stop event
+        """
+
+        await self.async_shutdown()
+
+    async def async_shutdown(
+        self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT
+    ) -> dict[str, list[str]]:
+        """Save stores and log out of all routers.
+
+        :param timeout: float: Overall deadline in seconds
+        :return dict[str, list[str]]: Skipped and timed out routers
+        """
+
+        updaters: list[LuciUpdater] = [
+            integration[UPDATER]
+            for integration in async_get_integrations(self.hass).values()
+        ]
+
+        tasks: dict[asyncio.Task, str] = {}
+        skipped: list[str] = []
+
+        for updater in updaters:
+            tasks[
+                asyncio.create_task(updater.async_stop(logout=False))
+            ] = f"{updater.ip} store"
+
+            if not updater.is_reachable:
+                skipped.append(updater.ip)
+
+                continue
+
+            tasks[asyncio.create_task(updater.luci.logout())] = f"{updater.ip} logout"
+
+        timed_out: list[str] = []
+
+        if tasks:
+            done, pending = await asyncio.wait(set(tasks), timeout=timeout)
+
+            for task in done:
+                if _e := task.exception():
+                    _LOGGER.debug("Shutdown of %s failed: %r", tasks[task], _e)
+
+            for task in pending:
+                task.cancel()
+                timed_out.append(tasks[task])
+
+        if skipped:
+            _LOGGER.info("Logout skipped for unreachable routers: %s", skipped)
+
+        if timed_out:
+            _LOGGER.warning("Shutdown deadline exceeded for: %s", sorted(timed_out))
+
+        return {"skipped": skipped, "timed_out": sorted(timed_out)}
+
+
+@callback
+def async_get_shutdown(hass: HomeAssistant) -> ShutdownCoordinator:
+    """Return shared shutdown coordinator.
+
+    :param hass: HomeAssistant: Home Assistant object
+    :return ShutdownCoordinator
+    """
+
+    data: dict = hass.data.setdefault(DOMAIN, {})
+
+    if SHUTDOWN not in data:
+        data[SHUTDOWN] = ShutdownCoordinator(hass)
+
+    return data[SHUTDOWN]
@@ -0,0 +1,134 @@
+"""Luci data snapshot."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
+from typing import Any, Final
+
+from .const import ATTR_TRACKER_LAST_ACTIVITY
+
+# Refreshed on every poll of an online device, published with other changes
+VOLATILE_DEVICE_ATTRS: Final = frozenset({ATTR_TRACKER_LAST_ACTIVITY})
+
+
+def _is_same_device(previous: Mapping[str, Any], device: Mapping[str, Any]) -> bool:
+    """Is device unchanged, volatile attributes aside.
+
+    :param previous: Mapping[str, Any]: Published device
+    :param device: Mapping[str, Any]: Working device
+    :return bool
+    """
+
+    if len(previous) != len(device):
+        return False
+
+    for key, value in device.items():
+        if key in VOLATILE_DEVICE_ATTRS:
+            continue
+
+        if key not in previous or previous[key] != value:
+            return False
+
+    return True
+
+
+class LuciSnapshot(Mapping):
+    """Immutable, versioned result of a completed poll.
+
+    Entities keep the version they rendered and skip any work while it is
+    unchanged. Devices are published as read-only mappings that keep their
+    identity across polls for as long as their content does not change.
+    The last activity time alone does not count as a change.
+    """
+
+    __slots__ = ("_data", "devices", "version")
+
+    def __init__(
+        self,
+        data: Mapping[str, Any] | None = None,
+        devices: Mapping[str, Mapping[str, Any]] | None = None,
+        version: int = 0,
+    ) -> None:
+        """Initialize snapshot.
+
+        :param data: Mapping[str, Any] | None: Router data
+        :param devices: Mapping[str, Mapping[str, Any]] | None: Published devices
+        :param version: int: Snapshot version
+        """
+
+        self._data: Mapping[str, Any] = MappingProxyType(dict(data or {}))
+        self.devices: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+            dict(devices or {})
+        )
+        self.version: int = version
+
+    def __getitem__(self, key: str) -> Any:
+        """Get item.
+
+        :param key: str
+        :return Any
+        """
+
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate keys.
+
+        :return Iterator[str]
+        """
+
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Length.
+
+        :return int
+        """
+
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        """Representation.
+
+        :return str
+        """
+
+        return f"LuciSnapshot(version={self.version}, data={dict(self._data)!r})"
+
+    def evolve(
+        self,
+        data: Mapping[str, Any],
+        devices: Mapping[str, Mapping[str, Any]] | None = None,
+    ) -> LuciSnapshot:
+        """Build the next snapshot, reusing this one when nothing changed.
+
+        :param data: Mapping[str, Any]: Router data
+        :param devices: Mapping[str, Mapping[str, Any]] | None: Working device table
+        :return LuciSnapshot
+        """
+
+        if devices is None:
+            if self._data == data:
+                return self
+
+            return LuciSnapshot(data, self.devices, self.version + 1)
+
+        published: dict[str, Mapping[str, Any]] = {}
+        is_devices_changed: bool = len(devices) != len(self.devices)
+
+        for mac, device in devices.items():
+            previous: Mapping[str, Any] | None = self.devices.get(mac)
+
+            if previous is not None and _is_same_device(previous, device):
+                published[mac] = previous
+
+                continue
+
+            published[mac] = MappingProxyType(dict(device))
+            is_devices_changed = True
+
+        if not is_devices_changed and self._data == data:
+            return self
+
+        return LuciSnapshot(data, published, self.version + 1)
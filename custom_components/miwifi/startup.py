@@ -0,0 +1,220 @@
+"""Integration startup."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from functools import partial
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_IP_ADDRESS, Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import PlatformNotReady
+
+from .capabilities import get_capabilities, get_platforms
+from .const import (
+    DEFAULT_CHECK_TIMEOUT,
+    DEFAULT_STARTUP_TIMEOUT,
+    DOMAIN,
+    FORWARDED_PLATFORMS,
+    STARTUP,
+)
+from .exceptions import LuciError
+from .helper import get_config_value
+from .updater import LuciUpdater
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StartupOrchestrator:
+    """Integration wide startup.
+
+    First refreshes of all routers run concurrently and platforms are
+    forwarded as soon as the data of a router is ready. A main router
+    only waits for its configured mesh leafs, so that its first device
+    list can already move devices to them.
+
+    Only platforms the router has capabilities for are forwarded, the
+    entry is reloaded once it gains new capabilities.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize startup.
+
+        :param hass: HomeAssistant: Home Assistant object
+        """
+
+        self.hass = hass
+
+        self._ready: dict[str, asyncio.Event] = {}
+        self._reloading: set[str] = set()
+
+    async def async_start(self, entry: ConfigEntry, updater: LuciUpdater) -> None:
+        """Run first refresh and forward platforms.
+
+        :param entry: ConfigEntry: Config Entry object
+        :param updater: LuciUpdater: Luci updater
+        """
+
+        ready: asyncio.Event = self._get_event(updater.ip)
+        ready.clear()
+
+        try:
+            if leafs := await self._async_get_leafs(updater):
+                await self._async_wait_leafs(updater.ip, leafs)
+
+            await updater.async_config_entry_first_refresh()
+        finally:
+            ready.set()
+
+        if not updater.last_update_success:
+            if updater.last_exception is not None:
+                raise PlatformNotReady from updater.last_exception
+
+            raise PlatformNotReady
+
+        platforms: list[Platform] = get_platforms(updater)
+
+        self.hass.data[DOMAIN][entry.entry_id][FORWARDED_PLATFORMS] = platforms
+
+        await self.hass.config_entries.async_forward_entry_setups(entry, platforms)
+
+        entry.async_on_unload(
+            updater.async_add_listener(
+                partial(
+                    self._async_check_capabilities,
+                    entry,
+                    updater,
+                    get_capabilities(updater),
+                )
+            )
+        )
+
+    @callback
+    def _async_check_capabilities(
+        self, entry: ConfigEntry, updater: LuciUpdater, capabilities: frozenset[str]
+    ) -> None:
+        """Reload entry when router gained capabilities.
+
+        Lost capabilities are ignored, their entities become unavailable
+        instead of flapping with the state of the router.
+
+        :param entry: ConfigEntry: Config Entry object
+        :param updater: LuciUpdater: Luci updater
+        :param capabilities: frozenset[str]: Capabilities at forwarding
+        """
+
+        if updater.ip in self._reloading or not (
+            gained := get_capabilities(updater) - capabilities
+        ):
+            return
+
+        _LOGGER.debug("Router %s gained capabilities: %s", updater.ip, gained)
+
+        self._reloading.add(updater.ip)
+
+        self.hass.async_create_task(
+            self.hass.config_entries.async_reload(entry.entry_id)
+        )
+
+    @callback
+    def async_discard(self, ip_address: str) -> None:
+        """Forget router on unload.
+
+        :param ip_address: str: Router ip address
+        """
+
+        self._ready.pop(ip_address, None)
+        self._reloading.discard(ip_address)
+
+    async def _async_get_leafs(self, updater: LuciUpdater) -> list[str]:
+        """Configured mesh leafs of a main router.
+
+        :param updater: LuciUpdater: Luci updater
+        :return list[str]: Leaf ip addresses
+        """
+
+        configured: set[str] = {
+            get_config_value(entry, CONF_IP_ADDRESS)
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+            if entry.disabled_by is None
+        } - {updater.ip}
+
+        # A single router has nothing to wait for, skip the topology request
+        if not configured:
+            return []
+
+        try:
+            response: dict = await updater.luci.topo_graph(DEFAULT_CHECK_TIMEOUT)
+        except LuciError:
+            return []
+
+        graph: dict = response.get("graph", {})
+
+        if graph.get("ip", "").strip() != updater.ip:
+            return []
+
+        return [
+            _ip for _ip in _get_leaf_ips(graph.get("leafs", [])) if _ip in configured
+        ]
+
+    async def _async_wait_leafs(self, ip_address: str, leafs: list[str]) -> None:
+        """Wait for first refresh of leafs.
+
+        :param ip_address: str: Main router ip address
+        :param leafs: list[str]: Leaf ip addresses
+        """
+
+        _LOGGER.debug("Router %s waits for leafs: %s", ip_address, leafs)
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(self._get_event(_ip).wait() for _ip in leafs)),
+                DEFAULT_STARTUP_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            _LOGGER.debug("Router %s stopped waiting for leafs", ip_address)
+
+    def _get_event(self, ip_address: str) -> asyncio.Event:
+        """Ready event of router.
+
+        :param ip_address: str: Router ip address
+        :return asyncio.Event
+        """
+
+        return self._ready.setdefault(ip_address, asyncio.Event())
+
+
+def _get_leaf_ips(leafs: list) -> list[str]:
+    """Recursive leaf ip addresses.
+
+    :param leafs: list: Topology leafs
+    :return list[str]
+    """
+
+    ips: list[str] = []
+
+    for leaf in leafs:
+        if "ip" in leaf and len(leaf["ip"].strip()) > 0:
+            ips.append(leaf["ip"].strip())
+
+        if "leafs" in leaf and len(leaf["leafs"]) > 0:
+            ips += _get_leaf_ips(leaf["leafs"])
+
+    return ips
+
+
+@callback
+def async_get_startup(hass: HomeAssistant) -> StartupOrchestrator:
+    """Return shared startup orchestrator.
+
+    :param hass: HomeAssistant: Home Assistant object
+    :return StartupOrchestrator
+    """
+
+    data: dict = hass.data.setdefault(DOMAIN, {})
+
+    if STARTUP not in data:
+        data[STARTUP] = StartupOrchestrator(hass)
+
+    return data[STARTUP]
@@ -16,6 +16,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .capabilities import is_supported
 from .const import (
     ATTR_BINARY_SENSOR_DUAL_BAND,
     ATTR_STATE,
@@ -107,10 +108,7 @@ async def async_setup_entry(
 
     entities: list[MiWifiSwitch] = []
     for description in MIWIFI_SWITCHES:
-        if description.key == ATTR_SWITCH_WIFI_5_0_GAME and not updater.supports_game:
-            continue
-
-        if description.key == ATTR_SWITCH_WIFI_GUEST and not updater.supports_guest:
+        if not is_supported(updater, description.key):
             continue
 
         entities.append(
@@ -155,6 +153,9 @@ class MiWifiSwitch(MiWifiEntity, SwitchEntity):
     def _handle_coordinator_update(self) -> None:
         """Update state."""
 
+        if not self._is_snapshot_changed():
+            return
+
         is_on: bool = self._updater.data.get(self.entity_description.key, False)
 
         wifi_data: dict = {}
@@ -248,13 +249,9 @@ class MiWifiSwitch(MiWifiEntity, SwitchEntity):
         :param data: dict: Adapter data
         """
 
-        new_data: dict = self._wifi_data | data
-
-        try:
-            await self._updater.luci.set_wifi(new_data)
-            self._wifi_data = new_data
-        except LuciError as _e:
-            _LOGGER.debug("WiFi update error: %r", _e)
+        self._wifi_data = await self._updater.wifi_queue.async_set_wifi(
+            self._wifi_data, data
+        )
 
     async def _async_update_guest_wifi(self, data: dict) -> None:
         """Update guest wifi
@@ -262,13 +259,9 @@ class MiWifiSwitch(MiWifiEntity, SwitchEntity):
         :param data: dict: Guest data
         """
 
-        new_data: dict = self._wifi_data | data
-
-        try:
-            await self._updater.luci.set_guest_wifi(new_data)
-            self._wifi_data = new_data
-        except LuciError as _e:
-            _LOGGER.debug("WiFi update error: %r", _e)
+        self._wifi_data = await self._updater.wifi_queue.async_set_guest_wifi(
+            self._wifi_data, data
+        )
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on action
@@ -299,11 +292,19 @@ class MiWifiSwitch(MiWifiEntity, SwitchEntity):
         """
 
         if action := getattr(self, method):
-            await action()
+            try:
+                await action()
+            except LuciError as _e:
+                _LOGGER.warning("WiFi update error: %r", _e)
+
+                self._updater.async_clear_overlay(self.entity_description.key, "wifi")
+
+                return
 
             is_on: bool = state == STATE_ON
 
-            self._updater.data[self.entity_description.key] = is_on
+            self._updater.async_set_overlay(self.entity_description.key, is_on)
+            self._updater.async_schedule_confirm("wifi")
             self._attr_is_on = is_on
             self._change_icon(is_on)
 
@@ -15,11 +15,12 @@ from homeassistant.components.update import (
     UpdateEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .capabilities import is_supported
 from .const import (
     ATTR_MODEL,
     ATTR_STATE,
@@ -32,17 +33,16 @@ from .const import (
     ATTR_UPDATE_LATEST_VERSION,
     ATTR_UPDATE_RELEASE_URL,
     ATTR_UPDATE_TITLE,
+    DEFAULT_RECOVER_TIMEOUT,
     REPOSITORY,
 )
 from .entity import MiWifiEntity
-from .enum import Model
+from .enum import Model, RouterState
 from .exceptions import LuciError
 from .updater import LuciUpdater, async_get_updater
 
 PARALLEL_UPDATES = 0
 
-FIRMWARE_UPDATE_WAIT: Final = 180
-FIRMWARE_UPDATE_RETRY: Final = 721
 
 ATTR_CHANGES: Final = (
     ATTR_UPDATE_TITLE,
@@ -99,7 +99,7 @@ async def async_setup_entry(
             updater,
         )
         for description in MIWIFI_UPDATES
-        if description.key != ATTR_UPDATE_FIRMWARE or updater.supports_update
+        if is_supported(updater, description.key)
     ]:
         async_add_entities(entities)
 
@@ -162,6 +162,9 @@ class MiWifiUpdate(MiWifiEntity, UpdateEntity):
         if self.state_attributes.get(ATTR_IN_PROGRESS, False):
             return  # pragma: no cover
 
+        if not self._is_snapshot_changed():
+            return
+
         _update_data: dict[str, Any] = self._updater.data.get(
             self.entity_description.key, {}
         )
@@ -212,13 +215,29 @@ class MiWifiUpdate(MiWifiEntity, UpdateEntity):
         except LuciError as _e:
             _LOGGER.debug("Clear permission error: %r", _e)
 
-        await asyncio.sleep(FIRMWARE_UPDATE_WAIT)
+        self._updater.lifecycle.async_begin(RouterState.FLASHING)
+
+        await self._updater.lifecycle.async_wait_online()
 
-        for _retry in range(1, FIRMWARE_UPDATE_RETRY):
-            if self._updater.data.get(ATTR_STATE, False):
-                break
+        # The router answers before it can be polled, wait for the new version
+        refreshed: asyncio.Event = asyncio.Event()
 
-            await asyncio.sleep(1)
+        @callback
+        def _async_refreshed() -> None:
+            if self._updater.last_update_success and self._updater.data.get(
+                ATTR_STATE, False
+            ):
+                refreshed.set()
+
+        _async_refreshed()
+        remove_listener = self._updater.async_add_listener(_async_refreshed)
+
+        try:
+            await asyncio.wait_for(refreshed.wait(), DEFAULT_RECOVER_TIMEOUT)
+        except asyncio.TimeoutError:
+            _LOGGER.warning("Router %s was not polled after flashing", self._updater.ip)
+        finally:
+            remove_listener()
 
     async def async_install(
         self, version: str | None, backup: bool, **kwargs: Any
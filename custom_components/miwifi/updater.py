@@ -6,6 +6,9 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import random
+import time
+import urllib.parse
 from datetime import datetime, timedelta
 from functools import cached_property
 from typing import Any, Final
@@ -78,16 +81,24 @@ from .const import (
     ATTR_WIFI_DATA_FIELDS,
     DEFAULT_ACTIVITY_DAYS,
     DEFAULT_CALL_DELAY,
+    DEFAULT_CONFIRM_DELAY,
+    DEFAULT_FLEET_LEAF_CADENCE,
     DEFAULT_MANUFACTURER,
     DEFAULT_NAME,
+    DEFAULT_POLL_BUDGET,
     DEFAULT_RETRY,
+    DEFAULT_RETRY_DELAY,
+    DEFAULT_RETRY_MAX_DELAY,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STAY_ONLINE,
+    DEFAULT_STAY_ONLINE_GRACE,
     DEFAULT_TIMEOUT,
     DOMAIN,
     NAME,
     SIGNAL_NEW_DEVICE,
     UPDATER,
 )
+from .cpu_profile import CpuProfile
 from .enum import (
     Connection,
     DeviceAction,
@@ -95,11 +106,21 @@ from .enum import (
     IfName,
     Mode,
     Model,
+    RouterState,
     Wifi,
 )
-from .exceptions import LuciConnectionError, LuciError, LuciRequestError
+from .exceptions import LuciConnectionError, LuciError, LuciRequestError, LuciTokenError
+from .governor import UNSUPPORTED, async_get_governor
+from .health import EndpointHealth
+from .lifecycle import RouterLifecycle
 from .luci import LuciClient
+from .memory import MemorySnapshot
+from .metrics import LuciMetrics
+from .ownership import DeviceOwnership, async_get_ownership
+from .presence import PresenceTimerWheel, async_get_presence
 from .self_check import async_self_check
+from .snapshot import LuciSnapshot
+from .write_queue import WifiWriteQueue
 
 PREPARE_METHODS: Final = (
     "init",
@@ -133,26 +154,14 @@ REPEATER_SKIP_ATTRS: Final = (
     ATTR_TRACKER_OPTIONAL_MAC,
 )
 
-UNSUPPORTED: Final = {
-    "new_status": [
-        Model.R1D,
-        Model.R2D,
-        Model.R1CM,
-        Model.R1CL,
-        Model.R3P,
-        Model.R3D,
-        Model.R3L,
-        Model.R3A,
-        Model.R3,
-        Model.R3G,
-        Model.R4,
-        Model.R4A,
-        Model.R4AC,
-        Model.R4C,
-        Model.R4CM,
-        Model.D01,
-    ]
-}
+DEVICE_COUNTERS: Final = (
+    ATTR_SENSOR_DEVICES,
+    ATTR_SENSOR_DEVICES_LAN,
+    ATTR_SENSOR_DEVICES_GUEST,
+    ATTR_SENSOR_DEVICES_2_4,
+    ATTR_SENSOR_DEVICES_5_0,
+    ATTR_SENSOR_DEVICES_5_0_GAME,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -162,10 +171,14 @@ class LuciUpdater(DataUpdateCoordinator):
     """Luci data updater for interaction with Luci API."""
 
     luci: LuciClient
+    wifi_queue: WifiWriteQueue
+    lifecycle: RouterLifecycle
     code: codes = codes.BAD_GATEWAY
     ip: str
     new_device_callback: CALLBACK_TYPE | None = None
     is_force_load: bool = False
+    stay_online: int = DEFAULT_STAY_ONLINE
+    poll_budget: int = DEFAULT_POLL_BUDGET
     supports_guest: bool = True
 
     _store: Store | None = None
@@ -175,6 +188,7 @@ class LuciUpdater(DataUpdateCoordinator):
     _activity_days: int
     _is_only_login: bool = False
     _is_reauthorization: bool = True
+    _unsub_refresh: CALLBACK_TYPE | None
 
     def __init__(
         self,
@@ -189,6 +203,8 @@ class LuciUpdater(DataUpdateCoordinator):
         store: Store | None = None,
         is_only_login: bool = False,
         entry_id: str | None = None,
+        stay_online: int = DEFAULT_STAY_ONLINE,
+        poll_budget: int = DEFAULT_POLL_BUDGET,
     ) -> None:
         """Initialize updater.
 
@@ -204,18 +220,29 @@ class LuciUpdater(DataUpdateCoordinator):
         :param store: Store | None: Device store
         :param is_only_login: bool: Only config flow
         :param entry_id: str | None: Entry ID
+        :param stay_online: int: Minimum stay online in seconds
+        :param poll_budget: int: Time budget of a poll in seconds, 0 for the scan interval
         """
 
+        self.metrics: LuciMetrics = LuciMetrics()
+
         self.luci = LuciClient(
             get_async_client(hass, False),
             ip,
             password,
             EncryptionAlgorithm(encryption),
             timeout,
+            async_get_governor(hass).scheduler(ip),
+            self.metrics,
         )
 
+        self.wifi_queue = WifiWriteQueue(hass, self.luci)
+        self.lifecycle = RouterLifecycle(hass, self.luci, self._async_handle_lifecycle)
+
         self.ip = ip  # pylint: disable=invalid-name
         self.is_force_load = is_force_load
+        self.stay_online = stay_online
+        self.poll_budget = poll_budget
 
         self._store = store
 
@@ -234,27 +261,62 @@ class LuciUpdater(DataUpdateCoordinator):
                 update_method=self.update,
             )
 
-        self.data: dict[str, Any] = {}
+        self.data: LuciSnapshot = LuciSnapshot()
         self.devices: dict[str, dict[str, Any]] = {}
+
+        self._data: dict[str, Any] = {}
+        self._overlay: dict[str, tuple[Any, int]] = {}
+        self._poll: int = 0
+        self._touched: set[LuciUpdater] = set()
+        self._confirm_methods: set[str] = set()
+        self._unsub_confirm: CALLBACK_TYPE | None = None
         self._signals: dict[str, int] = {}
-        self._moved_devices: list = []
+        self._moved_devices: set[str] = set()
         self._is_first_update: bool = True
-
-    async def async_stop(self, clean_store: bool = False) -> None:
+        self._is_session_adopted: bool = False
+        self._responses: dict[str, tuple[datetime, dict]] = {}
+        self._deferred: dict[str, int] = {}
+        self.exhausted_methods: list[str] = []
+        self.endpoints: dict[str, EndpointHealth] = {}
+        self.fleet_main: LuciUpdater | None = None
+        self.cpu_profile: CpuProfile | None = None
+        self.memory_snapshot: MemorySnapshot | None = None
+
+    async def async_stop(self, clean_store: bool = False, logout: bool = True) -> None:
         """Stop updater
 
         :param clean_store: bool
+        :param logout: bool: Log out of router
         """
 
         if self.new_device_callback is not None:
             self.new_device_callback()  # pylint: disable=not-callable
 
+        if self._unsub_confirm is not None:
+            self._unsub_confirm()
+            self._unsub_confirm = None
+
+        self.lifecycle.async_stop()
+        self.wifi_queue.async_stop()
+
+        if self.cpu_profile is not None:
+            self.cpu_profile.cancel()
+            self.cpu_profile = None
+
+        if self.memory_snapshot is not None:
+            self.memory_snapshot.cancel()
+            self.memory_snapshot = None
+
+        if DOMAIN in self.hass.data:
+            async_get_ownership(self.hass).async_release(self.ip)
+
         if clean_store and self._store is not None:
             await self._store.async_remove()
         else:
             await self._async_save_devices()
 
-        await self.luci.logout()
+        if logout:
+            await self.luci.logout()
 
     @cached_property
     def _update_interval(self) -> timedelta:
@@ -265,21 +327,145 @@ class LuciUpdater(DataUpdateCoordinator):
 
         return timedelta(seconds=self._scan_interval)
 
-    async def update(self, retry: int = 1) -> dict:
+    async def update(self) -> LuciSnapshot:
         """Update miwifi information.
 
-        :param retry: int: Retry count
-        :return dict: dict with luci data.
+        :return LuciSnapshot: snapshot with luci data.
         """
 
-        self.code = codes.OK
+        # A cycle whose entity updates were skipped ends with the next poll
+        if self.cpu_profile is not None and self.cpu_profile.disable():
+            self.cpu_profile = None
+
+        if self.cpu_profile is not None:
+            self.cpu_profile.enable()
+
+        _start: float = time.perf_counter()
+
+        try:
+            return await self._async_update()
+        finally:
+            self.metrics.record_poll(
+                time.perf_counter() - _start,
+                self._data.get(ATTR_STATE, False),
+                len(self.devices),
+            )
+
+            if self.cpu_profile is not None:
+                self.cpu_profile.pause()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, profiled update cycles end here."""
+
+        if self.cpu_profile is not None:
+            self.cpu_profile.resume()
+
+        try:
+            super().async_update_listeners()
+        finally:
+            if self.cpu_profile is not None and self.cpu_profile.disable():
+                self.cpu_profile = None
+
+        if self.memory_snapshot is not None and self.memory_snapshot.update():
+            self.memory_snapshot = None
+
+    async def _async_update(self) -> LuciSnapshot:
+        """Poll router once, with retries on first update.
+
+        :return LuciSnapshot: snapshot with luci data.
+        """
+
+        self._poll += 1
+
+        # A rebooting or flashing router is probed by the lifecycle instead
+        if not self.lifecycle.is_online:
+            self.code = codes.SERVICE_UNAVAILABLE
+            self._data[ATTR_STATE] = False
+
+            return self._publish()
+
+        # The first update has to be complete, later polls are bounded
+        deadline: float | None = (
+            None
+            if self._is_first_update or self._is_only_login
+            else self.hass.loop.time()
+            + (self.poll_budget or self.update_interval.total_seconds())  # type: ignore
+        )
+
+        self.exhausted_methods = []
+
+        retry: int = 1
+
+        while True:
+            _err: LuciError | None = await self._async_update_attempt(
+                retry == 1, deadline
+            )
+
+            if (
+                self._is_only_login
+                or not self._is_first_update
+                or self._data[ATTR_STATE]
+            ):
+                break
+
+            if retry > DEFAULT_RETRY:
+                if _err is not None:
+                    raise _err
+
+                break
+
+            delay: float = self._retry_delay(retry)
+
+            _LOGGER.warning(
+                "Error connecting to router (attempt #%s of %s, next in %.1fs): %r",
+                retry,
+                DEFAULT_RETRY,
+                delay,
+                _err,
+            )
+
+            await asyncio.sleep(delay)
+
+            retry += 1
+
+        if not self._is_only_login:
+            self._clean_devices()
+
+        return self._publish()
+
+    async def _async_update_attempt(
+        self, is_first_attempt: bool, deadline: float | None = None
+    ) -> LuciError | None:
+        """Run login and prepare methods once.
+
+        :param is_first_attempt: bool: Is first attempt of this update
+        :param deadline: float | None: Loop time the poll has to finish by
+        :return LuciError | None: Error
+        """
 
         _is_before_reauthorization: bool = self._is_reauthorization
+        _is_healthy: bool = codes.is_success(self.code)
         _err: LuciError | None = None
 
+        self.code = codes.OK
+
         try:
-            if self._is_reauthorization or self._is_only_login or self._is_first_update:
-                if self._is_first_update and retry == 1:
+            # After a failure, cheap unauthenticated probe before login and prepare
+            if (
+                not self._is_only_login
+                and not _is_healthy
+                and not (self._is_first_update and is_first_attempt)
+                and not await self.lifecycle.async_is_alive()
+            ):
+                raise LuciConnectionError("Router is unreachable")
+
+            _is_fresh_start: bool = (
+                self._is_first_update and not self._is_session_adopted
+            )
+
+            if self._is_reauthorization or self._is_only_login or _is_fresh_start:
+                if _is_fresh_start and is_first_attempt:
                     await self.luci.logout()
                     await asyncio.sleep(DEFAULT_CALL_DELAY)
 
@@ -287,7 +473,7 @@ class LuciUpdater(DataUpdateCoordinator):
 
             for method in PREPARE_METHODS:
                 if not self._is_only_login or method == "init":
-                    await self._async_prepare(method, self.data)
+                    await self._async_prepare_tolerant(method, self._data, deadline)
         except LuciConnectionError as _e:
             _err = _e
 
@@ -304,39 +490,209 @@ class LuciUpdater(DataUpdateCoordinator):
             if self._is_first_update:
                 self._is_first_update = False
 
-        self.data[ATTR_STATE] = codes.is_success(self.code)
+        self._data[ATTR_STATE] = codes.is_success(self.code)
 
         if (
             not self._is_first_update
             and not _is_before_reauthorization
             and self._is_reauthorization
         ):
-            self.data[ATTR_STATE] = True
+            self._data[ATTR_STATE] = True
 
-        if (
-            not self._is_only_login
-            and self._is_first_update
-            and not self.data[ATTR_STATE]
-        ):
-            if retry > DEFAULT_RETRY and _err is not None:
-                raise _err
-
-            if retry <= DEFAULT_RETRY:
-                _LOGGER.warning(
-                    "Error connecting to router (attempt #%s of %s): %r",
-                    retry,
-                    DEFAULT_RETRY,
-                    _err,
-                )
+        return _err
 
-                await asyncio.sleep(retry)
+    async def _async_prepare_tolerant(
+        self, method: str, data: dict, deadline: float | None
+    ) -> None:
+        """Prepare data, tolerating failure of a single method.
 
-                return await self.update(retry + 1)
+        After the first update a failed method keeps its last good values
+        and the poll goes on. Only token errors and an unreachable router
+        fail the whole poll.
 
-        if not self._is_only_login:
-            self._clean_devices()
+        :param method: str
+        :param data: dict
+        :param deadline: float | None: Loop time the poll has to finish by
+        """
 
-        return self.data
+        health: EndpointHealth = self.endpoints.setdefault(method, EndpointHealth())
+
+        try:
+            if await self._async_prepare_in_budget(method, data, deadline):
+                health.succeeded()
+        except LuciTokenError:
+            raise
+        except (LuciConnectionError, LuciRequestError) as _e:
+            health.failed(_e)
+
+            if self._is_first_update:
+                raise
+
+            if (
+                isinstance(_e, LuciConnectionError)
+                and not await self.lifecycle.async_is_alive()
+            ):
+                raise
+
+            _LOGGER.debug(
+                "Router %s keeps stale %s data (%s errors): %r",
+                self.ip,
+                method,
+                health.errors,
+                _e,
+            )
+
+    async def _async_prepare_in_budget(
+        self, method: str, data: dict, deadline: float | None
+    ) -> bool:
+        """Prepare data within time budget of poll.
+
+        A method that ran out of budget is cancelled, data prepared so far
+        is kept and the method sits out the next poll, so that a slow
+        endpoint does not starve the others.
+
+        :param method: str
+        :param data: dict
+        :param deadline: float | None: Loop time the poll has to finish by
+        :return bool: Method has completed
+        """
+
+        if deadline is None:
+            await self._async_prepare(method, data)
+
+            return True
+
+        if self._deferred.get(method, 0) > self._poll:
+            return False
+
+        remaining: float = deadline - self.hass.loop.time()
+
+        if remaining <= 0:
+            self.exhausted_methods.append(method)
+
+            return False
+
+        try:
+            await asyncio.wait_for(self._async_prepare(method, data), remaining)
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                "Router %s poll budget exhausted by %s, deferred to next poll",
+                self.ip,
+                method,
+            )
+
+            self.exhausted_methods.append(method)
+            self._deferred[method] = self._poll + 2
+
+            return False
+
+        return True
+
+    @staticmethod
+    def _retry_delay(retry: int) -> float:
+        """Exponential backoff with jitter
+
+        :param retry: int: Retry count
+        :return float: Seconds to wait
+        """
+
+        delay: float = min(
+            DEFAULT_RETRY_DELAY * 2 ** (retry - 1), DEFAULT_RETRY_MAX_DELAY
+        )
+
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    @property
+    def session_data(self) -> dict[str, Any]:
+        """Init info loaded with the session, without the router state
+
+        :return dict[str, Any]
+        """
+
+        return {key: value for key, value in self._data.items() if key != ATTR_STATE}
+
+    def adopt_session(self, verified: LuciUpdater) -> None:
+        """Continue session and init info verified by config flow.
+
+        :param verified: LuciUpdater: Updater of config flow
+        """
+
+        self.luci.restore_token(verified.luci.token)
+
+        self._data |= verified.session_data
+        self._is_session_adopted = True
+        self._is_reauthorization = False
+
+        self.data = self.data.evolve(self._data)
+
+    @callback
+    def async_reconfigure(
+        self,
+        scan_interval: int,
+        timeout: int,
+        stay_online: int,
+        activity_days: int,
+        is_force_load: bool,
+        poll_budget: int = DEFAULT_POLL_BUDGET,
+    ) -> None:
+        """Apply options that keep the session and entities.
+
+        :param scan_interval: int: Update interval
+        :param timeout: int: Query execution timeout
+        :param stay_online: int: Minimum stay online in seconds
+        :param activity_days: int: Allowed number of days to wait after the last activity
+        :param is_force_load: bool: Force boot devices when using repeater and mesh mode
+        :param poll_budget: int: Time budget of a poll in seconds, 0 for the scan interval
+        """
+
+        self.luci.set_timeout(timeout)
+
+        self.is_force_load = is_force_load
+        self.stay_online = stay_online
+        self.poll_budget = poll_budget
+        self._activity_days = activity_days
+
+        if self._scan_interval != scan_interval:
+            self._scan_interval = scan_interval
+            self.update_interval = timedelta(seconds=scan_interval)
+
+            if self._unsub_refresh is not None:
+                self.schedule_refresh(self.update_interval)
+
+        presence: PresenceTimerWheel = async_get_presence(self.hass)
+
+        for mac in self.devices:
+            presence.async_set_window(mac, self.presence_window)
+
+        _LOGGER.debug("Router %s reconfigured", self.ip)
+
+    @property
+    def presence_window(self) -> float:
+        """Seconds a device stays online after it was last seen.
+
+        Covers the poll latency so that a device seen every poll never flaps.
+
+        :return float
+        """
+
+        return max(
+            self.stay_online,
+            self.update_interval.total_seconds()  # type: ignore
+            + DEFAULT_STAY_ONLINE_GRACE,
+        )
+
+    @property
+    def is_reachable(self) -> bool:
+        """Is router answering with an active session
+
+        :return bool
+        """
+
+        return (
+            self.lifecycle.is_online
+            and codes.is_success(self.code)
+            and self.luci.token is not None
+        )
 
     @property
     def is_repeater(self) -> bool:
@@ -345,7 +701,35 @@ class LuciUpdater(DataUpdateCoordinator):
         :return bool: is_repeater
         """
 
-        return self.data.get(ATTR_SENSOR_MODE, Mode.DEFAULT).value > 0
+        return self._data.get(ATTR_SENSOR_MODE, Mode.DEFAULT).value > 0
+
+    @property
+    def is_fleet_leaf(self) -> bool:
+        """Is leaf fed by device list of main router
+
+        :return bool
+        """
+
+        return (
+            self.fleet_main is not None
+            and self.is_repeater
+            and self.is_force_load
+            and self.fleet_main.is_reachable
+            and self.fleet_main.ip in async_get_integrations(self.hass)
+        )
+
+    @property
+    def _is_fleet_idle(self) -> bool:
+        """Is poll of fleet leaf without client data
+
+        :return bool
+        """
+
+        return (
+            not self._is_first_update
+            and self._poll % DEFAULT_FLEET_LEAF_CADENCE != 0
+            and self.is_fleet_leaf
+        )
 
     @property
     def supports_wan(self) -> bool:
@@ -354,7 +738,7 @@ class LuciUpdater(DataUpdateCoordinator):
         :return bool
         """
 
-        return self.data.get(ATTR_BINARY_SENSOR_WAN_STATE, False)
+        return self._data.get(ATTR_BINARY_SENSOR_WAN_STATE, False)
 
     @property
     def supports_game(self) -> bool:
@@ -363,7 +747,7 @@ class LuciUpdater(DataUpdateCoordinator):
         :return bool
         """
 
-        return self.data.get(ATTR_SWITCH_WIFI_5_0_GAME, None) is not None
+        return self._data.get(ATTR_SWITCH_WIFI_5_0_GAME, None) is not None
 
     @property
     def supports_update(self) -> bool:
@@ -372,7 +756,7 @@ class LuciUpdater(DataUpdateCoordinator):
         :return bool
         """
 
-        return len(self.data.get(ATTR_UPDATE_FIRMWARE, {})) != 0
+        return len(self._data.get(ATTR_UPDATE_FIRMWARE, {})) != 0
 
     @property
     def device_info(self):
@@ -398,6 +782,203 @@ class LuciUpdater(DataUpdateCoordinator):
             configuration_url=f"http://{self.ip}/",
         )
 
+    @callback
+    def async_set_overlay(self, key: str, value: Any) -> None:
+        """Publish an optimistic value written by an entity.
+
+        The value is kept on top of polled data until a poll that started
+        after the write has completed.
+
+        :param key: str: Data key
+        :param value: Any: Value
+        """
+
+        self._data[key] = value
+        self._overlay[key] = (value, self._poll)
+
+        self.data = self.data.evolve(dict(self.data) | {key: value})
+
+    @callback
+    def async_clear_overlay(self, key: str, *methods: str) -> None:
+        """Drop the optimistic value of a failed write.
+
+        The affected endpoints are refreshed to publish the router value.
+
+        :param key: str: Data key
+        :param methods: str: Prepare methods
+        """
+
+        if self._overlay.pop(key, None) is not None:
+            self.async_schedule_confirm(*methods)
+
+    @callback
+    def _async_handle_lifecycle(self, state: RouterState) -> None:
+        """Handle router lifecycle change.
+
+        :param state: RouterState: Lifecycle state
+        """
+
+        if state != RouterState.ONLINE:
+            self.async_set_overlay(ATTR_STATE, False)
+            self.async_update_listeners()
+
+            return
+
+        # Session does not survive a reboot
+        self._is_reauthorization = True
+
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def async_schedule_confirm(self, *methods: str) -> None:
+        """Schedule a refresh of the endpoints affected by a write.
+
+        Writes within the delay share a single refresh.
+
+        :param methods: str: Prepare methods
+        """
+
+        self._confirm_methods.update(methods)
+
+        if self._unsub_confirm is not None:
+            self._unsub_confirm()
+
+        self._unsub_confirm = event.async_call_later(
+            self.hass, DEFAULT_CONFIRM_DELAY, self._async_handle_confirm
+        )
+
+    async def _async_handle_confirm(self, _now: datetime) -> None:
+        """Handle scheduled confirmation.
+
+        :param _now: datetime
+        """
+
+        self._unsub_confirm = None
+
+        methods: set[str] = self._confirm_methods
+        self._confirm_methods = set()
+
+        await self.async_refresh_methods(
+            *[method for method in PREPARE_METHODS if method in methods]
+        )
+
+    async def async_refresh_methods(self, *methods: str) -> None:
+        """Refresh only the given endpoints and publish the result.
+
+        Optimistic values the router confirms are dropped. A router may
+        still report the value from before the write, for example while
+        wifi restarts, so a disagreeing value is only rolled back by the
+        next poll.
+
+        :param methods: str: Prepare methods
+        """
+
+        data: dict[str, Any] = {ATTR_MODEL: self._data.get(ATTR_MODEL, Model.NOT_KNOWN)}
+
+        try:
+            for method in methods:
+                await self._async_prepare(method, data)
+        except LuciError as _e:
+            _LOGGER.debug("Partial refresh error (%s): %r", methods, _e)
+
+            return
+
+        for key, value in data.items():
+            if key not in self._overlay:
+                continue
+
+            if self._overlay[key][0] == value:
+                del self._overlay[key]
+            else:
+                _LOGGER.debug(
+                    "Router %s has not applied %s yet: %r", self.ip, key, value
+                )
+
+        self._data |= data
+
+        self.data = self.data.evolve(
+            dict(self.data)
+            | {key: value for key, value in data.items() if key not in self._overlay}
+        )
+        self.async_update_listeners()
+
+    def _keep_response(
+        self, uri: str, response: dict, query: dict | None = None
+    ) -> dict:
+        """Keep raw response of poll.
+
+        The response is kept as is, prepare methods must not change it.
+
+        :param uri: str: api method
+        :param response: dict: Raw response
+        :param query: dict | None: Data
+        :return dict: Raw response
+        """
+
+        self._responses[_response_key(uri, query)] = (utcnow(), response)
+
+        return response
+
+    def get_response(
+        self, uri: str, query: dict | None = None, max_age: int | None = None
+    ) -> dict | None:
+        """Last raw response of poll not older than max_age.
+
+        :param uri: str: api method
+        :param query: dict | None: Data
+        :param max_age: int | None: Allowed age in seconds, any age when None
+        :return dict | None: Raw response
+        """
+
+        if (_key := _response_key(uri, query)) not in self._responses:
+            return None
+
+        fetched, response = self._responses[_key]
+
+        if max_age is not None and utcnow() - fetched > timedelta(seconds=max_age):
+            return None
+
+        return response
+
+    def _publish(self) -> LuciSnapshot:
+        """Publish working data of the completed poll as a new snapshot.
+
+        :return LuciSnapshot
+        """
+
+        if self._overlay:
+            self._overlay = {
+                key: overlay
+                for key, overlay in self._overlay.items()
+                if overlay[1] >= self._poll
+            }
+
+        data: dict[str, Any] = self._data
+
+        if self._overlay:
+            data = data | {key: overlay[0] for key, overlay in self._overlay.items()}
+
+        # Devices moved to other routers are visible there without waiting for their poll
+        for updater in self._touched:
+            if updater is not self:
+                updater.async_publish_devices()
+
+        self._touched.clear()
+
+        self.data = self.data.evolve(data, self.devices)
+
+        return self.data
+
+    @callback
+    def async_publish_devices(self) -> None:
+        """Publish devices and counters changed by another router."""
+
+        data: dict[str, Any] = {
+            key: value for key, value in self.data.items() if key not in DEVICE_COUNTERS
+        } | {key: self._data[key] for key in DEVICE_COUNTERS if key in self._data}
+
+        self.data = self.data.evolve(data, self.devices)
+
     def schedule_refresh(self, offset: timedelta) -> None:
         """Schedule refresh.
 
@@ -436,10 +1017,12 @@ class LuciUpdater(DataUpdateCoordinator):
         :param data: dict
         """
 
-        if not self._is_first_update:
+        if not self._is_first_update or self._is_session_adopted:
             return
 
-        response: dict = await self.luci.init_info()
+        response: dict = self._keep_response(
+            "xqsystem/init_info", await self.luci.init_info()
+        )
 
         if "model" in response:
             data[ATTR_DEVICE_MODEL] = response["model"]
@@ -460,6 +1043,8 @@ class LuciUpdater(DataUpdateCoordinator):
         if "hardware" in response:
             try:
                 data[ATTR_MODEL] = Model(response["hardware"].lower())
+
+                async_get_governor(self.hass).configure(self.ip, data[ATTR_MODEL])
             except ValueError as _e:
                 await async_self_check(self.hass, self.luci, response["hardware"])
 
@@ -483,7 +1068,9 @@ class LuciUpdater(DataUpdateCoordinator):
         :param data: dict
         """
 
-        response: dict = await self.luci.status()
+        response: dict = self._keep_response(
+            "misystem/status", await self.luci.status()
+        )
 
         if "hardware" in response and isinstance(response["hardware"], dict):
             if "mac" in response["hardware"]:
@@ -530,7 +1117,9 @@ class LuciUpdater(DataUpdateCoordinator):
         """
 
         with contextlib.suppress(LuciError):
-            response: dict = await self.luci.vpn_status()
+            response: dict = self._keep_response(
+                "xqsystem/vpn_status", await self.luci.vpn_status()
+            )
 
             data |= {
                 ATTR_SENSOR_VPN_UPTIME: 0,
@@ -563,7 +1152,9 @@ class LuciUpdater(DataUpdateCoordinator):
         }
 
         try:
-            response: dict = await self.luci.rom_update()
+            response: dict = self._keep_response(
+                "xqsystem/check_rom_update", await self.luci.rom_update()
+            )
         except LuciError:
             response = {}
 
@@ -594,7 +1185,7 @@ class LuciUpdater(DataUpdateCoordinator):
         if data.get(ATTR_SENSOR_MODE, Mode.DEFAULT) == Mode.MESH:
             return
 
-        response: dict = await self.luci.mode()
+        response: dict = self._keep_response("xqnetwork/mode", await self.luci.mode())
 
         if "mode" in response:
             with contextlib.suppress(ValueError):
@@ -610,7 +1201,9 @@ class LuciUpdater(DataUpdateCoordinator):
         :param data: dict
         """
 
-        response: dict = await self.luci.wan_info()
+        response: dict = self._keep_response(
+            "xqnetwork/wan_info", await self.luci.wan_info()
+        )
 
         if (
             "info" in response
@@ -629,7 +1222,7 @@ class LuciUpdater(DataUpdateCoordinator):
         :param data: dict
         """
 
-        response: dict = await self.luci.led()
+        response: dict = self._keep_response("misystem/led", await self.luci.led())
 
         if "status" in response:
             data[ATTR_LIGHT_LED] = response["status"] == 1
@@ -645,7 +1238,9 @@ class LuciUpdater(DataUpdateCoordinator):
         """
 
         try:
-            response: dict = await self.luci.wifi_detail_all()
+            response: dict = self._keep_response(
+                "xqnetwork/wifi_detail_all", await self.luci.wifi_detail_all()
+            )
         except LuciError:
             return
 
@@ -704,11 +1299,13 @@ class LuciUpdater(DataUpdateCoordinator):
         self.supports_guest = False
 
         with contextlib.suppress(LuciError):
-            response_diag = await self.luci.wifi_diag_detail_all()
+            response_diag = self._keep_response(
+                "xqnetwork/wifi_diag_detail_all", await self.luci.wifi_diag_detail_all()
+            )
             _adapters_len: int = len(adapters)
 
             if "info" in response_diag:
-                adapters += [
+                adapters = adapters + [
                     _adapter
                     for _adapter in response_diag["info"]
                     if "ifname" in _adapter and _adapter["ifname"] == IfName.WL14.value
@@ -750,7 +1347,11 @@ class LuciUpdater(DataUpdateCoordinator):
             return
 
         for index in range(1, data.get(ATTR_WIFI_ADAPTER_LENGTH, 2) + 1):
-            response: dict = await self.luci.avaliable_channels(index)
+            response: dict = self._keep_response(
+                "xqnetwork/avaliable_channels",
+                await self.luci.avaliable_channels(index),
+                {"wifiIndex": index},
+            )
 
             if "list" not in response or len(response["list"]) == 0:
                 continue
@@ -767,14 +1368,24 @@ class LuciUpdater(DataUpdateCoordinator):
         :param data: dict
         """
 
-        self.reset_counter()
+        # Membership of a fleet leaf comes from the main router
+        if self._is_fleet_idle:
+            return
 
-        response: dict = await self.luci.wifi_connect_devices()
+        response: dict = self._keep_response(
+            "xqnetwork/wifi_connect_devices", await self.luci.wifi_connect_devices()
+        )
+
+        # Counters keep their last values when the request fails,
+        # devices of main routers are counted from the device list
+        if self.is_repeater:
+            self.reset_counter()
 
         if "list" in response:
             integrations: dict[str, dict] = {}
+            is_fleet_leaf: bool = self.is_fleet_leaf
 
-            if self.is_repeater and self.is_force_load:
+            if self.is_repeater and self.is_force_load and not is_fleet_leaf:
                 integrations = async_get_integrations(self.hass)
 
             for device in response["list"]:
@@ -790,8 +1401,18 @@ class LuciUpdater(DataUpdateCoordinator):
                         .isoformat()
                     # fmt: on
 
+                    async_get_presence(self.hass).async_seen(device["mac"])
+
+                    if is_fleet_leaf:
+                        self.devices[device["mac"]][
+                            ATTR_TRACKER_SIGNAL
+                        ] = self._signals[device["mac"]]
+
+                if is_fleet_leaf:
+                    continue
+
                 if self.is_repeater and self.is_force_load:
-                    device |= {
+                    device = device | {
                         ATTR_TRACKER_ENTRY_ID: self._entry_id,
                         ATTR_TRACKER_UPDATER_ENTRY_ID: self._entry_id,
                     }
@@ -812,7 +1433,9 @@ class LuciUpdater(DataUpdateCoordinator):
         if self.is_repeater:
             return
 
-        response: dict = await self.luci.device_list()
+        response: dict = self._keep_response(
+            "misystem/devicelist", await self.luci.device_list()
+        )
 
         if "list" not in response or len(response["list"]) == 0:
             if len(self._signals) > 0 and not self.is_repeater:
@@ -833,11 +1456,18 @@ class LuciUpdater(DataUpdateCoordinator):
             if "ip" in device and len(device["ip"]) > 0 and ATTR_TRACKER_MAC in device
         }
 
-        add_to: dict = {}
+        add_to: dict[str, dict[str, tuple[dict, DeviceAction]]] = {}
+        own: list[tuple[dict, DeviceAction]] = []
+        claims: dict[str, str] = {}
+
+        for _ip in set(mac_to_ip.values()) & set(integrations) - {self.ip}:
+            if integrations[_ip][UPDATER].is_force_load:
+                integrations[_ip][UPDATER].fleet_main = self
 
         self.reset_counter(is_force=True)
 
-        for device in response["list"]:
+        # Devices are annotated below, the kept response stays raw
+        for device in [dict(device) for device in response["list"]]:
             action: DeviceAction = DeviceAction.ADD
 
             if (
@@ -855,22 +1485,28 @@ class LuciUpdater(DataUpdateCoordinator):
                     and not integration[UPDATER].is_force_load
                 ):
                     action = DeviceAction.MOVE
+                elif (
+                    ATTR_TRACKER_MAC in device
+                    and device[ATTR_TRACKER_MAC] not in integration[UPDATER].devices
+                    and integration[UPDATER].is_fleet_leaf
+                ):
+                    action = DeviceAction.ADD
                 else:
                     action = DeviceAction.SKIP
 
                 device[ATTR_TRACKER_ENTRY_ID] = integration[ATTR_TRACKER_ENTRY_ID]
 
                 if ATTR_DEVICE_MAC_ADDRESS in integration[UPDATER].data:
-                    if mac_to_ip[device["parent"]] not in add_to:
-                        add_to[mac_to_ip[device["parent"]]] = {}
-
-                    add_to[mac_to_ip[device["parent"]]][device[ATTR_TRACKER_MAC]] = (
-                        device,
-                        action,
-                    )
+                    add_to.setdefault(mac_to_ip[device["parent"]], {})[
+                        device[ATTR_TRACKER_MAC]
+                    ] = (device, action)
+                    claims[device[ATTR_TRACKER_MAC]] = mac_to_ip[device["parent"]]
 
                     if integration[UPDATER].is_force_load:
                         continue
+
+                # Devices moved to a leaf are still updated by this router
+                device[ATTR_TRACKER_UPDATER_ENTRY_ID] = self._entry_id
             else:
                 device[ATTR_TRACKER_ENTRY_ID] = self._entry_id
 
@@ -880,13 +1516,13 @@ class LuciUpdater(DataUpdateCoordinator):
                 ):
                     device[ATTR_TRACKER_UPDATER_ENTRY_ID] = self._entry_id
                     device[ATTR_TRACKER_ROUTER_MAC_ADDRESS] = (
-                        self.data.get(ATTR_DEVICE_MAC_ADDRESS, None),
+                        self._data.get(ATTR_DEVICE_MAC_ADDRESS, None),
                     )
 
                     if self._mass_update_device(device, integrations):
                         action = DeviceAction.SKIP
 
-                    self._moved_devices.remove(device[ATTR_TRACKER_MAC])
+                    self._moved_devices.discard(device[ATTR_TRACKER_MAC])
 
             if (
                 ATTR_TRACKER_MAC in device
@@ -894,8 +1530,39 @@ class LuciUpdater(DataUpdateCoordinator):
             ):
                 device[ATTR_TRACKER_UPDATER_ENTRY_ID] = self._entry_id
 
-                if ATTR_TRACKER_MAC in device:
-                    self.add_device(device, action=action, integrations=integrations)
+                claims.setdefault(device[ATTR_TRACKER_MAC], self.ip)
+                own.append((device, action))
+
+        await self._async_reconcile_devices(own, add_to, claims, integrations)
+
+    async def _async_reconcile_devices(
+        self,
+        own: list[tuple[dict, DeviceAction]],
+        add_to: dict[str, dict[str, tuple[dict, DeviceAction]]],
+        claims: dict[str, str],
+        integrations: dict[str, dict],
+    ) -> None:
+        """Apply ownership of devices reported by device list.
+
+        Claims of the device list are reconciled with the claims of other
+        main routers first. Each device is then added once to its owner,
+        devices of other routers are handed over in one pass per router
+        and published with the snapshot of this poll.
+
+        :param own: list[tuple[dict, DeviceAction]]: Devices of this router
+        :param add_to: dict[str, dict[str, tuple[dict, DeviceAction]]]: Devices of other routers
+        :param claims: dict[str, str]: Owner IP address by device MAC address
+        :param integrations: dict[str, dict]: Integrations list
+        """
+
+        ownership: DeviceOwnership = async_get_ownership(self.hass)
+        ownership.async_reconcile(self.ip, claims)
+
+        for device, action in own:
+            if ownership.is_owner(
+                device[ATTR_TRACKER_MAC], claims[device[ATTR_TRACKER_MAC]]
+            ):
+                self.add_device(device, action=action, integrations=integrations)
 
         if not add_to:
             return
@@ -906,11 +1573,13 @@ class LuciUpdater(DataUpdateCoordinator):
             if not integrations[_ip][UPDATER].is_force_load:
                 integrations[_ip][UPDATER].reset_counter(is_force=True)
 
-            for device in devices.values():
-                if ATTR_TRACKER_MAC in device[0]:
-                    integrations[_ip][UPDATER].add_device(
-                        device[0], True, device[1], integrations
-                    )
+            for mac, (device, action) in devices.items():
+                if ATTR_TRACKER_MAC in device and ownership.is_owner(mac, _ip):
+                    ownership.async_hand_over(_ip, device, action)
+
+            integrations[_ip][UPDATER].async_take_over(integrations)
+
+            self._touched.add(integrations[_ip][UPDATER])
 
     async def _async_prepare_device_restore(self, data: dict) -> None:
         """Restore devices
@@ -927,6 +1596,7 @@ class LuciUpdater(DataUpdateCoordinator):
             return
 
         integrations: dict = async_get_integrations(self.hass)
+        ownership: DeviceOwnership = async_get_ownership(self.hass)
 
         for mac, device in devices.items():
             if mac in self.devices:
@@ -952,15 +1622,22 @@ class LuciUpdater(DataUpdateCoordinator):
                         continue
 
                     if integration[UPDATER].is_force_load:
-                        if mac in integration[UPDATER].devices:
-                            integration[UPDATER].devices[mac] |= {
+                        ownership.async_hand_over(
+                            integration[UPDATER].ip,
+                            {
                                 attr: device[attr]
                                 for attr in [ATTR_TRACKER_NAME, ATTR_TRACKER_IP]
                                 if attr in device and device[attr] is not None
                             }
+                            | {ATTR_TRACKER_MAC: mac},
+                            DeviceAction.UPDATE,
+                        )
+                        integration[UPDATER].async_take_over()
 
                         _is_add = False
 
+                        self._touched.add(integration[UPDATER])
+
                         break
 
                     if mac not in integration[UPDATER].devices:
@@ -974,9 +1651,13 @@ class LuciUpdater(DataUpdateCoordinator):
                             ATTR_TRACKER_UPDATER_ENTRY_ID: self._entry_id,
                         }
 
-                        integration[UPDATER].devices[mac] = device
+                        ownership.async_hand_over(
+                            integration[UPDATER].ip, device, DeviceAction.RESTORE
+                        )
+                        integration[UPDATER].async_take_over()
 
-                        self._moved_devices.append(mac)
+                        self._moved_devices.add(mac)
+                        self._touched.add(integration[UPDATER])
 
                         break
 
@@ -999,6 +1680,24 @@ class LuciUpdater(DataUpdateCoordinator):
 
         self._clean_devices()
 
+    @callback
+    def async_take_over(self, integrations: dict[str, Any] | None = None) -> None:
+        """Apply devices handed over by other routers.
+
+        :param integrations: dict[str, Any]: Integrations list
+        """
+
+        for mac, (device, action) in (
+            async_get_ownership(self.hass).async_take(self.ip).items()
+        ):
+            if action == DeviceAction.UPDATE:
+                if mac in self.devices:
+                    self.devices[mac] |= device
+            elif action == DeviceAction.RESTORE:
+                self.devices.setdefault(mac, device)
+            else:
+                self.add_device(device, True, action, integrations)
+
     def add_device(
         self,
         device: dict,
@@ -1035,8 +1734,10 @@ class LuciUpdater(DataUpdateCoordinator):
         else:
             self.devices[device[ATTR_TRACKER_MAC]] = _device
 
+        async_get_presence(self.hass).async_seen(device[ATTR_TRACKER_MAC])
+
         if not is_from_parent and action == DeviceAction.MOVE:
-            self._moved_devices.append(device[ATTR_TRACKER_MAC])
+            self._moved_devices.add(device[ATTR_TRACKER_MAC])
 
             action = DeviceAction.ADD
 
@@ -1060,14 +1761,14 @@ class LuciUpdater(DataUpdateCoordinator):
         ):
             return
 
-        self.data[ATTR_SENSOR_DEVICES] += 1
+        self._data[ATTR_SENSOR_DEVICES] += 1
 
         code: str = _device.get(ATTR_TRACKER_CONNECTION, Connection.LAN).name.replace(
             "WIFI_", ""
         )
         code = f"{ATTR_SENSOR_DEVICES}_{code}".lower()
 
-        self.data[code] += 1
+        self._data[code] += 1
 
     def _build_device(
         self, device: dict, integrations: dict[str, Any] | None = None
@@ -1098,7 +1799,7 @@ class LuciUpdater(DataUpdateCoordinator):
                 ATTR_TRACKER_UPDATER_ENTRY_ID, device[ATTR_TRACKER_ENTRY_ID]
             ),
             ATTR_TRACKER_MAC: device[ATTR_TRACKER_MAC],
-            ATTR_TRACKER_ROUTER_MAC_ADDRESS: self.data.get(
+            ATTR_TRACKER_ROUTER_MAC_ADDRESS: self._data.get(
                 ATTR_DEVICE_MAC_ADDRESS, None
             ),
             ATTR_TRACKER_SIGNAL: self._signals[device[ATTR_TRACKER_MAC]]
@@ -1141,6 +1842,7 @@ class LuciUpdater(DataUpdateCoordinator):
         """
 
         is_found: bool = False
+        ownership: DeviceOwnership = async_get_ownership(self.hass)
 
         for _ip, integration in integrations.items():
             if (
@@ -1155,9 +1857,15 @@ class LuciUpdater(DataUpdateCoordinator):
                     if attr in _device:
                         del _device[attr]
 
-            integration[UPDATER].devices[device[ATTR_TRACKER_MAC]] |= _device
+            ownership.async_hand_over(_ip, _device, DeviceAction.UPDATE)
+            integration[UPDATER].async_take_over()
             is_found = True
 
+            self._touched.add(integration[UPDATER])
+
+        if is_found:
+            async_get_presence(self.hass).async_seen(device[ATTR_TRACKER_MAC])
+
         return is_found
 
     async def _async_prepare_ap(self, data: dict) -> None:
@@ -1166,10 +1874,12 @@ class LuciUpdater(DataUpdateCoordinator):
         :param data: dict
         """
 
-        if self.data.get(ATTR_SENSOR_MODE, Mode.DEFAULT) != Mode.REPEATER:
+        if self._data.get(ATTR_SENSOR_MODE, Mode.DEFAULT) != Mode.REPEATER:
             return
 
-        response: dict = await self.luci.wifi_ap_signal()
+        response: dict = self._keep_response(
+            "xqnetwork/wifiap_signal", await self.luci.wifi_ap_signal()
+        )
 
         if "signal" in response and isinstance(response["signal"], int):
             data[ATTR_SENSOR_AP_SIGNAL] = response["signal"]
@@ -1180,10 +1890,12 @@ class LuciUpdater(DataUpdateCoordinator):
         :param data: dict
         """
 
-        if not self.is_force_load:
+        if not self.is_force_load or self._is_fleet_idle:
             return
 
-        response: dict = await self.luci.new_status()
+        response: dict = self._keep_response(
+            "misystem/newstatus", await self.luci.new_status()
+        )
 
         if "count" in response:
             data[ATTR_SENSOR_DEVICES] = response["count"]
@@ -1230,6 +1942,8 @@ class LuciUpdater(DataUpdateCoordinator):
 
             del self.devices[mac]
 
+            async_get_presence(self.hass).async_forget(mac)
+
     def reset_counter(self, is_force: bool = False, is_remove: bool = False) -> None:
         """Reset counter
 
@@ -1240,18 +1954,11 @@ class LuciUpdater(DataUpdateCoordinator):
         if self.is_repeater and not self.is_force_load and not is_force:
             return
 
-        for attr in [
-            ATTR_SENSOR_DEVICES,
-            ATTR_SENSOR_DEVICES_LAN,
-            ATTR_SENSOR_DEVICES_GUEST,
-            ATTR_SENSOR_DEVICES_2_4,
-            ATTR_SENSOR_DEVICES_5_0,
-            ATTR_SENSOR_DEVICES_5_0_GAME,
-        ]:
-            if attr in self.data and is_remove:
-                del self.data[attr]
+        for attr in DEVICE_COUNTERS:
+            if attr in self._data and is_remove:
+                del self._data[attr]
             elif not is_remove:
-                self.data[attr] = 0
+                self._data[attr] = 0
 
     async def _async_load_devices(self) -> dict | None:
         """Async load devices from Store"""
@@ -1279,6 +1986,22 @@ class LuciUpdater(DataUpdateCoordinator):
         await self._store.async_save(self.devices)
 
 
+def _response_key(uri: str, query: dict | None = None) -> str:
+    """Key of raw response.
+
+    :param uri: str: api method
+    :param query: dict | None: Data
+    :return str
+    """
+
+    uri = uri.strip("/")
+
+    if not query:
+        return uri
+
+    return f"{uri}?{urllib.parse.urlencode(sorted(query.items()), doseq=True)}"
+
+
 @callback
 def async_get_integrations(hass: HomeAssistant) -> dict[str, dict]:
     """Return integrations map.
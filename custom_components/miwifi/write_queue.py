@@ -0,0 +1,129 @@
+"""Wifi write queue."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DEFAULT_WRITE_DEBOUNCE
+from .exceptions import LuciError
+from .luci import LuciClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WifiWriteQueue:
+    """Coalesce wifi writes of a router.
+
+    Every write restarts the radio, so changes sent to the same adapter
+    within the debounce window are merged and sent as a single call.
+    All callers of the batch share its result.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        luci: LuciClient,
+        debounce: float = DEFAULT_WRITE_DEBOUNCE,
+    ) -> None:
+        """Initialize write queue.
+
+        :param hass: HomeAssistant: Home Assistant object
+        :param luci: LuciClient: Luci client
+        :param debounce: float: Seconds to wait for further changes
+        """
+
+        self.hass = hass
+        self.luci = luci
+
+        self._debounce: float = debounce
+        self._pending: dict[tuple[str, Any], tuple[dict, asyncio.Future]] = {}
+        self._locks: dict[tuple[str, Any], asyncio.Lock] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def async_set_wifi(self, base: dict, data: dict) -> dict:
+        """Queue wifi adapter write.
+
+        :param base: dict: Current adapter data
+        :param data: dict: Changed adapter data
+        :return dict: Sent adapter data
+        """
+
+        return await self._async_enqueue("set_wifi", base, data)
+
+    async def async_set_guest_wifi(self, base: dict, data: dict) -> dict:
+        """Queue guest wifi write.
+
+        :param base: dict: Current guest data
+        :param data: dict: Changed guest data
+        :return dict: Sent guest data
+        """
+
+        return await self._async_enqueue("set_guest_wifi", base, data)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel pending writes."""
+
+        for task in self._tasks:
+            task.cancel()
+
+        for _, future in self._pending.values():
+            future.cancel()
+
+        self._pending.clear()
+
+    async def _async_enqueue(self, method: str, base: dict, data: dict) -> dict:
+        """Merge write into pending batch.
+
+        :param method: str: Luci method
+        :param base: dict: Current adapter data
+        :param data: dict: Changed adapter data
+        :return dict: Sent adapter data
+        """
+
+        key: tuple[str, Any] = (method, data.get("wifiIndex"))
+
+        if key in self._pending:
+            payload, future = self._pending[key]
+
+            # Only changes are merged, the base of a later caller may be stale
+            payload |= data
+
+            _LOGGER.debug("Coalesced %s write: %s", method, data)
+        else:
+            future = self.hass.loop.create_future()
+            self._pending[key] = (base | data, future)
+
+            task: asyncio.Task = self.hass.async_create_task(
+                self._async_flush(method, key)
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        return await asyncio.shield(future)
+
+    async def _async_flush(self, method: str, key: tuple[str, Any]) -> None:
+        """Send pending batch once the debounce window is over.
+
+        :param method: str: Luci method
+        :param key: tuple[str, Any]: Batch key
+        """
+
+        await asyncio.sleep(self._debounce)
+
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            payload, future = self._pending.pop(key)
+
+            try:
+                await getattr(self.luci, method)(payload)
+            except LuciError as _e:
+                future.set_exception(_e)
+            else:
+                future.set_result(payload)
+            finally:
+                if not future.done():
+                    future.cancel()
@@ -0,0 +1,697 @@
+"""Fake Luci routers for load tests of the miwifi component.
+
+Routers answer the endpoints of LuciClient from generated state: login
+with nonce and password hash verification, stok sessions, mesh topology
+and device lists of any size. Latency, timeouts, 5xx errors, token expiry
+and reboots are injected per router.
+
+In tests the routers are reached through an httpx transport, no socket
+is opened::
+
+    network = FakeLuciNetwork()
+    main = network.add_router("192.168.31.1", clients=500)
+    network.add_leaf(main, "192.168.31.62", clients=100)
+    main.faults.error_rate = 0.1
+
+    with patch(
+        "custom_components.miwifi.updater.get_async_client",
+        return_value=network.client(hass),
+    ):
+        ...
+
+For manual runs against Home Assistant every router is served on its own
+local port, integrations use "127.0.0.1:<port>" as ip address::
+
+    python -m tests.fake_luci --clients 500 --leaves 2 --latency 0.2
+"""
+
+# pylint: disable=too-many-instance-attributes
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import ipaddress
+import json
+import logging
+import random
+import re
+import secrets
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Any, Final
+
+import httpx
+from aiohttp import web
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.httpx_client import create_async_httpx_client
+
+from custom_components.miwifi.const import (
+    CLIENT_NONCE_TYPE,
+    CLIENT_PUBLIC_KEY,
+    CLIENT_USERNAME,
+)
+from custom_components.miwifi.enum import EncryptionAlgorithm, Mode
+
+FIXTURES: Final = Path(__file__).parent / "fixtures"
+
+PATH: Final = re.compile(
+    r"^/cgi-bin/luci/(?:;stok=(?P<stok>[^/]+)/)?(?P<kind>api|web)/(?P<method>.+)$"
+)
+
+NONCE: Final = re.compile(rf"^{CLIENT_NONCE_TYPE}_[0-9a-f:]{{17}}_\d+_\d+$")
+
+STATIC_RESPONSES: Final = {
+    "xqsystem/vpn_status": "vpn_status_data.json",
+    "xqsystem/check_rom_update": "rom_update_data.json",
+    "xqnetwork/wan_info": "wan_info_data.json",
+    "xqnetwork/wifi_detail_all": "wifi_detail_all_data.json",
+    "xqnetwork/wifi_diag_detail_all": "wifi_diag_detail_all_data.json",
+    "xqnetwork/wifiap_signal": "wifi_ap_signal_data.json",
+    "xqnetwork/avaliable_channels": "avaliable_channels_2g_data.json",
+}
+
+WRITE_METHODS: Final = (
+    "xqnetwork/set_wifi",
+    "xqnetwork/set_wifi_without_restart",
+    "xqsystem/upgrade_rom",
+    "xqsystem/flash_permission",
+)
+
+DEFAULT_REBOOT: Final = 5.0
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def load_response(name: str) -> dict:
+    """Load fixture response.
+
+    :param name: str: Fixture file name
+    :return dict
+    """
+
+    return json.loads((FIXTURES / name).read_text())
+
+
+class FakeFaults:
+    """Faults injected into answers of fake router."""
+
+    __slots__ = ("latency", "jitter", "timeout_rate", "error_rate", "token_ttl")
+
+    def __init__(self) -> None:
+        """Initialize faults, none by default."""
+
+        self.latency: float = 0.0
+        self.jitter: float = 0.0
+        self.timeout_rate: float = 0.0
+        self.error_rate: float = 0.0
+        self.token_ttl: float | None = None
+
+
+class FakeRouter:
+    """Fake Luci router."""
+
+    def __init__(
+        self,
+        ip: str,  # pylint: disable=invalid-name
+        index: int,
+        password: str = "password",
+        encryption: str = EncryptionAlgorithm.SHA1,
+        clients: int = 0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize router.
+
+        :param ip: str: Router ip address
+        :param index: int: Router number in network, makes MAC addresses unique
+        :param password: str: Admin password
+        :param encryption: str: Password encryption algorithm
+        :param clients: int: Generated clients
+        :param seed: int | None: Seed of injected faults
+        """
+
+        self.ip = ip  # pylint: disable=invalid-name
+        self.index = index
+        self.password = password
+        self.encryption = encryption
+        self.mac: str = f"02:00:00:{index:02X}:00:00"
+        self.mode: Mode = Mode.DEFAULT
+        self.model: str = "xiaomi.router.ra67"
+        self.hardware: str = "RA67"
+
+        self.faults: FakeFaults = FakeFaults()
+        self.leaves: list[FakeRouter] = []
+        self.clients: list[dict[str, Any]] = []
+        self.sessions: dict[str, float] = {}
+        self.requests: dict[str, int] = {}
+        self.logins: int = 0
+
+        self._random: random.Random = random.Random(seed)
+        self._down_until: float = 0.0
+        self._boot: float = time.monotonic()
+
+        self.generate_clients(clients)
+
+    @property
+    def is_down(self) -> bool:
+        """Is router rebooting
+
+        :return bool
+        """
+
+        return time.monotonic() < self._down_until
+
+    def generate_clients(self, count: int) -> None:
+        """Replace clients with generated ones.
+
+        :param count: int: Number of clients
+        """
+
+        network: ipaddress.IPv4Address = ipaddress.IPv4Address(f"10.{self.index}.0.0")
+
+        self.clients = [
+            {
+                "mac": f"02:00:00:{self.index:02X}:{(number >> 8) & 255:02X}:"
+                f"{number & 255:02X}",
+                "ip": str(network + number),
+                "name": f"Client {self.index}-{number}",
+                "type": number % 3,
+            }
+            for number in range(1, count + 1)
+        ]
+
+    def reboot(self, duration: float = DEFAULT_REBOOT) -> None:
+        """Reboot router, connections fail and sessions are lost.
+
+        :param duration: float: Seconds until router answers again
+        """
+
+        self._down_until = time.monotonic() + duration
+        self._boot = self._down_until
+        self.sessions.clear()
+
+    def expire_sessions(self) -> None:
+        """Drop all sessions, requests answer with invalid token."""
+
+        self.sessions.clear()
+
+    def verify_password(self, nonce: str, password_hash: str) -> bool:
+        """Verify nonce format and login hash.
+
+        :param nonce: str: Client nonce "type_mac_time_random"
+        :param password_hash: str: sha(nonce + sha(password + key))
+        :return bool
+        """
+
+        if not NONCE.match(nonce):
+            return False
+
+        sha = (
+            hashlib.sha256
+            if self.encryption == EncryptionAlgorithm.SHA256
+            else hashlib.sha1
+        )
+
+        return (
+            password_hash
+            == sha(
+                (
+                    nonce
+                    + sha((self.password + CLIENT_PUBLIC_KEY).encode()).hexdigest()
+                ).encode()
+            ).hexdigest()
+        )
+
+    async def async_handle(
+        self, method: str, path: str, params: dict[str, str]
+    ) -> tuple[int, dict | str] | None:
+        """Answer request.
+
+        :param method: str: HTTP method
+        :param path: str: URL path
+        :param params: dict[str, str]: Query or form data
+        :return tuple[int, dict | str] | None: Status and answer, None for no answer
+        """
+
+        if delay := self.faults.latency + self._random.uniform(0, self.faults.jitter):
+            await asyncio.sleep(delay)
+
+        if not (match := PATH.match(path)):
+            return 404, "Not Found"
+
+        luci_method: str = match["method"]
+
+        self.requests[luci_method] = self.requests.get(luci_method, 0) + 1
+
+        if self._random.random() < self.faults.timeout_rate:
+            return None
+
+        if self._random.random() < self.faults.error_rate:
+            return 502, "<html><body>502 Bad Gateway</body></html>"
+
+        if luci_method == "xqsystem/login" and method == "POST":
+            return 200, self._login(params)
+
+        if luci_method == "misystem/topo_graph":
+            return 200, self._topo_graph()
+
+        if not self._is_session(match["stok"]):
+            return 200, {"code": 401, "msg": "Invalid token"}
+
+        if luci_method == "logout":
+            self.sessions.pop(match["stok"], None)
+
+            return 200, "OK"
+
+        return 200, self._answer(luci_method, params)
+
+    def _is_session(self, stok: str | None) -> bool:
+        """Is stok of live session.
+
+        :param stok: str | None: Session token
+        :return bool
+        """
+
+        if stok is None or stok not in self.sessions:
+            return False
+
+        if (
+            self.faults.token_ttl is not None
+            and time.monotonic() - self.sessions[stok] > self.faults.token_ttl
+        ):
+            self.sessions.pop(stok)
+
+            return False
+
+        return True
+
+    def _login(self, params: dict[str, str]) -> dict:
+        """Login answer.
+
+        :param params: dict[str, str]: Form data
+        :return dict
+        """
+
+        if params.get("username") != CLIENT_USERNAME or not self.verify_password(
+            params.get("nonce", ""), params.get("password", "")
+        ):
+            return {"code": 401, "msg": "Not authorized"}
+
+        stok: str = secrets.token_hex(16)
+
+        self.sessions[stok] = time.monotonic()
+        self.logins += 1
+
+        return {"code": 0, "token": stok, "url": f"/cgi-bin/luci/;stok={stok}/web/home"}
+
+    def _topo_graph(self) -> dict:
+        """Mesh topology answer.
+
+        :return dict
+        """
+
+        return {
+            "show": 1,
+            "code": 0,
+            "graph": {
+                "ip": self.ip,
+                "name": f"ROUTER {self.index}",
+                "hardware": self.hardware,
+                "mode": int(self.mode),
+                "leafs": [
+                    {
+                        "ip": leaf.ip,
+                        "name": f"ROUTER {leaf.index}",
+                        "hardware": leaf.hardware,
+                        "mode": int(leaf.mode),
+                    }
+                    for leaf in self.leaves
+                ],
+            },
+        }
+
+    def _answer(self, luci_method: str, params: dict[str, str]) -> dict:
+        """Answer of authorized request.
+
+        :param luci_method: str: Luci api method
+        :param params: dict[str, str]: Query data
+        :return dict
+        """
+
+        if luci_method in STATIC_RESPONSES:
+            return load_response(STATIC_RESPONSES[luci_method])
+
+        if luci_method in WRITE_METHODS:
+            return {"code": 0}
+
+        if luci_method == "xqsystem/reboot":
+            asyncio.get_running_loop().call_soon(self.reboot)
+
+            return {"code": 0}
+
+        if luci_method == "misystem/led":
+            return {"code": 0, "status": int(params.get("on", 1))}
+
+        if luci_method == "xqnetwork/mode":
+            return {"code": 0, "mode": int(self.mode)}
+
+        if luci_method == "xqsystem/init_info":
+            return load_response("init_info_data.json") | {
+                "model": self.model,
+                "hardware": self.hardware,
+                "routername": f"ROUTER {self.index}",
+            }
+
+        if luci_method == "misystem/status":
+            response: dict = load_response("status_data.json")
+            response["hardware"]["mac"] = self.mac
+            response["upTime"] = f"{time.monotonic() - self._boot:.2f}"
+            devices: int = len(self._device_list())
+            response["count"] = {
+                "all": devices,
+                "online": devices,
+                "all_without_mash": len(self.clients),
+                "online_without_mash": len(self.clients),
+            }
+
+            return response
+
+        if luci_method == "misystem/newstatus":
+            response = load_response("new_status_data.json")
+            response["hardware"]["mac"] = self.mac
+            response["count"] = len(self.clients)
+
+            return response
+
+        if luci_method == "misystem/devicelist":
+            return {"code": 0, "mac": self.mac, "list": self._device_list()}
+
+        if luci_method == "xqnetwork/wifi_connect_devices":
+            return {
+                "code": 0,
+                "list": [
+                    {
+                        "mac": client["mac"],
+                        "wifiIndex": client["type"],
+                        "signal": self._random.randint(20, 100),
+                    }
+                    for client in self.clients
+                    if client["type"] > 0
+                ],
+            }
+
+        return {"code": 404, "msg": f"Unknown method {luci_method}"}
+
+    def _device_list(self) -> list[dict]:
+        """Devices seen by router, a mesh main router lists clients of leaves.
+
+        :return list[dict]
+        """
+
+        if self.mode == Mode.REPEATER:
+            return []
+
+        devices: list[dict] = [self._device(client, "") for client in self.clients]
+
+        for leaf in self.leaves:
+            devices.append(
+                self._device({"mac": leaf.mac, "ip": leaf.ip, "name": "Leaf"}, "")
+            )
+            devices.extend(self._device(client, leaf.mac) for client in leaf.clients)
+
+        return devices
+
+    def _device(self, client: dict, parent: str) -> dict:
+        """Device list entry.
+
+        :param client: dict: Client
+        :param parent: str: MAC address of leaf the client is connected to
+        :return dict
+        """
+
+        statistics: dict = {
+            "downspeed": str(self._random.randint(0, 100000)),
+            "online": str(int(time.monotonic() - self._boot)),
+            "upspeed": str(self._random.randint(0, 10000)),
+        }
+
+        return {
+            "mac": client["mac"],
+            "oname": client["name"],
+            "name": client["name"],
+            "isap": 0,
+            "parent": parent,
+            "authority": {"wan": 1, "pridisk": 0, "admin": 1, "lan": 1},
+            "push": 0,
+            "online": 1,
+            "times": 0,
+            "ip": [statistics | {"active": 1, "ip": client["ip"]}],
+            "statistics": dict(statistics),
+            "icon": "",
+            "type": client.get("type", 0),
+        }
+
+
+class FakeLuciNetwork:
+    """Fake routers by ip address."""
+
+    def __init__(self, seed: int | None = None) -> None:
+        """Initialize network.
+
+        :param seed: int | None: Seed of injected faults
+        """
+
+        self.routers: dict[str, FakeRouter] = {}
+
+        self._seed: int | None = seed
+
+    def add_router(
+        self, ip: str, **kwargs: Any
+    ) -> FakeRouter:  # pylint: disable=invalid-name
+        """Add router.
+
+        :param ip: str: Router ip address
+        :param kwargs: Any: FakeRouter arguments
+        :return FakeRouter
+        """
+
+        router: FakeRouter = FakeRouter(
+            ip,
+            len(self.routers) + 1,
+            seed=None if self._seed is None else self._seed + len(self.routers),
+            **kwargs,
+        )
+
+        self.routers[ip] = router
+
+        return router
+
+    def add_leaf(
+        self, main: FakeRouter, ip: str, **kwargs: Any  # pylint: disable=invalid-name
+    ) -> FakeRouter:
+        """Add mesh leaf of main router.
+
+        :param main: FakeRouter: Main router
+        :param ip: str: Leaf ip address
+        :param kwargs: Any: FakeRouter arguments
+        :return FakeRouter
+        """
+
+        leaf: FakeRouter = self.add_router(ip, **kwargs)
+        leaf.mode = Mode.REPEATER
+        leaf.model = "xiaomi.router.r2100"
+        leaf.hardware = "R2100"
+
+        main.leaves.append(leaf)
+
+        return leaf
+
+    def client(self, hass: HomeAssistant) -> httpx.AsyncClient:
+        """Home Assistant httpx client reaching the fake routers.
+
+        :param hass: HomeAssistant: Home Assistant object
+        :return httpx.AsyncClient
+        """
+
+        return create_async_httpx_client(hass, False, transport=FakeLuciTransport(self))
+
+
+class FakeLuciTransport(httpx.AsyncBaseTransport):
+    """Transport to fake routers without sockets."""
+
+    def __init__(self, network: FakeLuciNetwork) -> None:
+        """Initialize transport.
+
+        :param network: FakeLuciNetwork: Fake routers
+        """
+
+        self.network = network
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer request by fake router.
+
+        :param request: httpx.Request: Request
+        :return httpx.Response
+        """
+
+        router: FakeRouter | None = self.network.routers.get(request.url.host)
+
+        if router is None or router.is_down:
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        params: dict[str, str] = dict(request.url.params)
+
+        if request.method == "POST":
+            params |= dict(urllib.parse.parse_qsl((await request.aread()).decode()))
+
+        answer: tuple[int, dict | str] | None = await router.async_handle(
+            request.method, request.url.path, params
+        )
+
+        if answer is None:
+            await asyncio.sleep(request.extensions.get("timeout", {}).get("read") or 0)
+
+            raise httpx.ReadTimeout("Timed out", request=request)
+
+        status, content = answer
+
+        return httpx.Response(
+            status,
+            content=content if isinstance(content, str) else json.dumps(content),
+        )
+
+
+async def async_serve(
+    network: FakeLuciNetwork, host: str = "127.0.0.1", port: int = 8080
+) -> list[web.AppRunner]:
+    """Serve every router on its own port, starting at port.
+
+    :param network: FakeLuciNetwork: Fake routers
+    :param host: str: Listen address
+    :param port: int: Port of first router
+    :return list[web.AppRunner]: Runners to clean up
+    """
+
+    runners: list[web.AppRunner] = []
+
+    for offset, router in enumerate(network.routers.values()):
+
+        async def _handle(request: web.Request, router=router) -> web.Response:
+            """Answer request by fake router.
+
+            :param request: web.Request: Request
+            :param router: FakeRouter: Fake router
+            :return web.Response
+            """
+
+            if router.is_down:
+                if request.transport is not None:
+                    request.transport.close()
+
+                raise web.HTTPServiceUnavailable()
+
+            params: dict[str, str] = dict(request.query)
+
+            if request.method == "POST":
+                params |= {
+                    key: str(value) for key, value in (await request.post()).items()
+                }
+
+            answer: tuple[int, dict | str] | None = await router.async_handle(
+                request.method, request.path, params
+            )
+
+            if answer is None:
+                await asyncio.Event().wait()
+
+            status, content = answer  # type: ignore
+
+            return web.Response(
+                status=status,
+                text=content if isinstance(content, str) else json.dumps(content),
+            )
+
+        app: web.Application = web.Application()
+        app.router.add_route("*", "/{path:.*}", _handle)
+
+        runner: web.AppRunner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, host, port + offset).start()
+
+        runners.append(runner)
+
+        _LOGGER.info(
+            "Fake router %s with %s clients on %s:%s",
+            router.ip,
+            len(router.clients),
+            host,
+            port + offset,
+        )
+
+    return runners
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run fake routers until interrupted.
+
+    :param args: argparse.Namespace: Command line arguments
+    """
+
+    network: FakeLuciNetwork = FakeLuciNetwork(args.seed)
+    main: FakeRouter = network.add_router(
+        "192.168.31.1", password=args.password, clients=args.clients
+    )
+
+    for number in range(args.leaves):
+        network.add_leaf(
+            main,
+            f"192.168.31.{number + 2}",
+            password=args.password,
+            clients=args.clients,
+        )
+
+    for router in network.routers.values():
+        router.faults.latency = args.latency
+        router.faults.jitter = args.jitter
+        router.faults.timeout_rate = args.timeout_rate
+        router.faults.error_rate = args.error_rate
+        router.faults.token_ttl = args.token_ttl
+
+    runners: list[web.AppRunner] = await async_serve(network, args.host, args.port)
+
+    try:
+        while True:
+            await asyncio.sleep(args.reboot_every or 3600)
+
+            if args.reboot_every:
+                main.reboot(args.reboot_duration)
+                _LOGGER.info("Fake router %s reboots", main.ip)
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake Luci routers")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--leaves", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--token-ttl", type=float, default=None)
+    parser.add_argument("--reboot-every", type=float, default=0.0)
+    parser.add_argument("--reboot-duration", type=float, default=DEFAULT_REBOOT)
+    parser.add_argument("--seed", type=int, default=None)
+
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        asyncio.run(_async_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
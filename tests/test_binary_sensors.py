@@ -35,7 +35,7 @@ from custom_components.miwifi.const import (
     DOMAIN,
     UPDATER,
 )
-from custom_components.miwifi.exceptions import LuciRequestError
+from custom_components.miwifi.exceptions import LuciTokenError
 from custom_components.miwifi.helper import generate_entity_id
 from custom_components.miwifi.updater import LuciUpdater
 from tests.setup import MultipleSideEffect, async_mock_luci_client, async_setup
@@ -132,7 +132,7 @@ async def test_update_state(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("status_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.status = AsyncMock(
             side_effect=MultipleSideEffect(success, error, error)
@@ -204,7 +204,7 @@ async def test_update_wan_state(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, error, error)
@@ -284,7 +284,7 @@ async def test_update_dual_band(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, success, success, error, error)
@@ -328,11 +328,6 @@ async def test_update_dual_band(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -384,7 +379,7 @@ async def test_update_vpn_state(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, success, success, error, error)
@@ -428,11 +423,6 @@ async def test_update_vpn_state(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
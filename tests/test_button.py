@@ -32,7 +32,7 @@ from custom_components.miwifi.const import (
     DOMAIN,
     UPDATER,
 )
-from custom_components.miwifi.exceptions import LuciRequestError
+from custom_components.miwifi.exceptions import LuciRequestError, LuciTokenError
 from custom_components.miwifi.helper import generate_entity_id
 from custom_components.miwifi.updater import LuciUpdater
 from tests.setup import MultipleSideEffect, async_mock_luci_client, async_setup
@@ -110,10 +110,10 @@ async def test_update_reboot(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
-            side_effect=MultipleSideEffect(success, error, error)
+            side_effect=MultipleSideEffect(success, error, success, error, error)
         )
 
         def success_reboot() -> dict:
@@ -154,7 +154,7 @@ async def test_update_reboot(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        _prev_calls: int = len(mock_luci_client.mock_calls)
+        _prev_probes: int = len(mock_luci_client.return_value.topo_graph.mock_calls)
 
         assert await hass.services.async_call(
             BUTTON_DOMAIN,
@@ -164,7 +164,13 @@ async def test_update_reboot(hass: HomeAssistant) -> None:
             limit=None,
         )
 
-        assert len(mock_luci_client.mock_calls) == _prev_calls + 1
+        assert len(mock_luci_client.return_value.reboot.mock_calls) == 1
+        await hass.async_block_till_done()
+
+        assert updater.lifecycle.is_online
+        assert len(mock_luci_client.return_value.topo_graph.mock_calls) > _prev_probes
+
+        _prev_probes = len(mock_luci_client.return_value.topo_graph.mock_calls)
 
         assert await hass.services.async_call(
             BUTTON_DOMAIN,
@@ -173,13 +179,19 @@ async def test_update_reboot(hass: HomeAssistant) -> None:
             blocking=True,
             limit=None,
         )
+        await hass.async_block_till_done()
 
-        assert len(mock_luci_client.mock_calls) == _prev_calls + 2
+        assert len(mock_luci_client.return_value.reboot.mock_calls) == 2
+        assert len(mock_luci_client.return_value.topo_graph.mock_calls) == _prev_probes
 
         async_fire_time_changed(
             hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
         )
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL * 2 + 1)
+        )
+        await hass.async_block_till_done()
 
         state = hass.states.get(unique_id)
         assert state.state == STATE_UNAVAILABLE
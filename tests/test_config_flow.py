@@ -21,12 +21,16 @@ from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry, load_fixture
 
 from custom_components.miwifi.const import (
+    ATTR_DEVICE_MODEL,
+    CONF_EXTRACTORS,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_TIMEOUT,
     DOMAIN,
     OPTION_IS_FROM_FLOW,
 )
 from custom_components.miwifi.exceptions import LuciConnectionError, LuciRequestError
+from custom_components.miwifi.updater import LuciUpdater, async_get_updater
+from tests.setup import async_mock_luci_client
 
 MOCK_IP_ADDRESS: Final = "192.168.31.1"
 MOCK_PASSWORD: Final = "**REDACTED**"
@@ -102,6 +106,51 @@ async def test_user(hass: HomeAssistant) -> None:
     assert len(mock_async_setup_entry.mock_calls) == 1
 
 
+@pytest.mark.asyncio
+async def test_user_handover(hass: HomeAssistant) -> None:
+    """Test new entry continues verified session.
+
+    :param hass: HomeAssistant
+    """
+
+    await setup.async_setup_component(hass, "http", {})
+    result_init = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.async_start_discovery", return_value=None
+    ), patch(
+        "custom_components.miwifi.device_tracker.socket.socket"
+    ) as mock_socket, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
+
+        await async_mock_luci_client(mock_luci_client)
+
+        result_configure = await hass.config_entries.flow.async_configure(
+            result_init["flow_id"],
+            {CONF_IP_ADDRESS: MOCK_IP_ADDRESS, CONF_PASSWORD: MOCK_PASSWORD},
+        )
+        await hass.async_block_till_done()
+
+        assert result_configure["type"] == data_entry_flow.RESULT_TYPE_CREATE_ENTRY
+
+        updater: LuciUpdater = async_get_updater(hass, MOCK_IP_ADDRESS)
+
+        assert updater.last_update_success
+        assert updater.data[ATTR_DEVICE_MODEL] == "xiaomi.router.ra67"
+
+    # Only the clean up of the config flow before its login
+    assert len(mock_luci_client.return_value.logout.mock_calls) == 1
+    assert len(mock_luci_client.return_value.login.mock_calls) == 1
+    assert len(mock_luci_client.return_value.init_info.mock_calls) == 1
+    assert len(mock_luci_client.return_value.restore_token.mock_calls) == 1
+
+
 @pytest.mark.asyncio
 async def test_user_ip_error(hass: HomeAssistant) -> None:
     """Test user config ip error.
@@ -414,6 +463,44 @@ async def test_options_flow_ip_error(hass: HomeAssistant) -> None:
     assert len(mock_luci_client.mock_calls) == 4
 
 
+@pytest.mark.asyncio
+async def test_options_flow_extractors_error(hass: HomeAssistant) -> None:
+    """Test options flow extractors error.
+
+    :param hass: HomeAssistant
+    """
+
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=OPTIONS_FLOW_DATA,
+        options={},
+    )
+    config_entry.add_to_hass(hass)
+
+    await setup.async_setup_component(hass, "http", {})
+
+    with patch("custom_components.miwifi.async_setup_entry", return_value=True,), patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        result_init = await hass.config_entries.options.async_init(
+            config_entry.entry_id
+        )
+
+        result_save = await hass.config_entries.options.async_configure(
+            result_init["flow_id"],
+            user_input=OPTIONS_FLOW_EDIT_DATA
+            | {CONF_EXTRACTORS: "Clients = xqnetwork/unknown list.*.mac"},
+        )
+
+    assert result_save["errors"] == {CONF_EXTRACTORS: "extractors.invalid"}
+    assert len(mock_luci_client.mock_calls) == 0
+
+
 @pytest.mark.asyncio
 async def test_options_flow_token_error(hass: HomeAssistant) -> None:
     """Test options flow token error.
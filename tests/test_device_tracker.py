@@ -22,6 +22,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 from homeassistant.util.dt import utcnow
 from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
@@ -1557,6 +1558,59 @@ async def test_init_detect_url(hass: HomeAssistant) -> None:
         assert device.configuration_url == "http://192.168.31.2"
 
 
+@pytest.mark.asyncio
+async def test_unchanged_snapshot(hass: HomeAssistant) -> None:
+    """Test unchanged device skips entry update.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.async_start_discovery", return_value=None
+    ), patch(
+        "custom_components.miwifi.device_tracker.socket.socket"
+    ) as mock_socket:
+        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
+
+        await async_mock_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        config_entry: MockConfigEntry = setup_data[1]
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+        )
+        await hass.async_block_till_done()
+
+        with patch(
+            "custom_components.miwifi.device_tracker.MiWifiDeviceTracker._update_entry"
+        ) as mock_update_entry:
+            async_fire_time_changed(
+                hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+            )
+            await hass.async_block_till_done()
+
+            assert len(mock_update_entry.mock_calls) == 0
+
+        state: State = hass.states.get(_generate_id("00:00:00:00:00:01"))
+        assert state.state == STATE_HOME
+
+        # Entity registry updates are still handled by the entity
+        er.async_get(hass).async_update_entity(
+            _generate_id("00:00:00:00:00:01"), name="Renamed"
+        )
+        await hass.async_block_till_done()
+
+        state = hass.states.get(_generate_id("00:00:00:00:00:01"))
+        assert state.state == STATE_HOME
+        assert state.attributes["friendly_name"] == "Renamed"
+
+
 def _generate_id(mac: str) -> str:
     """Generate unique id
 
@@ -10,7 +10,11 @@ import pytest
 from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
 from homeassistant.core import HomeAssistant
 
-from custom_components.miwifi.const import DOMAIN, EVENT_TYPE_RESPONSE
+from custom_components.miwifi.const import (
+    DOMAIN,
+    EVENT_TYPE_BATCH_RESPONSE,
+    EVENT_TYPE_RESPONSE,
+)
 from custom_components.miwifi.device_trigger import DEVICE, async_get_triggers
 
 _LOGGER = logging.getLogger(__name__)
@@ -36,5 +40,11 @@ async def test_get_triggers(hass: HomeAssistant) -> None:
             CONF_DEVICE_ID: "test",
             CONF_DOMAIN: DOMAIN,
             CONF_TYPE: EVENT_TYPE_RESPONSE,
-        }
+        },
+        {
+            CONF_PLATFORM: DEVICE,
+            CONF_DEVICE_ID: "test",
+            CONF_DOMAIN: DOMAIN,
+            CONF_TYPE: EVENT_TYPE_BATCH_RESPONSE,
+        },
     ]
@@ -0,0 +1,157 @@
+"""Tests for the miwifi component."""
+
+# pylint: disable=no-member,too-many-statements,protected-access,too-many-lines
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.miwifi.const import ATTR_STATE, DOMAIN, UPDATER
+from custom_components.miwifi.exceptions import (
+    LuciConnectionError,
+    LuciRequestError,
+    LuciTokenError,
+)
+from custom_components.miwifi.luci import LuciClient
+from custom_components.miwifi.updater import LuciUpdater
+from tests.fake_luci import FakeLuciNetwork, FakeRouter
+from tests.setup import MOCK_IP_ADDRESS, MOCK_PASSWORD, async_setup
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations"""
+
+    yield
+
+
+@pytest.mark.asyncio
+async def test_fake_luci_faults(hass: HomeAssistant) -> None:
+    """Test fake router login, sessions and injected faults.
+
+    :param hass: HomeAssistant
+    """
+
+    network: FakeLuciNetwork = FakeLuciNetwork(seed=1)
+    router: FakeRouter = network.add_router(MOCK_IP_ADDRESS, clients=300)
+    network.add_leaf(router, "192.168.31.62", clients=20)
+
+    with pytest.raises(LuciRequestError):
+        await LuciClient(network.client(hass), MOCK_IP_ADDRESS, "incorrect").login()
+
+    client: LuciClient = LuciClient(
+        network.client(hass), MOCK_IP_ADDRESS, "password", timeout=0
+    )
+
+    await client.login()
+
+    assert router.logins == 1
+    assert len((await client.device_list())["list"]) == 321
+    assert (await client.topo_graph())["graph"]["leafs"][0]["ip"] == "192.168.31.62"
+
+    router.expire_sessions()
+
+    with pytest.raises(LuciTokenError):
+        await client.status()
+
+    await client.login()
+    router.faults.token_ttl = 0
+
+    with pytest.raises(LuciTokenError):
+        await client.status()
+
+    router.faults.token_ttl = None
+    await client.login()
+    router.faults.error_rate = 1
+
+    with pytest.raises(LuciConnectionError):
+        await client.status()
+
+    router.faults.error_rate = 0
+    router.faults.timeout_rate = 1
+
+    with pytest.raises(LuciConnectionError):
+        await client.status()
+
+    router.faults.timeout_rate = 0
+    router.reboot()
+
+    with pytest.raises(LuciConnectionError):
+        await client.login()
+
+    router.reboot(0)
+    await client.login()
+
+    assert (await client.status())["code"] == 0
+    assert router.logins == 4
+    assert router.requests["misystem/status"] == 5
+
+
+@pytest.mark.asyncio
+async def test_fake_luci_updater(hass: HomeAssistant) -> None:
+    """Test updater polls large fake router through token expiry and reboot.
+
+    :param hass: HomeAssistant
+    """
+
+    network: FakeLuciNetwork = FakeLuciNetwork(seed=1)
+    router: FakeRouter = network.add_router(
+        MOCK_IP_ADDRESS, password=MOCK_PASSWORD, clients=500
+    )
+
+    with patch(
+        "custom_components.miwifi.updater.get_async_client",
+        return_value=network.client(hass),
+    ), patch("custom_components.miwifi.updater.async_dispatcher_send"), patch(
+        "custom_components.miwifi.async_start_discovery", return_value=None
+    ), patch(
+        "custom_components.miwifi.device_tracker.socket.socket"
+    ) as mock_socket, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
+
+        setup_data: list = await async_setup(hass)
+
+        config_entry: MockConfigEntry = setup_data[1]
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        updater: LuciUpdater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
+
+        assert updater.data[ATTR_STATE]
+        assert len(updater.devices) == 500
+        assert router.logins == 1
+
+        # Token error marks the session, the next poll logs in again
+        router.expire_sessions()
+        await updater.async_refresh()
+
+        assert updater.data[ATTR_STATE]
+        assert router.logins == 1
+
+        await updater.async_refresh()
+
+        assert updater.data[ATTR_STATE]
+        assert router.logins == 2
+
+        router.reboot()
+        await updater.async_refresh()
+
+        assert not updater.data[ATTR_STATE]
+
+        router.reboot(0)
+        await updater.async_refresh()
+        await updater.async_refresh()
+
+        assert updater.data[ATTR_STATE]
+        assert len(updater.devices) == 500
+        assert router.logins == 3
@@ -5,13 +5,16 @@
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_TIMEOUT
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.miwifi.const import DOMAIN, UPDATER
+from custom_components.miwifi.const import CONF_STAY_ONLINE, DOMAIN, PRESENCE, UPDATER
+from custom_components.miwifi.presence import async_get_presence
 from custom_components.miwifi.updater import LuciUpdater
 from tests.setup import async_mock_luci_client, async_setup
 
@@ -73,3 +76,100 @@ async def test_init(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
         assert len(mock_store.mock_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_unload(hass: HomeAssistant) -> None:
+    """Test unload of last entry stops presence timer wheel.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.updater.async_dispatcher_send"
+    ), patch(
+        "custom_components.miwifi.async_start_discovery", return_value=None
+    ), patch(
+        "custom_components.miwifi.device_tracker.socket.socket"
+    ) as mock_socket, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
+
+        await async_mock_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        config_entry: MockConfigEntry = setup_data[1]
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert PRESENCE in hass.data[DOMAIN]
+
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert PRESENCE not in hass.data[DOMAIN]
+
+
+@pytest.mark.asyncio
+async def test_update_options(hass: HomeAssistant) -> None:
+    """Test options are applied without reload.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.updater.async_dispatcher_send"
+    ), patch(
+        "custom_components.miwifi.async_start_discovery", return_value=None
+    ), patch(
+        "custom_components.miwifi.device_tracker.socket.socket"
+    ) as mock_socket, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
+
+        await async_mock_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        config_entry: MockConfigEntry = setup_data[1]
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        updater: LuciUpdater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
+
+        assert updater.presence_window == updater.update_interval.total_seconds() + 5
+
+        with patch.object(
+            hass.config_entries, "async_reload", AsyncMock()
+        ) as mock_reload:
+            hass.config_entries.async_update_entry(
+                config_entry,
+                options=dict(config_entry.data)
+                | {CONF_SCAN_INTERVAL: 120, CONF_TIMEOUT: 20, CONF_STAY_ONLINE: 600},
+            )
+            await hass.async_block_till_done()
+
+            assert len(mock_reload.mock_calls) == 0
+            assert updater.update_interval == timedelta(seconds=120)
+            assert updater.presence_window == 600
+            mock_luci_client.return_value.set_timeout.assert_called_once_with(20)
+
+            for mac in updater.devices:
+                assert async_get_presence(hass)._windows[mac] == 600
+
+            hass.config_entries.async_update_entry(
+                config_entry,
+                options=dict(config_entry.options) | {CONF_PASSWORD: "new"},
+            )
+            await hass.async_block_till_done()
+
+            assert len(mock_reload.mock_calls) == 1
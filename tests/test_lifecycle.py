@@ -0,0 +1,123 @@
+"""Tests for the miwifi component."""
+
+# pylint: disable=no-member,too-many-statements,protected-access,too-many-lines
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.miwifi.enum import RouterState
+from custom_components.miwifi.exceptions import LuciConnectionError, LuciRequestError
+from custom_components.miwifi.lifecycle import RouterLifecycle
+from tests.setup import MultipleSideEffect
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations"""
+
+    yield
+
+
+def _alive(timeout: int | None = None) -> dict:
+    return {"code": 0}
+
+
+def _down(timeout: int | None = None) -> None:
+    raise LuciConnectionError
+
+
+def _busy(timeout: int | None = None) -> None:
+    raise LuciRequestError
+
+
+@pytest.mark.asyncio
+async def test_reboot(hass: HomeAssistant) -> None:
+    """Test reboot.
+
+    :param hass: HomeAssistant
+    """
+
+    luci: Mock = Mock()
+    luci.ip = "192.168.31.1"
+    luci.topo_graph = AsyncMock(
+        side_effect=MultipleSideEffect(_alive, _down, _down, _busy)
+    )
+
+    states: list = []
+
+    lifecycle: RouterLifecycle = RouterLifecycle(hass, luci, states.append)
+
+    assert lifecycle.is_online
+    assert await lifecycle.async_wait_online(0)
+
+    with patch(
+        "custom_components.miwifi.lifecycle.asyncio.sleep", return_value=None
+    ) as mock_sleep:
+        lifecycle.async_begin(RouterState.REBOOTING)
+
+        assert not lifecycle.is_online
+        assert not await lifecycle.async_wait_online(0)
+
+        assert await lifecycle.async_wait_online()
+
+    assert lifecycle.is_online
+    assert states == [
+        RouterState.REBOOTING,
+        RouterState.RECOVERING,
+        RouterState.ONLINE,
+    ]
+    assert len(luci.topo_graph.mock_calls) == 4
+    assert [_call.args[0] for _call in mock_sleep.mock_calls] == [2, 4, 2, 4]
+
+
+@pytest.mark.asyncio
+async def test_never_went_down(hass: HomeAssistant) -> None:
+    """Test router that keeps answering.
+
+    :param hass: HomeAssistant
+    """
+
+    luci: Mock = Mock()
+    luci.ip = "192.168.31.1"
+    luci.topo_graph = AsyncMock(return_value={"code": 0})
+
+    states: list = []
+
+    lifecycle: RouterLifecycle = RouterLifecycle(hass, luci, states.append)
+
+    with patch("custom_components.miwifi.lifecycle.asyncio.sleep", return_value=None):
+        lifecycle.async_begin(RouterState.FLASHING)
+
+        assert await lifecycle.async_wait_online()
+
+    assert states == [RouterState.FLASHING, RouterState.ONLINE]
+    assert len(luci.topo_graph.mock_calls) == 9
+
+
+@pytest.mark.asyncio
+async def test_stop(hass: HomeAssistant) -> None:
+    """Test stop.
+
+    :param hass: HomeAssistant
+    """
+
+    luci: Mock = Mock()
+    luci.ip = "192.168.31.1"
+    luci.topo_graph = AsyncMock(side_effect=LuciConnectionError)
+
+    lifecycle: RouterLifecycle = RouterLifecycle(hass, luci)
+
+    lifecycle.async_begin(RouterState.REBOOTING)
+    lifecycle.async_stop()
+
+    await hass.async_block_till_done()
+
+    assert lifecycle.is_online
+    assert len(luci.topo_graph.mock_calls) == 0
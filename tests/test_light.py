@@ -26,13 +26,15 @@ from pytest_homeassistant_custom_component.common import (
 
 from custom_components.miwifi.const import (
     ATTR_DEVICE_MAC_ADDRESS,
+    ATTR_LIGHT_LED,
     ATTR_LIGHT_LED_NAME,
     ATTRIBUTION,
+    DEFAULT_CONFIRM_DELAY,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     UPDATER,
 )
-from custom_components.miwifi.exceptions import LuciRequestError
+from custom_components.miwifi.exceptions import LuciRequestError, LuciTokenError
 from custom_components.miwifi.helper import generate_entity_id
 from custom_components.miwifi.updater import LuciUpdater
 from tests.setup import MultipleSideEffect, async_mock_luci_client, async_setup
@@ -117,7 +119,7 @@ async def test_update_led(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, error, error)
@@ -138,6 +140,7 @@ async def test_update_led(hass: HomeAssistant) -> None:
                 error_led,
                 error_led,
                 success_led,
+                success_led,
             )
         )
 
@@ -196,9 +199,10 @@ async def test_update_led(hass: HomeAssistant) -> None:
         )
 
         state = hass.states.get(unique_id)
-        assert state.state == STATE_ON
-        assert state.attributes["icon"] == "mdi:led-on"
+        assert state.state == STATE_OFF
+        assert state.attributes["icon"] == "mdi:led-off"
         assert len(mock_luci_client.mock_calls) == _prev_calls + 3
+        assert ATTR_LIGHT_LED not in updater._overlay
 
         assert await hass.services.async_call(
             LIGHT_DOMAIN,
@@ -222,6 +226,82 @@ async def test_update_led(hass: HomeAssistant) -> None:
         assert state.state == STATE_UNAVAILABLE
 
 
+@pytest.mark.asyncio
+async def test_update_led_confirm(hass: HomeAssistant) -> None:
+    """Test update led confirm.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.async_start_discovery", return_value=None
+    ), patch(
+        "custom_components.miwifi.device_tracker.socket.socket"
+    ) as mock_socket, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        await async_mock_luci_client(mock_luci_client)
+
+        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
+
+        setup_data: list = await async_setup(hass)
+
+        config_entry: MockConfigEntry = setup_data[1]
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        updater: LuciUpdater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
+
+        assert updater.last_update_success
+
+        unique_id: str = _generate_id(ATTR_LIGHT_LED_NAME, updater)
+
+        _prev_calls: int = len(mock_luci_client.return_value.led.mock_calls)
+
+        assert await hass.services.async_call(
+            LIGHT_DOMAIN,
+            SERVICE_TURN_OFF,
+            {ATTR_ENTITY_ID: [unique_id]},
+            blocking=True,
+            limit=None,
+        )
+
+        assert await hass.services.async_call(
+            LIGHT_DOMAIN,
+            SERVICE_TURN_OFF,
+            {ATTR_ENTITY_ID: [unique_id]},
+            blocking=True,
+            limit=None,
+        )
+
+        state = hass.states.get(unique_id)
+        assert state.state == STATE_OFF
+        assert len(mock_luci_client.return_value.led.mock_calls) == _prev_calls + 2
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_CONFIRM_DELAY + 1)
+        )
+        await hass.async_block_till_done()
+
+        # The router still reports the led as on, the next poll settles it
+        state = hass.states.get(unique_id)
+        assert state.state == STATE_OFF
+        assert len(mock_luci_client.return_value.led.mock_calls) == _prev_calls + 3
+        assert ATTR_LIGHT_LED in updater._overlay
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+        )
+        await hass.async_block_till_done()
+
+        state = hass.states.get(unique_id)
+        assert state.state == STATE_ON
+        assert len(updater._overlay) == 0
+
+
 def _generate_id(code: str, updater: LuciUpdater) -> str:
     """Generate unique id
 
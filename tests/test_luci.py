@@ -14,11 +14,16 @@ from httpx import HTTPError, Request
 from pytest_homeassistant_custom_component.common import get_fixture_path, load_fixture
 from pytest_httpx import HTTPXMock
 
+from custom_components.miwifi.const import (
+    ATTR_SENSOR_LATENCY_P95,
+    ATTR_SENSOR_REQUESTS_PER_MINUTE,
+)
 from custom_components.miwifi.enum import EncryptionAlgorithm
 from custom_components.miwifi.exceptions import (
     LuciConnectionError,
     LuciError,
     LuciRequestError,
+    LuciTokenError,
 )
 from custom_components.miwifi.luci import LuciClient
 from tests.setup import MOCK_IP_ADDRESS, get_url
@@ -161,6 +166,13 @@ async def test_get(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     assert request.url == get_url("misystem/miwifi")
     assert request.method == "GET"
 
+    assert client.metrics.logins == 1
+    assert client.metrics.bytes_received == len('{"code": 0}')
+    assert client.metrics.value(ATTR_SENSOR_REQUESTS_PER_MINUTE) == 1
+    assert list(client.metrics.attributes(ATTR_SENSOR_LATENCY_P95)) == [
+        "misystem/miwifi"
+    ]
+
 
 @pytest.mark.asyncio
 async def test_get_sha256(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
@@ -242,6 +254,23 @@ async def test_get_error_code(hass: HomeAssistant, httpx_mock: HTTPXMock) -> Non
     assert str(error.value) == "custom errors"
 
 
+@pytest.mark.asyncio
+async def test_get_invalid_token(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """get test"""
+
+    httpx_mock.add_response(text=load_fixture("login_data.json"), method="POST")
+    httpx_mock.add_response(text='{"code": 401, "msg": "Invalid token"}', method="GET")
+
+    client: LuciClient = LuciClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", "test"
+    )
+
+    await client.login()
+
+    with pytest.raises(LuciTokenError):
+        await client.get("misystem/miwifi")
+
+
 @pytest.mark.asyncio
 async def test_topo_graph(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     """topo_graph test"""
@@ -781,3 +810,36 @@ def _get_image_fixture(path: str) -> bytes:
     """Get image fixture"""
 
     return get_fixture_path(path, None).read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_profile(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """profile test"""
+
+    httpx_mock.add_response(text=load_fixture("login_data.json"), method="POST")
+    httpx_mock.add_response(
+        text=load_fixture("status_data.json"),
+        method="GET",
+        url=get_url("misystem/status"),
+    )
+    httpx_mock.add_response(
+        text='{"code": 401}', method="GET", url=get_url("misystem/led")
+    )
+    httpx_mock.add_exception(HTTPError("error"), url=get_url("misystem/newstatus"))
+
+    client: LuciClient = LuciClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", "test"
+    )
+
+    assert (await client.profile("misystem/status"))["error"] == "token"
+
+    await client.login()
+
+    result: dict = await client.profile("misystem/status")
+
+    assert result["error"] is None
+    assert result["size"] == len(load_fixture("status_data.json").encode())
+    assert result["latency"] > 0
+
+    assert (await client.profile("misystem/led"))["error"] == "401"
+    assert (await client.profile("misystem/newstatus"))["error"] == "HTTPError"
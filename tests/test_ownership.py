@@ -0,0 +1,91 @@
+"""Tests for the miwifi component."""
+
+# pylint: disable=no-member,too-many-statements,protected-access,too-many-lines
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.miwifi.enum import DeviceAction
+from custom_components.miwifi.ownership import DeviceOwnership, async_get_ownership
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations"""
+
+    yield
+
+
+@pytest.mark.asyncio
+async def test_ownership(hass: HomeAssistant) -> None:
+    """Test conflicting claims are reconciled independent of order.
+
+    :param hass: HomeAssistant
+    """
+
+    ownership: DeviceOwnership = async_get_ownership(hass)
+
+    assert async_get_ownership(hass) is ownership
+
+    assert ownership.async_reconcile(
+        "192.168.31.2",
+        {"00:00:00:00:00:01": "192.168.31.2", "00:00:00:00:00:02": "192.168.31.2"},
+    ) == {"00:00:00:00:00:01": "192.168.31.2", "00:00:00:00:00:02": "192.168.31.2"}
+
+    assert ownership.async_reconcile(
+        "192.168.31.1", {"00:00:00:00:00:01": "192.168.31.100"}
+    ) == {"00:00:00:00:00:01": "192.168.31.100"}
+
+    assert (
+        ownership.async_reconcile(
+            "192.168.31.2",
+            {"00:00:00:00:00:01": "192.168.31.2", "00:00:00:00:00:02": "192.168.31.2"},
+        )
+        == {}
+    )
+
+    assert ownership.is_owner("00:00:00:00:00:01", "192.168.31.100")
+    assert not ownership.is_owner("00:00:00:00:00:01", "192.168.31.2")
+    assert ownership.is_owner("00:00:00:00:00:03", "192.168.31.2")
+
+    ownership.async_release("192.168.31.1")
+
+    assert ownership.owners == {
+        "00:00:00:00:00:01": "192.168.31.2",
+        "00:00:00:00:00:02": "192.168.31.2",
+    }
+
+    ownership.async_release("192.168.31.2")
+
+    assert not ownership.owners
+
+    # Lowest address wins numerically, not as string
+    ownership.async_reconcile("192.168.31.100", {"00:00:00:00:00:01": "192.168.31.100"})
+    ownership.async_reconcile("192.168.31.62", {"00:00:00:00:00:01": "192.168.31.62"})
+
+    assert ownership.is_owner("00:00:00:00:00:01", "192.168.31.62")
+
+    # Routers set up by hostname come after addresses
+    ownership.async_reconcile("miwifi.com", {"00:00:00:00:00:01": "miwifi.com"})
+
+    assert ownership.is_owner("00:00:00:00:00:01", "192.168.31.62")
+
+    ownership.async_release("192.168.31.62")
+    ownership.async_release("192.168.31.100")
+
+    assert ownership.is_owner("00:00:00:00:00:01", "miwifi.com")
+
+    ownership.async_hand_over(
+        "192.168.31.62", {"mac": "00:00:00:00:00:01"}, DeviceAction.UPDATE
+    )
+
+    assert ownership.async_take("192.168.31.62") == {
+        "00:00:00:00:00:01": ({"mac": "00:00:00:00:00:01"}, DeviceAction.UPDATE)
+    }
+    assert ownership.async_take("192.168.31.62") == {}
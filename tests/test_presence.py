@@ -0,0 +1,199 @@
+"""Tests for the miwifi component."""
+
+# pylint: disable=no-member,too-many-statements,protected-access,too-many-lines
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util.dt import utcnow
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.miwifi.const import DOMAIN, PRESENCE
+from custom_components.miwifi.presence import PresenceTimerWheel, async_get_presence
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations"""
+
+    yield
+
+
+@pytest.mark.asyncio
+async def test_expire(hass: HomeAssistant) -> None:
+    """Test expire.
+
+    :param hass: HomeAssistant
+    """
+
+    presence: PresenceTimerWheel = async_get_presence(hass)
+
+    assert hass.data[DOMAIN][PRESENCE] is presence
+    assert async_get_presence(hass) is presence
+
+    changes: list = []
+
+    presence.async_seen("00:00:00:00:00:01")
+    unsub = presence.async_register("00:00:00:00:00:01", 60, changes.append)
+
+    assert presence.is_connected("00:00:00:00:00:01")
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+
+    assert presence.is_connected("00:00:00:00:00:01")
+    assert len(changes) == 0
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+
+    assert not presence.is_connected("00:00:00:00:00:01")
+    assert changes == [False]
+
+    presence.async_seen("00:00:00:00:00:01")
+    presence.async_seen("00:00:00:00:00:01")
+
+    assert presence.is_connected("00:00:00:00:00:01")
+    assert changes == [False, True]
+
+    unsub()
+    presence.async_stop()
+
+    assert not presence.is_connected("00:00:00:00:00:01")
+
+
+@pytest.mark.asyncio
+async def test_restored_device(hass: HomeAssistant) -> None:
+    """Test restored device.
+
+    :param hass: HomeAssistant
+    """
+
+    presence: PresenceTimerWheel = async_get_presence(hass)
+
+    changes: list = []
+
+    presence.async_register("00:00:00:00:00:05", 60, changes.append)
+
+    assert not presence.is_connected("00:00:00:00:00:05")
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+
+    assert len(changes) == 0
+
+    presence.async_seen("00:00:00:00:00:05")
+
+    assert presence.is_connected("00:00:00:00:00:05")
+    assert changes == [True]
+
+    presence.async_forget("00:00:00:00:00:05")
+
+    assert not presence.is_connected("00:00:00:00:00:05")
+
+    presence.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_reset_keeps_single_expiry(hass: HomeAssistant) -> None:
+    """Test seen resets pending expiry.
+
+    :param hass: HomeAssistant
+    """
+
+    presence: PresenceTimerWheel = async_get_presence(hass)
+
+    changes: list = []
+
+    presence.async_seen("00:00:00:00:00:01")
+    presence.async_register("00:00:00:00:00:01", 60, changes.append)
+
+    presence.async_seen("00:00:00:00:00:02")
+    presence.async_register(
+        "00:00:00:00:00:02", 10, lambda state: changes.append(("2", state))
+    )
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+
+    assert changes == [("2", False)]
+    assert presence.is_connected("00:00:00:00:00:01")
+
+    presence.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_set_window(hass: HomeAssistant) -> None:
+    """Test changed window reschedules expiry.
+
+    :param hass: HomeAssistant
+    """
+
+    presence: PresenceTimerWheel = async_get_presence(hass)
+
+    changes: list = []
+
+    presence.async_seen("00:00:00:00:00:07")
+    unsub = presence.async_register("00:00:00:00:00:07", 60, changes.append)
+
+    presence.async_set_window("00:00:00:00:00:07", 300)
+    presence.async_set_window("00:00:00:00:00:08", 300)
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+
+    assert presence.is_connected("00:00:00:00:00:07")
+
+    presence.async_set_window("00:00:00:00:00:07", 10)
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=62))
+    await hass.async_block_till_done()
+
+    assert not presence.is_connected("00:00:00:00:00:07")
+    assert changes == [False]
+
+    unsub()
+    presence.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_prune_last_seen(hass: HomeAssistant) -> None:
+    """Test last seen time is forgotten once it lapses.
+
+    :param hass: HomeAssistant
+    """
+
+    presence: PresenceTimerWheel = async_get_presence(hass)
+
+    changes: list = []
+
+    presence.async_seen("00:00:00:00:00:01")
+    unsub = presence.async_register("00:00:00:00:00:01", 60, changes.append)
+    presence.async_seen("00:00:00:00:00:02")
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+
+    assert changes == [False]
+    assert "00:00:00:00:00:01" not in presence._last_seen
+
+    presence.async_seen("00:00:00:00:00:01")
+    unsub()
+
+    assert set(presence._last_seen) == {"00:00:00:00:00:01", "00:00:00:00:00:02"}
+
+    with patch.object(
+        presence.hass.loop, "time", return_value=presence.hass.loop.time() + 61
+    ):
+        presence._async_sweep()
+
+    assert presence._last_seen == {}
+
+    presence.async_stop()
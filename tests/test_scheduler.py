@@ -0,0 +1,264 @@
+"""Tests for the miwifi component."""
+
+# pylint: disable=no-member,too-many-statements,protected-access,too-many-lines
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.miwifi.enum import Model, RequestPriority
+from custom_components.miwifi.governor import (
+    DEFAULT_REQUEST_LIMITS,
+    LEGACY_REQUEST_LIMITS,
+    MODEL_DEFAULT_REQUEST_LIMITS,
+    RequestGovernor,
+    async_get_governor,
+)
+from custom_components.miwifi.scheduler import RequestScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations"""
+
+    yield
+
+
+async def _async_request(
+    scheduler: RequestScheduler,
+    priority: RequestPriority,
+    name: str,
+    order: list,
+    release: asyncio.Event | None = None,
+) -> None:
+    """Fake request.
+
+    :param scheduler: RequestScheduler
+    :param priority: RequestPriority
+    :param name: str
+    :param order: list
+    :param release: asyncio.Event | None
+    """
+
+    async with scheduler.async_slot(priority):
+        order.append(name)
+
+        if release is not None:
+            await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_priority(hass: HomeAssistant) -> None:
+    """Test interactive requests are served first.
+
+    :param hass: HomeAssistant
+    """
+
+    scheduler: RequestScheduler = RequestScheduler(1)
+
+    order: list = []
+    release: asyncio.Event = asyncio.Event()
+
+    slow = asyncio.create_task(
+        _async_request(scheduler, RequestPriority.BACKGROUND, "slow", order, release)
+    )
+    await asyncio.sleep(0)
+
+    assert scheduler.active == 1
+
+    tasks: list = [
+        asyncio.create_task(
+            _async_request(scheduler, RequestPriority.BACKGROUND, "status", order)
+        ),
+        asyncio.create_task(
+            _async_request(scheduler, RequestPriority.PRESENCE, "device_list", order)
+        ),
+        asyncio.create_task(
+            _async_request(scheduler, RequestPriority.INTERACTIVE, "led", order)
+        ),
+    ]
+    await asyncio.sleep(0)
+
+    assert scheduler.waiting == 3
+
+    release.set()
+    await asyncio.gather(slow, *tasks)
+
+    assert order == ["slow", "led", "device_list", "status"]
+    assert scheduler.active == 0
+    assert scheduler.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_background_deferred(hass: HomeAssistant) -> None:
+    """Test background requests wait for interactive commands.
+
+    :param hass: HomeAssistant
+    """
+
+    scheduler: RequestScheduler = RequestScheduler(2)
+
+    order: list = []
+    release: asyncio.Event = asyncio.Event()
+
+    command = asyncio.create_task(
+        _async_request(scheduler, RequestPriority.INTERACTIVE, "reboot", order, release)
+    )
+    await asyncio.sleep(0)
+
+    poll = asyncio.create_task(
+        _async_request(scheduler, RequestPriority.BACKGROUND, "status", order)
+    )
+    await asyncio.sleep(0)
+
+    assert scheduler.active == 1
+    assert scheduler.waiting == 1
+
+    release.set()
+    await asyncio.gather(command, poll)
+
+    assert order == ["reboot", "status"]
+
+
+@pytest.mark.asyncio
+async def test_cancel(hass: HomeAssistant) -> None:
+    """Test cancelled waiter frees its place.
+
+    :param hass: HomeAssistant
+    """
+
+    scheduler: RequestScheduler = RequestScheduler(1)
+
+    order: list = []
+    release: asyncio.Event = asyncio.Event()
+
+    slow = asyncio.create_task(
+        _async_request(scheduler, RequestPriority.BACKGROUND, "slow", order, release)
+    )
+    await asyncio.sleep(0)
+
+    command = asyncio.create_task(
+        _async_request(scheduler, RequestPriority.INTERACTIVE, "led", order)
+    )
+    poll = asyncio.create_task(
+        _async_request(scheduler, RequestPriority.BACKGROUND, "status", order)
+    )
+    await asyncio.sleep(0)
+
+    command.cancel()
+    await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(slow, poll)
+
+    assert order == ["slow", "status"]
+    assert scheduler.active == 0
+
+
+@pytest.mark.asyncio
+async def test_rate(hass: HomeAssistant) -> None:
+    """Test requests beyond burst are paced by rate.
+
+    :param hass: HomeAssistant
+    """
+
+    scheduler: RequestScheduler = RequestScheduler(1, 100, 2)
+
+    order: list = []
+    started: float = hass.loop.time()
+
+    for name in range(5):
+        await _async_request(scheduler, RequestPriority.BACKGROUND, str(name), order)
+
+    assert hass.loop.time() - started >= 0.025
+    assert scheduler.metrics["requests"] == 5
+    assert scheduler.metrics["queue_delay_max"] > 0
+
+
+@pytest.mark.asyncio
+async def test_rate_cancel(hass: HomeAssistant) -> None:
+    """Test cancelled request refunds its token.
+
+    :param hass: HomeAssistant
+    """
+
+    scheduler: RequestScheduler = RequestScheduler(1, 1, 1)
+
+    order: list = []
+
+    await _async_request(scheduler, RequestPriority.BACKGROUND, "first", order)
+
+    waiting = asyncio.create_task(
+        _async_request(scheduler, RequestPriority.BACKGROUND, "second", order)
+    )
+    await asyncio.sleep(0)
+
+    assert scheduler._tokens < 0
+
+    waiting.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    assert order == ["first"]
+    assert scheduler.active == 0
+    assert 0 <= scheduler._tokens < 1
+
+
+@pytest.mark.asyncio
+async def test_governor(hass: HomeAssistant) -> None:
+    """Test routers share limiter and model limits.
+
+    :param hass: HomeAssistant
+    """
+
+    governor: RequestGovernor = RequestGovernor(1)
+
+    first: RequestScheduler = governor.scheduler("192.168.31.1/")
+
+    assert governor.scheduler("192.168.31.1") is first
+    assert async_get_governor(hass) is async_get_governor(hass)
+
+    order: list = []
+    release: asyncio.Event = asyncio.Event()
+
+    slow = asyncio.create_task(
+        _async_request(first, RequestPriority.BACKGROUND, "slow", order, release)
+    )
+    await asyncio.sleep(0)
+
+    other = asyncio.create_task(
+        _async_request(
+            governor.scheduler("192.168.31.62"),
+            RequestPriority.INTERACTIVE,
+            "led",
+            order,
+        )
+    )
+    await asyncio.sleep(0)
+
+    assert order == ["slow"]
+
+    release.set()
+    await asyncio.gather(slow, other)
+
+    assert order == ["slow", "led"]
+    assert governor.metrics["192.168.31.62"]["requests"] == 1
+
+    governor.configure("192.168.31.1", Model.R3)
+
+    assert (first.slots, first.rate, first.burst) == LEGACY_REQUEST_LIMITS
+
+    governor.configure("192.168.31.1", Model.RA67)
+
+    assert (first.slots, first.rate, first.burst) == MODEL_DEFAULT_REQUEST_LIMITS
+
+    governor.configure("192.168.31.1", Model.NOT_KNOWN)
+
+    assert (first.slots, first.rate, first.burst) == DEFAULT_REQUEST_LIMITS
@@ -44,7 +44,7 @@ from custom_components.miwifi.const import (
     DOMAIN,
     UPDATER,
 )
-from custom_components.miwifi.exceptions import LuciRequestError
+from custom_components.miwifi.exceptions import LuciRequestError, LuciTokenError
 from custom_components.miwifi.helper import generate_entity_id
 from custom_components.miwifi.updater import LuciUpdater
 from tests.setup import MultipleSideEffect, async_mock_luci_client, async_setup
@@ -209,7 +209,7 @@ async def test_update_channel_2_4(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, success, success, error, error)
@@ -243,11 +243,6 @@ async def test_update_channel_2_4(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -419,11 +414,6 @@ async def test_update_channel_2_4_wifi_data(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
 
         assert entry.disabled_by is None
@@ -565,7 +555,7 @@ async def test_update_channel_5_0(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, success, success, error, error)
@@ -599,11 +589,6 @@ async def test_update_channel_5_0(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -854,11 +839,6 @@ async def test_update_channel_5_0_wifi_data(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
 
         assert entry.disabled_by is None
@@ -972,7 +952,7 @@ async def test_update_channel_5_0_change_channel(hass: HomeAssistant) -> None:
         )
 
         state = hass.states.get(unique_id)
-        assert state.state == "44"
+        assert state.state == "48"
         assert len(mock_luci_client.mock_calls) == _prev_calls + 2
 
 
@@ -1000,7 +980,7 @@ async def test_update_channel_5_0_game(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, success, success, error, error)
@@ -1038,11 +1018,6 @@ async def test_update_channel_5_0_game(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -1220,11 +1195,6 @@ async def test_update_channel_5_0_game_wifi_data(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
 
         assert entry.disabled_by is None
@@ -1342,7 +1312,7 @@ async def test_update_channel_5_0_game_change_channel(hass: HomeAssistant) -> No
         )
 
         state = hass.states.get(unique_id)
-        assert state.state == "40"
+        assert state.state == "36"
         assert len(mock_luci_client.mock_calls) == _prev_calls + 2
 
 
@@ -1370,7 +1340,7 @@ async def test_update_strength_2_4(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, success, success, error, error)
@@ -1406,11 +1376,6 @@ async def test_update_strength_2_4(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -1520,11 +1485,6 @@ async def test_update_strength_2_4_wifi_data(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
 
         assert entry.disabled_by is None
@@ -1645,8 +1605,8 @@ async def test_update_strength_2_4_change_strength(hass: HomeAssistant) -> None:
         )
 
         state = hass.states.get(unique_id)
-        assert state.state == "mid"
-        assert state.attributes["icon"] == "mdi:wifi-strength-2"
+        assert state.state == "min"
+        assert state.attributes["icon"] == "mdi:wifi-strength-1"
         assert len(mock_luci_client.mock_calls) == _prev_calls + 2
 
 
@@ -1674,7 +1634,7 @@ async def test_update_strength_5_0(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, success, success, error, error)
@@ -1710,11 +1670,6 @@ async def test_update_strength_5_0(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -1824,11 +1779,6 @@ async def test_update_strength_5_0_wifi_data(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
 
         assert entry.disabled_by is None
@@ -1948,8 +1898,8 @@ async def test_update_strength_5_0_change_channel(hass: HomeAssistant) -> None:
         )
 
         state = hass.states.get(unique_id)
-        assert state.state == "mid"
-        assert state.attributes["icon"] == "mdi:wifi-strength-2"
+        assert state.state == "min"
+        assert state.attributes["icon"] == "mdi:wifi-strength-1"
         assert len(mock_luci_client.mock_calls) == _prev_calls + 2
 
 
@@ -1977,7 +1927,7 @@ async def test_update_strength_5_0_game(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, success, success, error, error)
@@ -2017,11 +1967,6 @@ async def test_update_strength_5_0_game(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -2133,11 +2078,6 @@ async def test_update_strength_5_0_game_wifi_data(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
 
         assert entry.disabled_by is None
@@ -2261,8 +2201,8 @@ async def test_update_strength_5_0_game_change_strength(hass: HomeAssistant) ->
         )
 
         state = hass.states.get(unique_id)
-        assert state.state == "mid"
-        assert state.attributes["icon"] == "mdi:wifi-strength-2"
+        assert state.state == "min"
+        assert state.attributes["icon"] == "mdi:wifi-strength-1"
         assert len(mock_luci_client.mock_calls) == _prev_calls + 2
 
 
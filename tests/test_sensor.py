@@ -31,20 +31,24 @@ from custom_components.miwifi.const import (
     ATTR_SENSOR_DEVICES_GUEST_NAME,
     ATTR_SENSOR_DEVICES_LAN_NAME,
     ATTR_SENSOR_DEVICES_NAME,
+    ATTR_SENSOR_FAILURES,
     ATTR_SENSOR_MEMORY_TOTAL_NAME,
     ATTR_SENSOR_MEMORY_USAGE_NAME,
     ATTR_SENSOR_MODE_NAME,
+    ATTR_SENSOR_POLL_DURATION,
     ATTR_SENSOR_TEMPERATURE_NAME,
+    ATTR_SENSOR_TRACKED_DEVICES_NAME,
     ATTR_SENSOR_UPTIME_NAME,
     ATTR_SENSOR_VPN_UPTIME_NAME,
     ATTR_SENSOR_WAN_DOWNLOAD_SPEED_NAME,
     ATTR_SENSOR_WAN_UPLOAD_SPEED_NAME,
     ATTRIBUTION,
+    CONF_EXTRACTORS,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     UPDATER,
 )
-from custom_components.miwifi.exceptions import LuciRequestError
+from custom_components.miwifi.exceptions import LuciTokenError
 from custom_components.miwifi.helper import generate_entity_id
 from custom_components.miwifi.updater import LuciUpdater
 from tests.setup import MultipleSideEffect, async_mock_luci_client, async_setup
@@ -459,6 +463,22 @@ async def test_init_without_wan(
         assert hass.states.get(unique_id) is None
         assert registry.async_get(unique_id) is None
 
+        mock_luci_client.return_value.wan_info = AsyncMock(
+            return_value=json.loads(load_fixture("wan_info_data.json"))
+        )
+
+        with patch.object(hass.config_entries, "async_reload") as mock_reload:
+            async_fire_time_changed(
+                hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+            )
+            await hass.async_block_till_done()
+
+            assert len(mock_reload.mock_calls) == 0
+
+        unique_id = _generate_id(ATTR_SENSOR_WAN_DOWNLOAD_SPEED_NAME, updater)
+        assert hass.states.get(unique_id) is not None
+        assert registry.async_get(unique_id) is not None
+
 
 @pytest.mark.asyncio
 async def test_update_uptime(hass: HomeAssistant) -> None:
@@ -484,7 +504,7 @@ async def test_update_uptime(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, success, success, error, error)
@@ -528,11 +548,6 @@ async def test_update_uptime(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -584,7 +599,7 @@ async def test_update_vpn_uptime(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, success, success, error, error)
@@ -628,11 +643,6 @@ async def test_update_vpn_uptime(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -684,7 +694,7 @@ async def test_update_memory_usage(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, success, success, error, error)
@@ -728,11 +738,6 @@ async def test_update_memory_usage(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -784,7 +789,7 @@ async def test_update_memory_total(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, success, success, error, error)
@@ -828,11 +833,6 @@ async def test_update_memory_total(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -884,7 +884,7 @@ async def test_update_temperature(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, success, success, error, error)
@@ -928,11 +928,6 @@ async def test_update_temperature(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -984,7 +979,7 @@ async def test_update_mode(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("wifi_connect_devices_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.wifi_connect_devices = AsyncMock(
             side_effect=MultipleSideEffect(success, error, error)
@@ -1064,7 +1059,7 @@ async def test_update_ap_signal(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("new_status_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.new_status = AsyncMock(
             side_effect=MultipleSideEffect(success, error, error)
@@ -1148,7 +1143,7 @@ async def test_update_download_speed(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("wifi_connect_devices_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.wifi_connect_devices = AsyncMock(
             side_effect=MultipleSideEffect(success, error, error)
@@ -1228,7 +1223,7 @@ async def test_update_upload_speed(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("wifi_connect_devices_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.wifi_connect_devices = AsyncMock(
             side_effect=MultipleSideEffect(success, error, error)
@@ -1308,7 +1303,7 @@ async def test_update_devices(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("wifi_connect_devices_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.wifi_connect_devices = AsyncMock(
             side_effect=MultipleSideEffect(success, success, error, error)
@@ -1361,7 +1356,7 @@ async def test_update_devices(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
         state = hass.states.get(unique_id)
-        assert state.state == "0"
+        assert state.state == "2"
 
         async_fire_time_changed(
             hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
@@ -1396,7 +1391,7 @@ async def test_update_devices_lan(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("wifi_connect_devices_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.wifi_connect_devices = AsyncMock(
             side_effect=MultipleSideEffect(
@@ -1442,11 +1437,6 @@ async def test_update_devices_lan(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -1506,7 +1496,7 @@ async def test_update_devices_2_4(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("wifi_connect_devices_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.wifi_connect_devices = AsyncMock(
             side_effect=MultipleSideEffect(
@@ -1552,11 +1542,6 @@ async def test_update_devices_2_4(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -1581,7 +1566,7 @@ async def test_update_devices_2_4(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
         state = hass.states.get(unique_id)
-        assert state.state == "0"
+        assert state.state == "2"
 
         async_fire_time_changed(
             hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
@@ -1616,7 +1601,7 @@ async def test_update_devices_5_0(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("wifi_connect_devices_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.wifi_connect_devices = AsyncMock(
             side_effect=MultipleSideEffect(
@@ -1662,11 +1647,6 @@ async def test_update_devices_5_0(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -1691,7 +1671,7 @@ async def test_update_devices_5_0(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
         state = hass.states.get(unique_id)
-        assert state.state == "0"
+        assert state.state == "2"
 
         async_fire_time_changed(
             hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
@@ -1726,7 +1706,7 @@ async def test_update_devices_guest(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("wifi_connect_devices_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.wifi_connect_devices = AsyncMock(
             side_effect=MultipleSideEffect(
@@ -1772,11 +1752,6 @@ async def test_update_devices_guest(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -1801,7 +1776,7 @@ async def test_update_devices_guest(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
         state = hass.states.get(unique_id)
-        assert state.state == "0"
+        assert state.state == "1"
 
         async_fire_time_changed(
             hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
@@ -1840,7 +1815,7 @@ async def test_update_devices_5_0_game(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("wifi_connect_devices_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.wifi_connect_devices = AsyncMock(
             side_effect=MultipleSideEffect(
@@ -1886,11 +1861,6 @@ async def test_update_devices_5_0_game(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -1915,7 +1885,7 @@ async def test_update_devices_5_0_game(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
         state = hass.states.get(unique_id)
-        assert state.state == "0"
+        assert state.state == "1"
 
         async_fire_time_changed(
             hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
@@ -1926,6 +1896,153 @@ async def test_update_devices_5_0_game(hass: HomeAssistant) -> None:
         assert state.state == STATE_UNAVAILABLE
 
 
+@pytest.mark.asyncio
+async def test_extractors(hass: HomeAssistant) -> None:
+    """Test extractor sensors.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.async_start_discovery", return_value=None
+    ), patch(
+        "custom_components.miwifi.device_tracker.socket.socket"
+    ) as mock_socket, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        await async_mock_luci_client(mock_luci_client)
+
+        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
+
+        def original() -> dict:
+            return json.loads(load_fixture("status_data.json"))
+
+        def change() -> dict:
+            status: dict = json.loads(load_fixture("status_data.json"))
+            status["count"]["online"] = 24
+
+            return status
+
+        mock_luci_client.return_value.status = AsyncMock(
+            side_effect=MultipleSideEffect(original, original, change)
+        )
+
+        setup_data: list = await async_setup(hass)
+
+        config_entry: MockConfigEntry = setup_data[1]
+
+        hass.config_entries.async_update_entry(
+            config_entry,
+            data=config_entry.data
+            | {
+                CONF_EXTRACTORS: "Online = misystem/status count.online pcs\n"
+                + "Device macs = misystem/devicelist list.*.mac\n"
+                + "Broken = misystem/status not.found",
+            },
+        )
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        updater: LuciUpdater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
+
+        online_id: str = _generate_id("Online", updater)
+        macs_id: str = _generate_id("Device macs", updater)
+
+        state: State = hass.states.get(online_id)
+        assert state.state == "23"
+        assert state.attributes["unit_of_measurement"] == "pcs"
+        assert state.attributes["icon"] == "mdi:code-json"
+        assert er.async_get(hass).async_get(online_id).entity_category == (
+            EntityCategory.DIAGNOSTIC
+        )
+
+        state = hass.states.get(macs_id)
+        assert state.state == "3"
+        assert state.attributes["value"] == [
+            "00:00:00:00:00:01",
+            "00:00:00:00:00:02",
+            "00:00:00:00:00:03",
+        ]
+
+        assert hass.states.get(_generate_id("Broken", updater)).state == "unknown"
+
+        last_updated = hass.states.get(online_id).last_updated
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+        )
+        await hass.async_block_till_done()
+
+        assert hass.states.get(online_id).last_updated == last_updated
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+        )
+        await hass.async_block_till_done()
+
+        assert hass.states.get(online_id).state == "24"
+        assert len(mock_luci_client.return_value.get.mock_calls) == 0
+
+
+@pytest.mark.asyncio
+async def test_metric_sensors(hass: HomeAssistant) -> None:
+    """Test metric sensors.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.async_start_discovery", return_value=None
+    ), patch(
+        "custom_components.miwifi.device_tracker.socket.socket"
+    ) as mock_socket, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        await async_mock_luci_client(mock_luci_client)
+
+        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
+
+        setup_data: list = await async_setup(hass)
+
+        config_entry: MockConfigEntry = setup_data[1]
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        updater: LuciUpdater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
+        registry = er.async_get(hass)
+
+        unique_id: str = _generate_id(ATTR_SENSOR_TRACKED_DEVICES_NAME, updater)
+
+        entry: er.RegistryEntry | None = registry.async_get(unique_id)
+        assert hass.states.get(unique_id) is None
+        assert entry is not None
+        assert entry.disabled_by == er.RegistryEntryDisabler.INTEGRATION
+        assert entry.entity_category == EntityCategory.DIAGNOSTIC
+
+        registry.async_update_entity(entity_id=unique_id, disabled_by=None)
+        await hass.async_block_till_done()
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+        )
+        await hass.async_block_till_done()
+
+        updater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
+
+        state: State = hass.states.get(unique_id)
+        assert state.state == str(len(updater.devices))
+        assert state.attributes["unit_of_measurement"] == "pcs"
+
+        assert updater.metrics.value(ATTR_SENSOR_POLL_DURATION) >= 0
+        assert updater.metrics.value(ATTR_SENSOR_FAILURES) == 0
+
+
 def _generate_id(code: str, updater: LuciUpdater) -> str:
     """Generate unique id
 
@@ -6,15 +6,19 @@ from __future__ import annotations
 
 import json
 import logging
+import sys
+import tracemalloc
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
 import voluptuous as vol
 from homeassistant.components.automation import DOMAIN as AUTOMATION_DOMAIN
-from homeassistant.const import CONF_DEVICE_ID
+from homeassistant.const import CONF_DEVICE_ID, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.setup import async_setup_component
+from homeassistant.util import utcnow
 from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
     async_mock_service,
@@ -25,16 +29,31 @@ from pytest_httpx import HTTPXMock
 from custom_components.miwifi.const import (
     ATTR_DEVICE_MAC_ADDRESS,
     CONF_BODY,
+    CONF_CYCLES,
+    CONF_FIELDS,
+    CONF_MAX_AGE,
+    CONF_POLLS,
     CONF_REQUEST,
+    CONF_REQUESTS,
     CONF_RESPONSE,
+    CONF_RESPONSES,
+    CONF_SAMPLES,
     CONF_URI,
+    DEFAULT_MODEL_REQUEST_SLOTS,
     DOMAIN,
+    EVENT_LUCI,
+    EVENT_TYPE_BATCH_RESPONSE,
     EVENT_TYPE_RESPONSE,
     NAME,
     SERVICE_CALC_PASSWD,
+    SERVICE_MEMORY_REPORT,
+    SERVICE_PROFILE,
+    SERVICE_PROFILE_ROUTER,
     SERVICE_REQUEST,
+    SERVICE_REQUEST_BATCH,
     UPDATER,
 )
+from custom_components.miwifi.exceptions import LuciRequestError
 from custom_components.miwifi.updater import LuciUpdater
 from tests.setup import MOCK_IP_ADDRESS, async_mock_luci_client, async_setup, get_url
 
@@ -416,3 +435,482 @@ async def test_request(
         assert event_data[CONF_REQUEST] == {"on": 1}
         assert event_data[CONF_RESPONSE] == {"code": 0, "status": 1}
         assert event_data[CONF_URI] == "misystem/led"
+
+
+@pytest.mark.asyncio
+async def test_profile_router(hass: HomeAssistant) -> None:
+    """Test profile router.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.updater.async_dispatcher_send"
+    ), patch(
+        "custom_components.miwifi.async_start_discovery", return_value=None
+    ), patch(
+        "custom_components.miwifi.device_tracker.socket.socket"
+    ) as mock_socket, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ), patch(
+        "custom_components.miwifi.services.get_profile_store"
+    ) as mock_store:
+        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
+        mock_store.return_value.async_save = AsyncMock(return_value=None)
+
+        await async_mock_luci_client(mock_luci_client)
+
+        latencies: list = [0.04, 0.01, 0.03, 0.02]
+
+        async def mock_profile(
+            path: str, query: dict | None = None, use_stok: bool = True
+        ) -> dict:
+            """Mock profile"""
+
+            if path == "misystem/led":
+                return {"latency": 0.1, "decode": 0.0, "size": 0, "error": "1523"}
+
+            return {
+                "latency": latencies.pop() if path == "misystem/status" else 0.01,
+                "decode": 0.001,
+                "size": 100,
+                "error": None,
+            }
+
+        mock_luci_client.return_value.profile = AsyncMock(side_effect=mock_profile)
+
+        setup_data: list = await async_setup(hass)
+
+        config_entry: MockConfigEntry = setup_data[1]
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        updater: LuciUpdater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
+        device: dr.DeviceEntry | None = dr.async_get(hass).async_get_device(
+            set(),
+            {
+                (
+                    dr.CONNECTION_NETWORK_MAC,
+                    updater.data.get(ATTR_DEVICE_MAC_ADDRESS, updater.ip),
+                )
+            },
+        )
+
+        assert device is not None
+
+        assert await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE_ROUTER,
+            {CONF_SAMPLES: 4},
+            target={CONF_DEVICE_ID: [device.id]},
+            blocking=True,
+            limit=None,
+        )
+
+    report: dict = mock_store.return_value.async_save.mock_calls[0].args[0]
+
+    assert report["samples"] == 4
+    assert report["concurrency"] == DEFAULT_MODEL_REQUEST_SLOTS
+    assert report["endpoints"]["misystem/status"]["latency"] == {
+        "min": 10.0,
+        "p50": 20.0,
+        "p90": 40.0,
+        "p99": 40.0,
+        "max": 40.0,
+    }
+    assert report["endpoints"]["misystem/status"]["size"] == 100
+    assert report["endpoints"]["misystem/status"]["errors"] == {}
+    assert report["endpoints"]["misystem/led"]["errors"] == {"1523": 4}
+
+
+@pytest.mark.asyncio
+async def test_request_batch(hass: HomeAssistant) -> None:
+    """Test batch request.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.updater.async_dispatcher_send"
+    ), patch(
+        "custom_components.miwifi.async_start_discovery", return_value=None
+    ), patch(
+        "custom_components.miwifi.device_tracker.socket.socket"
+    ) as mock_socket, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
+
+        await async_mock_luci_client(mock_luci_client)
+
+        async def mock_get(uri: str, body: dict | None = None) -> dict:
+            """Mock get"""
+
+            if uri == "misystem/devicelist":
+                return json.loads(load_fixture("device_list_data.json"))
+
+            if uri == "misystem/led":
+                return json.loads(load_fixture("led_data.json"))
+
+            raise LuciRequestError("Invalid error code received: 401")
+
+        mock_luci_client.return_value.get = AsyncMock(side_effect=mock_get)
+
+        setup_data: list = await async_setup(hass)
+
+        config_entry: MockConfigEntry = setup_data[1]
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        updater: LuciUpdater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
+        device: dr.DeviceEntry | None = dr.async_get(hass).async_get_device(
+            set(),
+            {
+                (
+                    dr.CONNECTION_NETWORK_MAC,
+                    updater.data.get(ATTR_DEVICE_MAC_ADDRESS, updater.ip),
+                )
+            },
+        )
+
+        assert device is not None
+
+        events: list = []
+        hass.bus.async_listen(EVENT_LUCI, events.append)
+
+        assert await hass.services.async_call(
+            DOMAIN,
+            SERVICE_REQUEST_BATCH,
+            {
+                CONF_REQUESTS: [
+                    {CONF_URI: "misystem/devicelist", CONF_FIELDS: ["list.*.mac"]},
+                    {CONF_URI: "misystem/led", CONF_BODY: {"on": 1}},
+                    {CONF_URI: "misystem/unknown"},
+                ],
+                CONF_FIELDS: ["code", "status"],
+            },
+            target={CONF_DEVICE_ID: [device.id]},
+            blocking=True,
+            limit=None,
+        )
+        await hass.async_block_till_done()
+
+    assert len(mock_luci_client.return_value.get.mock_calls) == 3
+    assert len(events) == 1
+    assert events[0].data[CONF_DEVICE_ID] == device.id
+    assert events[0].data[CONF_TYPE] == EVENT_TYPE_BATCH_RESPONSE
+
+    responses: list = events[0].data[CONF_RESPONSES]
+
+    assert responses[0] == {
+        CONF_URI: "misystem/devicelist",
+        CONF_REQUEST: {},
+        CONF_RESPONSE: {
+            "list.*.mac": [
+                device["mac"]
+                for device in json.loads(load_fixture("device_list_data.json"))["list"]
+            ]
+        },
+    }
+    assert responses[1] == {
+        CONF_URI: "misystem/led",
+        CONF_REQUEST: {"on": 1},
+        CONF_RESPONSE: {"code": 0, "status": 1},
+    }
+    assert responses[2] == {
+        CONF_URI: "misystem/unknown",
+        CONF_REQUEST: {},
+        "error": "Invalid error code received: 401",
+    }
+
+
+@pytest.mark.asyncio
+async def test_request_max_age(hass: HomeAssistant) -> None:
+    """Test request served from poll responses.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.updater.async_dispatcher_send"
+    ), patch(
+        "custom_components.miwifi.async_start_discovery", return_value=None
+    ), patch(
+        "custom_components.miwifi.device_tracker.socket.socket"
+    ) as mock_socket, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
+
+        await async_mock_luci_client(mock_luci_client)
+
+        mock_luci_client.return_value.get = AsyncMock(
+            return_value={"code": 0, "live": True}
+        )
+
+        setup_data: list = await async_setup(hass)
+
+        config_entry: MockConfigEntry = setup_data[1]
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        updater: LuciUpdater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
+        device: dr.DeviceEntry | None = dr.async_get(hass).async_get_device(
+            set(),
+            {
+                (
+                    dr.CONNECTION_NETWORK_MAC,
+                    updater.data.get(ATTR_DEVICE_MAC_ADDRESS, updater.ip),
+                )
+            },
+        )
+
+        assert device is not None
+
+        events: list = []
+        hass.bus.async_listen(EVENT_LUCI, events.append)
+
+        async def call(uri: str, body: dict | None = None, **data) -> dict:
+            """Call request service"""
+
+            assert await hass.services.async_call(
+                DOMAIN,
+                SERVICE_REQUEST,
+                {CONF_URI: uri, CONF_BODY: body or {}} | data,
+                target={CONF_DEVICE_ID: [device.id]},
+                blocking=True,
+                limit=None,
+            )
+            await hass.async_block_till_done()
+
+            return events[-1].data[CONF_RESPONSE]
+
+        assert await call("misystem/status", **{CONF_MAX_AGE: 60}) == json.loads(
+            load_fixture("status_data.json")
+        )
+        assert await call(
+            "xqnetwork/avaliable_channels", {"wifiIndex": 2}, **{CONF_MAX_AGE: 60}
+        ) == json.loads(load_fixture("avaliable_channels_5g_data.json"))
+        # Kept responses are raw and consumers get their own copy
+        response: dict = await call("misystem/devicelist", **{CONF_MAX_AGE: 60})
+        assert response == json.loads(load_fixture("device_list_data.json"))
+        assert await call(
+            "xqnetwork/wifi_detail_all", **{CONF_MAX_AGE: 60}
+        ) == json.loads(load_fixture("wifi_detail_all_data.json"))
+
+        response["list"].clear()
+        assert await call("misystem/devicelist", **{CONF_MAX_AGE: 60}) == json.loads(
+            load_fixture("device_list_data.json")
+        )
+        assert len(mock_luci_client.return_value.get.mock_calls) == 0
+
+        assert await call("misystem/status") == {"code": 0, "live": True}
+        assert await call("misystem/unknown", **{CONF_MAX_AGE: 60}) == {
+            "code": 0,
+            "live": True,
+        }
+
+        with patch(
+            "custom_components.miwifi.updater.utcnow",
+            return_value=utcnow() + timedelta(seconds=120),
+        ):
+            assert await call("misystem/status", **{CONF_MAX_AGE: 60}) == {
+                "code": 0,
+                "live": True,
+            }
+
+        assert len(mock_luci_client.return_value.get.mock_calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_profile(hass: HomeAssistant, tmp_path) -> None:
+    """Test CPU profile of update cycles.
+
+    :param hass: HomeAssistant
+    :param tmp_path: Path
+    """
+
+    hass.config.config_dir = str(tmp_path)
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.updater.async_dispatcher_send"
+    ), patch(
+        "custom_components.miwifi.async_start_discovery", return_value=None
+    ), patch(
+        "custom_components.miwifi.device_tracker.socket.socket"
+    ) as mock_socket, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ), patch(
+        "custom_components.miwifi.cpu_profile.pn.async_create"
+    ) as mock_notification:
+        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
+
+        await async_mock_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        config_entry: MockConfigEntry = setup_data[1]
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        updater: LuciUpdater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
+        device: dr.DeviceEntry | None = dr.async_get(hass).async_get_device(
+            set(),
+            {
+                (
+                    dr.CONNECTION_NETWORK_MAC,
+                    updater.data.get(ATTR_DEVICE_MAC_ADDRESS, updater.ip),
+                )
+            },
+        )
+
+        assert device is not None
+        assert updater.cpu_profile is None
+
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE,
+            {CONF_CYCLES: 2},
+            target={CONF_DEVICE_ID: [device.id]},
+            blocking=True,
+            limit=None,
+        )
+
+        assert updater.cpu_profile is not None
+
+        with pytest.raises(vol.Invalid):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_PROFILE,
+                {},
+                target={CONF_DEVICE_ID: [device.id]},
+                blocking=True,
+                limit=None,
+            )
+
+        await updater.async_refresh()
+
+        assert updater.cpu_profile is not None
+        assert sys.getprofile() is None
+
+        # Poll without entity updates does not leave the profiler enabled
+        await updater.update()
+
+        assert updater.cpu_profile is not None
+        assert sys.getprofile() is None
+
+        await updater.async_refresh()
+        await hass.async_block_till_done()
+
+        assert updater.cpu_profile is None
+        assert len(mock_notification.mock_calls) == 1
+
+    reports: list = list(tmp_path.glob(f"{DOMAIN}_profile_{MOCK_IP_ADDRESS}_*.txt"))
+
+    assert len(reports) == 1
+
+    report: str = reports[0].read_text(encoding="utf-8")
+
+    assert "2 update cycles" in report
+    assert "updater.py" in report
+    assert "device_tracker.py" in report
+    assert "Report: " in mock_notification.mock_calls[0].args[1]
+    assert "loop-wide" in mock_notification.mock_calls[0].args[1]
+    assert "loop-wide" in report
+
+
+@pytest.mark.asyncio
+async def test_memory_report(hass: HomeAssistant) -> None:
+    """Test memory report and snapshot diff.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.updater.async_dispatcher_send"
+    ), patch(
+        "custom_components.miwifi.async_start_discovery", return_value=None
+    ), patch(
+        "custom_components.miwifi.device_tracker.socket.socket"
+    ) as mock_socket, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ), patch(
+        "custom_components.miwifi.services.pn.async_create"
+    ) as mock_notification:
+        mock_socket.return_value.recv.return_value = AsyncMock(return_value=None)
+
+        await async_mock_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        config_entry: MockConfigEntry = setup_data[1]
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        updater: LuciUpdater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
+        device: dr.DeviceEntry | None = dr.async_get(hass).async_get_device(
+            set(),
+            {
+                (
+                    dr.CONNECTION_NETWORK_MAC,
+                    updater.data.get(ATTR_DEVICE_MAC_ADDRESS, updater.ip),
+                )
+            },
+        )
+
+        assert device is not None
+
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_MEMORY_REPORT,
+            {CONF_POLLS: 1},
+            target={CONF_DEVICE_ID: [device.id]},
+            blocking=True,
+            limit=None,
+        )
+
+        report: str = mock_notification.mock_calls[0].args[1]
+
+        assert "- devices: " in report
+        assert "- trackers: " in report
+        assert f"({len(updater.devices)} items)" in report
+        assert "- manufacturers: " in report
+        assert updater.memory_snapshot is not None
+        assert tracemalloc.is_tracing()
+
+        await updater.async_refresh()
+        await hass.async_block_till_done()
+
+        assert updater.memory_snapshot is None
+        assert not tracemalloc.is_tracing()
+        assert len(mock_notification.mock_calls) == 2
+        assert "over 1 polls" in mock_notification.mock_calls[1].args[1]
+
+        # Router without registered integration, e.g. during setup
+        with patch(
+            "custom_components.miwifi.services.async_get_integrations",
+            return_value={},
+        ), pytest.raises(vol.Invalid):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_MEMORY_REPORT,
+                {},
+                target={CONF_DEVICE_ID: [device.id]},
+                blocking=True,
+                limit=None,
+            )
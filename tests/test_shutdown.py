@@ -0,0 +1,103 @@
+"""Tests for the miwifi component."""
+
+# pylint: disable=no-member,too-many-statements,protected-access,too-many-lines
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from homeassistant.const import CONF_IP_ADDRESS, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+
+from custom_components.miwifi.const import DOMAIN, UPDATER
+from custom_components.miwifi.shutdown import ShutdownCoordinator, async_get_shutdown
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations"""
+
+    yield
+
+
+def _mock_updater(hass: HomeAssistant, _ip: str, is_reachable: bool = True) -> Mock:
+    """Mock updater.
+
+    :param hass: HomeAssistant
+    :param _ip: str
+    :param is_reachable: bool
+    :return Mock
+    """
+
+    updater: Mock = Mock()
+    updater.ip = _ip
+    updater.is_reachable = is_reachable
+    updater.async_stop = AsyncMock(return_value=None)
+    updater.luci.logout = AsyncMock(return_value=None)
+
+    hass.data.setdefault(DOMAIN, {})[f"entry_{_ip}"] = {
+        CONF_IP_ADDRESS: _ip,
+        UPDATER: updater,
+    }
+
+    return updater
+
+
+@pytest.mark.asyncio
+async def test_shutdown(hass: HomeAssistant) -> None:
+    """Test shutdown skips unreachable routers.
+
+    :param hass: HomeAssistant
+    """
+
+    main = _mock_updater(hass, "192.168.31.1")
+    leaf = _mock_updater(hass, "192.168.31.62", False)
+
+    shutdown: ShutdownCoordinator = async_get_shutdown(hass)
+
+    assert async_get_shutdown(hass) is shutdown
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    main.async_stop.assert_called_once_with(logout=False)
+    leaf.async_stop.assert_called_once_with(logout=False)
+    assert len(main.luci.logout.mock_calls) == 1
+    assert len(leaf.luci.logout.mock_calls) == 0
+
+
+@pytest.mark.asyncio
+async def test_shutdown_deadline(hass: HomeAssistant) -> None:
+    """Test shutdown is bounded by deadline.
+
+    :param hass: HomeAssistant
+    """
+
+    async def hang() -> None:
+        """Logout of router that does not answer"""
+
+        await asyncio.sleep(3600)
+
+    main = _mock_updater(hass, "192.168.31.1")
+    main.luci.logout = AsyncMock(side_effect=hang)
+    leaf = _mock_updater(hass, "192.168.31.62", False)
+    other = _mock_updater(hass, "192.168.31.63")
+    other.luci.logout = AsyncMock(side_effect=ValueError)
+
+    report: dict = await async_get_shutdown(hass).async_shutdown(0.01)
+
+    assert report == {
+        "skipped": ["192.168.31.62"],
+        "timed_out": ["192.168.31.1 logout"],
+    }
+    assert len(main.async_stop.mock_calls) == 1
+    assert len(leaf.async_stop.mock_calls) == 1
+    assert len(other.luci.logout.mock_calls) == 1
+
+    # Home Assistant stop of the test would wait for the hanging router again
+    hass.data[DOMAIN].pop("entry_192.168.31.1")
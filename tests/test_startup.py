@@ -0,0 +1,175 @@
+"""Tests for the miwifi component."""
+
+# pylint: disable=no-member,too-many-statements,protected-access,too-many-lines
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from homeassistant.const import CONF_IP_ADDRESS, Platform
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry, load_fixture
+
+from custom_components.miwifi.const import (
+    ATTR_SWITCH_WIFI_2_4,
+    ATTR_UPDATE_FIRMWARE,
+    DOMAIN,
+    FORWARDED_PLATFORMS,
+)
+from custom_components.miwifi.startup import StartupOrchestrator, async_get_startup
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations"""
+
+    yield
+
+
+def _mock_updater(_ip: str, order: list) -> Mock:
+    """Mock updater.
+
+    :param _ip: str
+    :param order: list
+    :return Mock
+    """
+
+    async def first_refresh() -> None:
+        """Mock first refresh"""
+
+        await asyncio.sleep(0)
+
+        order.append(_ip)
+
+    updater: Mock = Mock()
+    updater.ip = _ip
+    updater.last_update_success = True
+    updater.data = {ATTR_SWITCH_WIFI_2_4: True}
+    updater.supports_guest = False
+    updater.supports_update = False
+    updater.supports_wan = True
+    updater.luci.topo_graph = AsyncMock(
+        return_value=json.loads(load_fixture("topo_graph_data.json"))
+    )
+    updater.async_config_entry_first_refresh = AsyncMock(side_effect=first_refresh)
+
+    return updater
+
+
+@pytest.mark.asyncio
+async def test_startup_leafs_first(hass: HomeAssistant) -> None:
+    """Test main router waits for its leafs.
+
+    :param hass: HomeAssistant
+    """
+
+    main_entry = MockConfigEntry(domain=DOMAIN, data={CONF_IP_ADDRESS: "192.168.31.1"})
+    main_entry.add_to_hass(hass)
+    leaf_entry = MockConfigEntry(domain=DOMAIN, data={CONF_IP_ADDRESS: "192.168.31.62"})
+    leaf_entry.add_to_hass(hass)
+
+    order: list = []
+
+    main = _mock_updater("192.168.31.1", order)
+    leaf = _mock_updater("192.168.31.62", order)
+
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN][main_entry.entry_id] = {}
+    hass.data[DOMAIN][leaf_entry.entry_id] = {}
+
+    startup: StartupOrchestrator = async_get_startup(hass)
+
+    assert async_get_startup(hass) is startup
+
+    with patch.object(
+        hass.config_entries, "async_forward_entry_setups", AsyncMock()
+    ) as mock_forward:
+        await asyncio.gather(
+            startup.async_start(main_entry, main),
+            startup.async_start(leaf_entry, leaf),
+        )
+
+    assert order == ["192.168.31.62", "192.168.31.1"]
+    assert len(mock_forward.mock_calls) == 2
+    assert len(main.luci.topo_graph.mock_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_startup_single(hass: HomeAssistant) -> None:
+    """Test single router skips topology.
+
+    :param hass: HomeAssistant
+    """
+
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_IP_ADDRESS: "192.168.31.1"})
+    entry.add_to_hass(hass)
+
+    order: list = []
+
+    updater = _mock_updater("192.168.31.1", order)
+
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN][entry.entry_id] = {}
+
+    with patch.object(
+        hass.config_entries, "async_forward_entry_setups", AsyncMock()
+    ) as mock_forward:
+        await async_get_startup(hass).async_start(entry, updater)
+
+    assert order == ["192.168.31.1"]
+    assert len(mock_forward.mock_calls) == 1
+    assert len(updater.luci.topo_graph.mock_calls) == 0
+
+
+@pytest.mark.asyncio
+async def test_startup_capabilities(hass: HomeAssistant) -> None:
+    """Test only relevant platforms are forwarded.
+
+    :param hass: HomeAssistant
+    """
+
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_IP_ADDRESS: "192.168.31.1"})
+    entry.add_to_hass(hass)
+
+    updater = _mock_updater("192.168.31.1", [])
+    updater.data = {}
+
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN][entry.entry_id] = {}
+
+    with patch.object(
+        hass.config_entries, "async_forward_entry_setups", AsyncMock()
+    ) as mock_forward, patch.object(
+        hass.config_entries, "async_reload", AsyncMock()
+    ) as mock_reload:
+        await async_get_startup(hass).async_start(entry, updater)
+
+        platforms: list = mock_forward.mock_calls[0].args[1]
+
+        assert platforms == hass.data[DOMAIN][entry.entry_id][FORWARDED_PLATFORMS]
+        assert Platform.SENSOR in platforms
+        assert Platform.SWITCH not in platforms
+        assert Platform.SELECT not in platforms
+        assert Platform.UPDATE not in platforms
+
+        listener = updater.async_add_listener.mock_calls[0].args[0]
+
+        updater.supports_wan = False
+        listener()
+        await hass.async_block_till_done()
+
+        assert len(mock_reload.mock_calls) == 0
+
+        updater.supports_update = True
+        updater.data = {ATTR_UPDATE_FIRMWARE: {"version": "1"}}
+        listener()
+        listener()
+        await hass.async_block_till_done()
+
+        assert len(mock_reload.mock_calls) == 1
@@ -13,7 +13,13 @@ import pytest
 from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
 from homeassistant.components.switch import ENTITY_ID_FORMAT as SWITCH_ENTITY_ID_FORMAT
 from homeassistant.components.switch import SERVICE_TURN_OFF, SERVICE_TURN_ON
-from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF, STATE_ON, STATE_UNAVAILABLE
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    Platform,
+)
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import EntityCategory
@@ -37,9 +43,14 @@ from custom_components.miwifi.const import (
     ATTRIBUTION,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    FORWARDED_PLATFORMS,
     UPDATER,
 )
-from custom_components.miwifi.exceptions import LuciConnectionError, LuciRequestError
+from custom_components.miwifi.exceptions import (
+    LuciConnectionError,
+    LuciRequestError,
+    LuciTokenError,
+)
 from custom_components.miwifi.helper import generate_entity_id
 from custom_components.miwifi.updater import LuciUpdater
 from tests.setup import MultipleSideEffect, async_mock_luci_client, async_setup
@@ -259,17 +270,19 @@ async def test_init_with_error(hass: HomeAssistant) -> None:
 
         assert updater.last_update_success
 
+        # Without adapters the platform is not forwarded
+        assert (
+            Platform.SWITCH
+            not in hass.data[DOMAIN][config_entry.entry_id][FORWARDED_PLATFORMS]
+        )
+
         unique_id: str = _generate_id(ATTR_SWITCH_WIFI_2_4_NAME, updater)
-        states: State | None = hass.states.get(unique_id)
-        assert states is not None
-        assert states.state == STATE_UNAVAILABLE
-        assert registry.async_get(unique_id) is not None
+        assert hass.states.get(unique_id) is None
+        assert registry.async_get(unique_id) is None
 
         unique_id = _generate_id(ATTR_SWITCH_WIFI_5_0_NAME, updater)
-        states = hass.states.get(unique_id)
-        assert states is not None
-        assert states.state == STATE_UNAVAILABLE
-        assert registry.async_get(unique_id) is not None
+        assert hass.states.get(unique_id) is None
+        assert registry.async_get(unique_id) is None
 
 
 @pytest.mark.asyncio
@@ -397,7 +410,7 @@ async def test_update_2_4(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, error, error)
@@ -465,7 +478,7 @@ async def test_update_2_4_wifi_data(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, error)
@@ -613,8 +626,8 @@ async def test_update_2_4_turn(hass: HomeAssistant) -> None:
         )
 
         state = hass.states.get(unique_id)
-        assert state.state == STATE_OFF
-        assert state.attributes["icon"] == "mdi:wifi-off"
+        assert state.state == STATE_ON
+        assert state.attributes["icon"] == "mdi:wifi"
         assert len(mock_luci_client.mock_calls) == _prev_calls + 3
 
         assert await hass.services.async_call(
@@ -655,7 +668,7 @@ async def test_update_5_0(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, error, error)
@@ -723,7 +736,7 @@ async def test_update_5_0_wifi_data(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, error)
@@ -871,8 +884,8 @@ async def test_update_5_0_turn(hass: HomeAssistant) -> None:
         )
 
         state = hass.states.get(unique_id)
-        assert state.state == STATE_OFF
-        assert state.attributes["icon"] == "mdi:wifi-off"
+        assert state.state == STATE_ON
+        assert state.attributes["icon"] == "mdi:wifi"
         assert len(mock_luci_client.mock_calls) == _prev_calls + 3
 
         assert await hass.services.async_call(
@@ -922,7 +935,7 @@ async def test_update_5_0_game(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, error, error)
@@ -996,7 +1009,7 @@ async def test_update_5_0_game_wifi_data(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, error)
@@ -1155,8 +1168,8 @@ async def test_update_5_0_game_turn(hass: HomeAssistant) -> None:
         )
 
         state = hass.states.get(unique_id)
-        assert state.state == STATE_OFF
-        assert state.attributes["icon"] == "mdi:wifi-off"
+        assert state.state == STATE_ON
+        assert state.attributes["icon"] == "mdi:wifi"
         assert len(mock_luci_client.mock_calls) == _prev_calls + 3
 
         assert await hass.services.async_call(
@@ -1197,7 +1210,7 @@ async def test_update_guest(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("device_list_data.json"))
 
         def error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.device_list = AsyncMock(
             side_effect=MultipleSideEffect(success, success, success, error, error)
@@ -1231,11 +1244,6 @@ async def test_update_guest(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
         state = hass.states.get(unique_id)
 
@@ -1339,11 +1347,6 @@ async def test_update_guest_wifi_data(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-        async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
-        )
-        await hass.async_block_till_done()
-
         entry = registry.async_get(unique_id)
 
         assert entry.disabled_by is None
@@ -1471,8 +1474,8 @@ async def test_update_guest_turn(hass: HomeAssistant) -> None:
         )
 
         state = hass.states.get(unique_id)
-        assert state.state == STATE_ON
-        assert state.attributes["icon"] == "mdi:wifi-lock-open"
+        assert state.state == STATE_OFF
+        assert state.attributes["icon"] == "mdi:wifi-off"
         assert len(mock_luci_client.mock_calls) == _prev_calls + 3
 
         assert await hass.services.async_call(
@@ -70,7 +70,7 @@ async def test_init(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.update.asyncio.sleep", return_value=None
+        "custom_components.miwifi.lifecycle.asyncio.sleep", return_value=None
     ), patch(
         "custom_components.miwifi.device_tracker.socket.socket"
     ) as mock_socket:
@@ -109,7 +109,7 @@ async def test_init_unsupported(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.update.asyncio.sleep", return_value=None
+        "custom_components.miwifi.lifecycle.asyncio.sleep", return_value=None
     ), patch(
         "custom_components.miwifi.device_tracker.socket.socket"
     ) as mock_socket:
@@ -152,7 +152,7 @@ async def test_update(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.update.asyncio.sleep", return_value=None
+        "custom_components.miwifi.lifecycle.asyncio.sleep", return_value=None
     ), patch(
         "custom_components.miwifi.device_tracker.socket.socket"
     ) as mock_socket:
@@ -208,7 +208,7 @@ async def test_need_update(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.update.asyncio.sleep", return_value=None
+        "custom_components.miwifi.lifecycle.asyncio.sleep", return_value=None
     ), patch(
         "custom_components.miwifi.device_tracker.socket.socket"
     ) as mock_socket:
@@ -283,7 +283,7 @@ async def test_release_notes(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.update.asyncio.sleep", return_value=None
+        "custom_components.miwifi.lifecycle.asyncio.sleep", return_value=None
     ), patch(
         "custom_components.miwifi.device_tracker.socket.socket"
     ) as mock_socket:
@@ -325,7 +325,7 @@ async def test_install(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.update.asyncio.sleep", return_value=None
+        "custom_components.miwifi.lifecycle.asyncio.sleep", return_value=None
     ), patch(
         "custom_components.miwifi.device_tracker.socket.socket"
     ) as mock_socket:
@@ -340,7 +340,7 @@ async def test_install(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("rom_update_need_data.json"))
 
         mock_luci_client.return_value.rom_update = AsyncMock(
-            side_effect=MultipleSideEffect(_off, _off, _on)
+            side_effect=MultipleSideEffect(_off, _off, _on, _off)
         )
 
         mock_luci_client.return_value.rom_upgrade = AsyncMock(return_value={"code": 0})
@@ -377,7 +377,7 @@ async def test_install(hass: HomeAssistant) -> None:
         updater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
 
         assert updater.last_update_success
-        updater.data[ATTR_STATE] = False
+        updater.async_set_overlay(ATTR_STATE, False)
 
         state = hass.states.get(unique_id)
         assert state.state == STATE_ON
@@ -390,6 +390,11 @@ async def test_install(hass: HomeAssistant) -> None:
             limit=None,
         )
 
+        assert updater.last_update_success
+
+        state = hass.states.get(unique_id)
+        assert state.state == STATE_OFF
+
 
 @pytest.mark.asyncio
 async def test_install_flash_error(hass: HomeAssistant) -> None:
@@ -405,7 +410,7 @@ async def test_install_flash_error(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.update.asyncio.sleep", return_value=None
+        "custom_components.miwifi.lifecycle.asyncio.sleep", return_value=None
     ), patch(
         "custom_components.miwifi.device_tracker.socket.socket"
     ) as mock_socket:
@@ -420,7 +425,7 @@ async def test_install_flash_error(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("rom_update_need_data.json"))
 
         mock_luci_client.return_value.rom_update = AsyncMock(
-            side_effect=MultipleSideEffect(_off, _on)
+            side_effect=MultipleSideEffect(_off, _on, _off)
         )
 
         mock_luci_client.return_value.rom_upgrade = AsyncMock(return_value={"code": 0})
@@ -476,7 +481,7 @@ async def test_install_error(hass: HomeAssistant) -> None:
     ), patch(
         "custom_components.miwifi.async_start_discovery", return_value=None
     ), patch(
-        "custom_components.miwifi.update.asyncio.sleep", return_value=None
+        "custom_components.miwifi.lifecycle.asyncio.sleep", return_value=None
     ), patch(
         "custom_components.miwifi.device_tracker.socket.socket"
     ) as mock_socket:
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from typing import Final
@@ -29,12 +30,15 @@ from custom_components.miwifi.const import (
     ATTR_SELECT_WIFI_5_0_GAME_CHANNEL,
     ATTR_SELECT_WIFI_5_0_GAME_SIGNAL_STRENGTH,
     ATTR_SELECT_WIFI_5_0_SIGNAL_STRENGTH,
+    ATTR_SENSOR_DEVICES,
     ATTR_SENSOR_MODE,
     ATTR_STATE,
     ATTR_SWITCH_WIFI_2_4,
     ATTR_SWITCH_WIFI_5_0,
     ATTR_SWITCH_WIFI_5_0_GAME,
     ATTR_SWITCH_WIFI_GUEST,
+    ATTR_TRACKER_IP,
+    ATTR_TRACKER_LAST_ACTIVITY,
     ATTR_UPDATE_CURRENT_VERSION,
     ATTR_UPDATE_DOWNLOAD_URL,
     ATTR_UPDATE_FILE_HASH,
@@ -53,8 +57,14 @@ from custom_components.miwifi.const import (
     DOMAIN,
 )
 from custom_components.miwifi.enum import Mode
-from custom_components.miwifi.exceptions import LuciError, LuciRequestError
+from custom_components.miwifi.exceptions import (
+    LuciConnectionError,
+    LuciError,
+    LuciRequestError,
+    LuciTokenError,
+)
 from custom_components.miwifi.luci import LuciClient
+from custom_components.miwifi.snapshot import LuciSnapshot
 from custom_components.miwifi.updater import LuciUpdater, async_get_updater
 from tests.setup import MultipleSideEffect, async_mock_luci_client, async_setup
 
@@ -98,7 +108,7 @@ async def test_updater(hass: HomeAssistant) -> None:
     assert updater._scan_interval == DEFAULT_SCAN_INTERVAL
     assert updater._activity_days == 0
     assert not updater._is_only_login
-    assert isinstance(updater.data, dict)
+    assert isinstance(updater.data, LuciSnapshot)
     assert len(updater.data) == 0
     assert isinstance(updater.devices, dict)
     assert len(updater.devices) == 0
@@ -108,7 +118,7 @@ async def test_updater(hass: HomeAssistant) -> None:
     assert updater._is_first_update
     assert isinstance(updater._signals, dict)
     assert len(updater._signals) == 0
-    assert isinstance(updater._moved_devices, list)
+    assert isinstance(updater._moved_devices, set)
     assert len(updater._moved_devices) == 0
     assert str(updater._update_interval) == "0:00:30"
     assert not updater.is_repeater
@@ -170,7 +180,7 @@ async def test_updater_reauthorization(hass: HomeAssistant) -> None:
             return json.loads(load_fixture("status_data.json"))
 
         def login_error() -> None:
-            raise LuciRequestError
+            raise LuciTokenError
 
         mock_luci_client.return_value.status = AsyncMock(
             side_effect=MultipleSideEffect(login_success, login_error, login_error)
@@ -473,7 +483,7 @@ async def test_updater_skip_mode_mesh(hass: HomeAssistant) -> None:
         setup_data: list = await async_setup(hass)
 
         updater: LuciUpdater = setup_data[0]
-        updater.data[ATTR_SENSOR_MODE] = Mode.MESH
+        updater._data[ATTR_SENSOR_MODE] = Mode.MESH
 
         await updater.async_config_entry_first_refresh()
 
@@ -904,3 +914,265 @@ async def test_get_updater_by_ip_error(hass: HomeAssistant) -> None:
             async_get_updater(hass, "test")
 
         assert str(error.value) == "Integration with identifier: test not found."
+
+
+@pytest.mark.asyncio
+async def test_updater_snapshot(hass: HomeAssistant) -> None:
+    """Test updater snapshot.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        await async_mock_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+        snapshot: LuciSnapshot = updater.data
+
+        assert snapshot.version == 1
+        assert len(snapshot.devices) == len(updater.devices)
+
+        with pytest.raises(TypeError):
+            snapshot[ATTR_STATE] = False  # type: ignore
+
+        await updater.update()
+
+        assert updater.data is snapshot
+
+        updater.async_set_overlay(ATTR_SWITCH_WIFI_2_4, False)
+
+        assert updater.data.version == 2
+        assert not updater.data[ATTR_SWITCH_WIFI_2_4]
+        assert snapshot[ATTR_SWITCH_WIFI_2_4]
+
+        await updater.update()
+
+        assert updater.data.version == 3
+        assert updater.data[ATTR_SWITCH_WIFI_2_4]
+        assert updater.data.devices == snapshot.devices
+
+        # Last activity alone keeps published devices
+        snapshot = updater.data
+        devices: dict = {
+            mac: device | {ATTR_TRACKER_LAST_ACTIVITY: "2022-10-01T00:00:00"}
+            for mac, device in updater.devices.items()
+        }
+
+        assert snapshot.evolve(dict(snapshot), devices) is snapshot
+
+        devices[next(iter(devices))][ATTR_TRACKER_IP] = "192.168.31.250"
+
+        assert snapshot.evolve(dict(snapshot), devices) is not snapshot
+
+
+@pytest.mark.asyncio
+async def test_updater_unreachable(hass: HomeAssistant) -> None:
+    """Test updater retries unreachable router with liveness probe.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ) as mock_asyncio_sleep:
+        await async_mock_luci_client(mock_luci_client)
+
+        mock_luci_client.return_value.login = AsyncMock(side_effect=LuciConnectionError)
+        mock_luci_client.return_value.topo_graph = AsyncMock(
+            side_effect=LuciConnectionError
+        )
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+
+        with pytest.raises(LuciConnectionError):
+            await updater.async_config_entry_first_refresh()
+
+        await hass.async_block_till_done()
+
+    assert updater.code == codes.NOT_FOUND
+    assert len(mock_luci_client.return_value.topo_graph.mock_calls) == 10
+    assert len(mock_luci_client.return_value.login.mock_calls) == 1
+    assert len(mock_luci_client.return_value.status.mock_calls) == 0
+
+    delays: list = [
+        _call.args[0]
+        for _call in mock_asyncio_sleep.mock_calls
+        if _call.args and _call.args[0]
+    ]
+
+    # Call delay after first logout, then backoff between attempts
+    assert len(delays) == 11
+    assert all(0.5 <= delay <= 30 for delay in delays[1:])
+    assert delays[-1] >= 15
+
+
+@pytest.mark.asyncio
+async def test_updater_poll_budget(hass: HomeAssistant) -> None:
+    """Test poll budget cancels and defers slow method.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.updater.async_dispatcher_send"
+    ), patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        await async_mock_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+        assert updater.exhausted_methods == []
+
+        async def hang() -> dict:
+            """Router that does not answer"""
+
+            await asyncio.Event().wait()
+
+            return {}  # pragma: no cover
+
+        mock_luci_client.return_value.wan_info = AsyncMock(side_effect=hang)
+        mock_luci_client.return_value.led.reset_mock()
+
+        updater.poll_budget = 0.05  # type: ignore
+
+        await updater.async_refresh()
+
+        assert updater.last_update_success
+        assert updater.data[ATTR_STATE]
+        assert updater.exhausted_methods[0] == "wan"
+        assert "device_list" in updater.exhausted_methods
+        assert len(mock_luci_client.return_value.led.mock_calls) == 0
+
+        await updater.async_refresh()
+
+        assert updater.exhausted_methods == []
+        assert len(mock_luci_client.return_value.wan_info.mock_calls) == 1
+        assert len(mock_luci_client.return_value.led.mock_calls) == 1
+
+        await updater.async_refresh()
+
+        assert updater.exhausted_methods[0] == "wan"
+        assert len(mock_luci_client.return_value.wan_info.mock_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_updater_stale_endpoint(hass: HomeAssistant) -> None:
+    """Test failed endpoint keeps stale data without reauthorization.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.updater.async_dispatcher_send"
+    ), patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        await async_mock_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+        assert updater.data[ATTR_BINARY_SENSOR_WAN_STATE]
+        assert updater.endpoints["wan"].errors == 0
+
+        mock_luci_client.return_value.wan_info = AsyncMock(side_effect=LuciRequestError)
+
+        await updater.async_refresh()
+
+        mock_luci_client.return_value.wan_info = AsyncMock(
+            side_effect=LuciConnectionError
+        )
+
+        await updater.async_refresh()
+
+        assert updater.code == codes.OK
+        assert not updater._is_reauthorization
+        assert updater.data[ATTR_STATE]
+        assert updater.data[ATTR_BINARY_SENSOR_WAN_STATE]
+        assert updater.endpoints["wan"].errors == 2
+        assert updater.endpoints["wan"].age is not None
+        assert updater.endpoints["led"].errors == 0
+        assert len(mock_luci_client.return_value.login.mock_calls) == 1
+
+        mock_luci_client.return_value.topo_graph = AsyncMock(
+            side_effect=LuciConnectionError
+        )
+
+        await updater.async_refresh()
+
+        assert updater.code == codes.NOT_FOUND
+        assert not updater.data[ATTR_STATE]
+
+
+@pytest.mark.asyncio
+async def test_updater_stale_device_counters(hass: HomeAssistant) -> None:
+    """Test failed device requests keep device counters.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.updater.async_dispatcher_send"
+    ), patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        await async_mock_luci_client(mock_luci_client)
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+        devices: int = updater.data[ATTR_SENSOR_DEVICES]
+
+        assert devices > 0
+
+        mock_luci_client.return_value.device_list = AsyncMock(
+            side_effect=LuciRequestError
+        )
+
+        await updater.async_refresh()
+
+        assert updater.data[ATTR_STATE]
+        assert updater.data[ATTR_SENSOR_DEVICES] == devices
+
+        mock_luci_client.return_value.wifi_connect_devices = AsyncMock(
+            side_effect=LuciConnectionError
+        )
+
+        await updater.async_refresh()
+
+        assert updater.data[ATTR_STATE]
+        assert updater.data[ATTR_SENSOR_DEVICES] == devices
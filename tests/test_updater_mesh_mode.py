@@ -1411,6 +1411,92 @@ async def test_updater_mesh_mode_move_force_mode(hass: HomeAssistant) -> None:
     }
 
 
+@pytest.mark.asyncio
+async def test_updater_mesh_mode_fleet(hass: HomeAssistant) -> None:
+    """Test leaf fed by device list of main router.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client_first, patch(
+        "custom_components.miwifi.updater.async_dispatcher_send"
+    ), patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        await async_mock_luci_client(mock_luci_client_first)
+
+        mock_luci_client_first.return_value.device_list = AsyncMock(
+            return_value=json.loads(load_fixture("device_list_mesh_data.json"))
+        )
+        mock_luci_client_first.return_value.wifi_connect_devices = AsyncMock(
+            return_value=json.loads(
+                load_fixture("wifi_connect_devices_parent_data.json")
+            )
+        )
+        mock_luci_client_first.return_value.status = AsyncMock(
+            return_value=json.loads(load_fixture("status_parent_data.json"))
+        )
+        mock_luci_client_first.return_value.new_status = AsyncMock(
+            return_value=json.loads(load_fixture("new_status_parent_data.json"))
+        )
+
+        setup_data: list = await async_setup(hass, "192.168.31.100")
+
+        updater_first: LuciUpdater = setup_data[0]
+        updater_first.is_force_load = True
+
+        await updater_first.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+        assert not updater_first.is_fleet_leaf
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client_second, patch(
+        "custom_components.miwifi.updater.async_dispatcher_send"
+    ), patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        await async_mock_luci_client(mock_luci_client_second)
+
+        mock_luci_client_second.return_value.device_list = AsyncMock(
+            return_value=json.loads(load_fixture("device_list_parent_data.json"))
+        )
+
+        setup_data = await async_setup(hass)
+
+        updater_second: LuciUpdater = setup_data[0]
+
+        await updater_second.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+    assert updater_first.fleet_main is updater_second
+    assert updater_first.is_fleet_leaf
+
+    signals: dict = json.loads(load_fixture("wifi_connect_devices_parent_data.json"))
+    signals["list"][0]["signal"] = 50
+
+    mock_luci_client_first.return_value.wifi_connect_devices = AsyncMock(
+        return_value=signals
+    )
+    mock_luci_client_first.return_value.new_status.reset_mock()
+
+    for _ in range(3):
+        await updater_first.update()
+
+    assert len(mock_luci_client_first.return_value.wifi_connect_devices.mock_calls) == 1
+    assert len(mock_luci_client_first.return_value.new_status.mock_calls) == 1
+    assert updater_first.devices["00:00:00:00:00:01"][ATTR_TRACKER_SIGNAL] == 50
+    assert updater_first.data[ATTR_SENSOR_DEVICES] == 1
+    assert updater_first.data[ATTR_STATE]
+
+    await updater_first.async_stop()
+    await updater_second.async_stop()
+    await hass.async_block_till_done()
+
+
 @pytest.mark.asyncio
 async def test_updater_mesh_mode_restore(hass: HomeAssistant) -> None:
     """Test updater.
@@ -78,6 +78,7 @@ from custom_components.miwifi.const import (
     DOMAIN,
 )
 from custom_components.miwifi.enum import Connection, Mode, Model
+from custom_components.miwifi.exceptions import LuciRequestError
 from custom_components.miwifi.updater import LuciUpdater
 from tests.setup import MultipleSideEffect, async_mock_luci_client, async_setup
 
@@ -450,6 +451,54 @@ async def test_updater_repeater_mode_force_load(
     assert len(mock_luci_client.mock_calls) == 29
 
 
+@pytest.mark.asyncio
+async def test_updater_repeater_mode_force_load_stale_counters(
+    hass: HomeAssistant,
+) -> None:
+    """Test failed connected devices request keeps device counters.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch(
+        "custom_components.miwifi.updater.LuciClient"
+    ) as mock_luci_client, patch(
+        "custom_components.miwifi.updater.async_dispatcher_send"
+    ), patch(
+        "custom_components.miwifi.updater.asyncio.sleep", return_value=None
+    ):
+        await async_mock_luci_client(mock_luci_client)
+
+        mock_luci_client.return_value.mode = AsyncMock(
+            return_value=json.loads(load_fixture("mode_repeater_data.json"))
+        )
+
+        setup_data: list = await async_setup(hass)
+
+        updater: LuciUpdater = setup_data[0]
+        updater.is_force_load = True
+
+        await updater.async_config_entry_first_refresh()
+        await hass.async_block_till_done()
+
+        devices: int = updater.data[ATTR_SENSOR_DEVICES]
+
+        assert devices > 0
+
+        mock_luci_client.return_value.wifi_connect_devices = AsyncMock(
+            side_effect=LuciRequestError
+        )
+        mock_luci_client.return_value.new_status = AsyncMock(
+            side_effect=LuciRequestError
+        )
+
+        await updater.async_refresh()
+        await updater.async_stop()
+
+    assert updater.data[ATTR_STATE]
+    assert updater.data[ATTR_SENSOR_DEVICES] == devices
+
+
 @pytest.mark.asyncio
 async def test_updater_repeater_mode_move(hass: HomeAssistant) -> None:
     """Test updater.
@@ -0,0 +1,110 @@
+"""Tests for the miwifi component."""
+
+# pylint: disable=no-member,too-many-statements,protected-access,too-many-lines
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.miwifi.exceptions import LuciRequestError
+from custom_components.miwifi.write_queue import WifiWriteQueue
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations"""
+
+    yield
+
+
+@pytest.mark.asyncio
+async def test_coalesce(hass: HomeAssistant) -> None:
+    """Test coalesce.
+
+    :param hass: HomeAssistant
+    """
+
+    luci: Mock = Mock()
+    luci.set_wifi = AsyncMock(return_value={"code": 0})
+    luci.set_guest_wifi = AsyncMock(return_value={"code": 0})
+
+    queue: WifiWriteQueue = WifiWriteQueue(hass, luci, 0)
+
+    base: dict = {"wifiIndex": 1, "on": 1, "channel": "1", "txpwr": "min"}
+
+    results: list = await asyncio.gather(
+        queue.async_set_wifi(base, {"wifiIndex": 1, "channel": "6"}),
+        queue.async_set_wifi(base, {"wifiIndex": 1, "txpwr": "max"}),
+        queue.async_set_wifi({"wifiIndex": 2}, {"wifiIndex": 2, "on": 0}),
+        queue.async_set_guest_wifi({"wifiIndex": 3}, {"wifiIndex": 3, "on": 1}),
+    )
+
+    assert len(luci.set_wifi.mock_calls) == 2
+    assert len(luci.set_guest_wifi.mock_calls) == 1
+
+    assert results[0] is results[1]
+    assert results[0] == {"wifiIndex": 1, "on": 1, "channel": "6", "txpwr": "max"}
+    assert results[2] == {"wifiIndex": 2, "on": 0}
+    assert results[3] == {"wifiIndex": 3, "on": 1}
+
+    await queue.async_set_wifi(base, {"wifiIndex": 1, "on": 0})
+
+    assert len(luci.set_wifi.mock_calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesce_error(hass: HomeAssistant) -> None:
+    """Test coalesce error.
+
+    :param hass: HomeAssistant
+    """
+
+    luci: Mock = Mock()
+    luci.set_wifi = AsyncMock(side_effect=LuciRequestError)
+
+    queue: WifiWriteQueue = WifiWriteQueue(hass, luci, 0)
+
+    results: list = await asyncio.gather(
+        queue.async_set_wifi({}, {"wifiIndex": 1, "on": 0}),
+        queue.async_set_wifi({}, {"wifiIndex": 1, "channel": "6"}),
+        return_exceptions=True,
+    )
+
+    assert len(luci.set_wifi.mock_calls) == 1
+    assert all(isinstance(result, LuciRequestError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_stop(hass: HomeAssistant) -> None:
+    """Test stop cancels pending writes.
+
+    :param hass: HomeAssistant
+    """
+
+    luci: Mock = Mock()
+    luci.set_wifi = AsyncMock(return_value={"code": 0})
+
+    queue: WifiWriteQueue = WifiWriteQueue(hass, luci, 60)
+
+    write: asyncio.Task = hass.async_create_task(
+        queue.async_set_wifi({}, {"wifiIndex": 1, "on": 0})
+    )
+    await asyncio.sleep(0)
+
+    queue.async_stop()
+
+    with pytest.raises(asyncio.CancelledError):
+        await write
+
+    await hass.async_block_till_done()
+
+    assert len(luci.set_wifi.mock_calls) == 0
+    assert not queue._pending
+    assert not queue._tasks